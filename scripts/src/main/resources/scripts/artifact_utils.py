@@ -0,0 +1,233 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import hashlib
+import os
+
+from parallel_utils import run_in_parallel
+from shell_utils import split_sections
+
+# Directories behind the named 'litp import' destinations.
+IMPORT_REPO_DIRS = {"litp": "/var/www/html/litp",
+                    "3pp": "/var/www/html/3pp"}
+
+NEVRA_QUERY_FORMAT = "%{NAME}-%{EPOCHNUM}:%{VERSION}-%{RELEASE}.%{ARCH}\\n"
+NEVRA_MARKER = "==>NEVRA:"
+
+# (local path, size, mtime) -> md5 of local artifacts.
+_LOCAL_CHECKSUMS = {}
+# Node -> {remote path -> md5} of artifacts known to be on the node.
+_MANIFESTS = {}
+
+
+def clear_artifact_manifests(nodes=None):
+    """
+    Forget what is known about artifacts on nodes, e.g. after a node was
+    reinstalled.
+
+    Kwargs:
+        nodes (list): Nodes to forget, all nodes if None.
+    """
+    if nodes is None:
+        _MANIFESTS.clear()
+    for node in nodes or []:
+        _MANIFESTS.pop(node, None)
+
+
+def local_checksum(path):
+    """ Return the md5 of a local file, computed once per file version. """
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime)
+    if key not in _LOCAL_CHECKSUMS:
+        md5 = hashlib.md5()
+        with open(path, "rb") as artifact:
+            for block in iter(lambda: artifact.read(1024 * 1024), b""):
+                md5.update(block)
+        _LOCAL_CHECKSUMS[key] = md5.hexdigest()
+    return _LOCAL_CHECKSUMS[key]
+
+
+class ArtifactStager(object):
+    """
+    Stages local artifacts, e.g. test RPMs, on nodes. A copy is skipped
+    when the node already holds a file with the same checksum, and missing
+    files are transferred to all nodes concurrently.
+    """
+
+    def __init__(self, test):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+        """
+        self.test = test
+
+    @staticmethod
+    def get_checksums_cmd(remote_paths):
+        """ Return one command printing the md5 of every existing path. """
+        return "/usr/bin/md5sum {0} 2>/dev/null; true".format(
+            " ".join(remote_paths))
+
+    @staticmethod
+    def parse_checksums_output(stdout):
+        """
+        Parse the output of get_checksums_cmd.
+
+        Returns:
+            dict. Remote path -> md5.
+        """
+        checksums = {}
+        for line in stdout:
+            parts = line.split(None, 1)
+            if len(parts) == 2:
+                checksums[parts[1].strip().lstrip("*")] = parts[0]
+        return checksums
+
+    def _refresh_manifest(self, node, remote_paths):
+        """ Read the md5 of remote_paths on the node into its manifest. """
+        stdout, _, _ = self.test.run_command(
+            node, self.get_checksums_cmd(remote_paths))
+        manifest = _MANIFESTS.setdefault(node, {})
+        for path in remote_paths:
+            manifest.pop(path, None)
+        manifest.update(self.parse_checksums_output(stdout))
+        return manifest
+
+    def _stage_node(self, node, files, remote_dir):
+        """ Copy to one node the files whose checksum does not match. """
+        targets = dict((os.path.join(remote_dir, os.path.basename(path)),
+                        path) for path in files)
+        manifest = self._refresh_manifest(node, sorted(targets))
+        copied = []
+        for remote_path in sorted(targets):
+            local_path = targets[remote_path]
+            if manifest.get(remote_path) == local_checksum(local_path):
+                continue
+            if not self.test.copy_file_to(node, local_path, remote_dir):
+                return False, copied
+            manifest[remote_path] = local_checksum(local_path)
+            copied.append(remote_path)
+        return True, copied
+
+    def stage(self, files, nodes, remote_dir="/tmp"):
+        """
+        Make sure every node holds an up to date copy of every file.
+
+        Args:
+            files (list): Local paths of the artifacts.
+
+            nodes (list): Nodes to stage the artifacts on.
+
+        Kwargs:
+            remote_dir (str): Directory the artifacts are copied to.
+
+        Returns:
+            list. Remote paths of the staged files, in files order.
+        """
+        results = run_in_parallel(self._stage_node,
+                                  [(node, files, remote_dir)
+                                   for node in nodes])
+        for node, (success, copied) in zip(nodes, results):
+            self.test.assertTrue(success, "Failed to copy artifacts to {0}"
+                                 .format(node))
+            self.test.log("info", "Staged artifacts on {0}: {1} copied, {2} "
+                          "already present".format(node, len(copied),
+                                                   len(files) - len(copied)))
+        return [os.path.join(remote_dir, os.path.basename(path))
+                for path in files]
+
+    def _install_node(self, node, rpm_paths):
+        """ Install staged RPMs on one node. """
+        _, _, rc = self.test.run_command(
+            node, "/bin/rpm -Uvh --replacepkgs --oldpackage {0}".format(
+                " ".join(rpm_paths)), su_root=True)
+        # stderr is not checked, rpm warns there about unsigned packages.
+        return rc == 0
+
+    def install_rpms(self, nodes, rpm_paths):
+        """
+        Install staged RPMs on all nodes concurrently. Packages already
+        installed at another version are replaced by the staged version.
+
+        Args:
+            nodes (list): Nodes the RPMs were staged on.
+
+            rpm_paths (list): Remote paths returned by stage().
+        """
+        results = run_in_parallel(self._install_node,
+                                  [(node, rpm_paths) for node in nodes])
+        for node, success in zip(nodes, results):
+            self.test.assertTrue(success, "Failed to install {0} on {1}"
+                                 .format(rpm_paths, node))
+
+    @staticmethod
+    def get_nevra_cmd(rpm_paths, repo_dir):
+        """
+        Return one command printing, for each staged RPM, its NEVRA and the
+        NEVRA of the file of the same name in repo_dir, if any.
+        """
+        return "; ".join(
+            "echo \"{0}{1}\"; /bin/rpm -qp --qf '{2}' {1} {3} 2>/dev/null"
+            .format(NEVRA_MARKER, path, NEVRA_QUERY_FORMAT,
+                    os.path.join(repo_dir, os.path.basename(path)))
+            for path in rpm_paths) + "; true"
+
+    @staticmethod
+    def parse_nevra_output(stdout):
+        """
+        Parse the output of get_nevra_cmd.
+
+        Returns:
+            list. Staged RPM paths already in the repo with the same NEVRA.
+        """
+        present = []
+        for path, lines in split_sections(stdout, NEVRA_MARKER).items():
+            found = [line.strip() for line in lines if line.strip()]
+            if len(found) == 2 and found[0] == found[1]:
+                present.append(path)
+        return present
+
+    def import_rpms(self, ms_node, rpm_paths, destination,
+                    skip_present=True):
+        """
+        Import staged RPMs with 'litp import', skipping those the
+        destination repo already holds with the same NEVRA.
+
+        Args:
+            ms_node (str): The MS.
+
+            rpm_paths (list): Paths of the RPMs on the MS.
+
+            destination (str): Import destination, a repo name such as
+                               'litp' or a repo directory.
+
+        Kwargs:
+            skip_present (bool): Skip RPMs already in the repo. Set it to
+                                 False in tests of 'litp import' itself,
+                                 which must run the import every time.
+
+        Returns:
+            list. Paths of the RPMs imported.
+        """
+        present = []
+        if skip_present:
+            repo_dir = IMPORT_REPO_DIRS.get(destination, destination)
+            stdout, _, _ = self.test.run_command(
+                ms_node, self.get_nevra_cmd(rpm_paths, repo_dir))
+            present = self.parse_nevra_output(stdout)
+        imported = []
+        for path in rpm_paths:
+            if path in present:
+                self.test.log("info", "{0} already in {1}, skipping import"
+                              .format(path, destination))
+                continue
+            self.test.execute_cli_import_cmd(ms_node, path, destination)
+            imported.append(path)
+        return imported
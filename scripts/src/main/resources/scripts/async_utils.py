@@ -0,0 +1,231 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import sys
+import threading
+
+from parallel_utils import DEFAULT_MAX_WORKERS
+
+if sys.version_info[0] >= 3:
+    def reraise(exc_info):
+        """ Raise exc_info from sys.exc_info() with its traceback. """
+        raise exc_info[1].with_traceback(exc_info[2])
+else:
+    # The Python 2 syntax would not compile on Python 3.
+    exec("def reraise(exc_info):\n"  # pylint: disable=exec-used
+         "    \"\"\" Raise exc_info from sys.exc_info() with its "
+         "traceback. \"\"\"\n"
+         "    raise exc_info[0], exc_info[1], exc_info[2]\n")
+
+
+class RemoteFuture(object):
+    """
+    Result of a remote call issued without waiting for it.
+    """
+
+    def __init__(self, description):
+        """
+        Args:
+            description (str): What the call does, for error reports.
+        """
+        self.description = description
+        self._event = threading.Event()
+        self._result = None
+        self._exc_info = None
+
+    def set_result(self, result):
+        """ Complete the future with the return value of the call. """
+        self._result = result
+        self._event.set()
+
+    def set_exc_info(self, exc_info):
+        """ Complete the future with the exception raised by the call. """
+        self._exc_info = exc_info
+        self._event.set()
+
+    def done(self):
+        """ True if the call finished. """
+        return self._event.is_set()
+
+    def exception(self):
+        """ Wait for the call, returning its exception or None. """
+        self._event.wait()
+        return self._exc_info[1] if self._exc_info else None
+
+    def result(self, timeout=None):
+        """
+        Wait for the call and return its value. An exception raised by the
+        call, e.g. an AssertionError, is raised again here with the
+        traceback of the worker, so the test fails as if the call had been
+        made synchronously.
+
+        Kwargs:
+            timeout (float): Seconds to wait, forever if None.
+        """
+        if not self._event.wait(timeout) and not self.done():
+            raise AssertionError("Timed out after {0}s waiting for {1}"
+                                 .format(timeout, self.description))
+        if self._exc_info:
+            reraise(self._exc_info)
+        return self._result
+
+    def __repr__(self):
+        return "RemoteFuture({0}{1})".format(
+            self.description, ", done" if self.done() else "")
+
+
+def gather(futures, return_exceptions=False):
+    """
+    Wait for every future.
+
+    Args:
+        futures (list): RemoteFuture objects.
+
+    Kwargs:
+        return_exceptions (bool): Return exceptions in place of results
+                                  rather than raising the first one.
+
+    Returns:
+        list. Results in the same order as futures.
+    """
+    futures = list(futures)
+    for future in futures:
+        future.exception()
+    if not return_exceptions:
+        # Raise the error of the earliest call, as run_in_parallel does.
+        return [future.result() for future in futures]
+    return [future.exception() or future.result() for future in futures]
+
+
+class AsyncRunner(object):
+    """
+    Non-blocking variants of the GenericTest remote calls, running on a
+    pool of worker threads. Calls to different nodes run concurrently;
+    calls to the same node are serialized, as each node is reached over
+    one connection. The synchronous API of the test stays usable, so
+    testsets can move to this one call site at a time, as long as no
+    synchronous call goes to a node which has calls in flight.
+    """
+
+    def __init__(self, test, max_workers=DEFAULT_MAX_WORKERS,
+                 max_per_node=1):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote calls.
+
+        Kwargs:
+            max_workers (int): Maximum number of calls in flight.
+
+            max_per_node (int): Maximum number of calls in flight per node.
+        """
+        self.test = test
+        self.max_workers = max_workers
+        self.max_per_node = max_per_node
+        self._lock = threading.Lock()
+        self._work_ready = threading.Condition(self._lock)
+        # (future, node, function, args, kwargs) waiting for a worker.
+        self._pending = []
+        # Node -> calls in flight.
+        self._busy_nodes = {}
+        self._workers = []
+        self._idle_workers = 0
+
+    def _take_work(self):
+        """ Pop the first call whose node is free, None if none is. """
+        for index, work in enumerate(self._pending):
+            if self._busy_nodes.get(work[1], 0) < self.max_per_node:
+                self._busy_nodes[work[1]] = \
+                    self._busy_nodes.get(work[1], 0) + 1
+                return self._pending.pop(index)
+        return None
+
+    def _worker(self):
+        """ Run pending calls, exiting when there are none left. """
+        while True:
+            with self._lock:
+                work = self._take_work()
+                while work is None:
+                    if not self._pending:
+                        self._workers.remove(threading.current_thread())
+                        return
+                    self._idle_workers += 1
+                    self._work_ready.wait()
+                    self._idle_workers -= 1
+                    work = self._take_work()
+            future, node, func, args, kwargs = work
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception:  # pylint: disable=broad-except
+                future.set_exc_info(sys.exc_info())
+            finally:
+                with self._lock:
+                    self._busy_nodes[node] -= 1
+                    self._work_ready.notify_all()
+
+    def submit(self, node, func, *args, **kwargs):
+        """
+        Call func in the background.
+
+        Args:
+            node (str): Node the call talks to, serializing calls to it.
+
+            func (callable): Function to call with args and kwargs.
+
+        Returns:
+            RemoteFuture.
+        """
+        future = RemoteFuture("{0} on {1}".format(
+            getattr(func, "__name__", func), node))
+        with self._lock:
+            self._pending.append((future, node, func, args, kwargs))
+            if self._idle_workers:
+                self._work_ready.notify_all()
+            elif len(self._workers) < self.max_workers:
+                thread = threading.Thread(target=self._worker)
+                thread.daemon = True
+                self._workers.append(thread)
+                thread.start()
+        return future
+
+    def run_command_async(self, node, cmd, **kwargs):
+        """ run_command returning a RemoteFuture of (stdout, stderr, rc). """
+        return self.submit(node, self.test.run_command, node, cmd, **kwargs)
+
+    def run_command_via_node_async(self, via_node, node, cmd, **kwargs):
+        """ run_command_via_node returning a RemoteFuture. """
+        return self.submit(via_node, self.test.run_command_via_node,
+                           via_node, node, cmd, **kwargs)
+
+    def get_file_contents_async(self, node, path, **kwargs):
+        """ get_file_contents returning a RemoteFuture of the lines. """
+        return self.submit(node, self.test.get_file_contents, node, path,
+                           **kwargs)
+
+    def remote_path_exists_async(self, node, path, **kwargs):
+        """ remote_path_exists returning a RemoteFuture of a bool. """
+        return self.submit(node, self.test.remote_path_exists, node, path,
+                           **kwargs)
+
+    def run_commands(self, node_cmds, **kwargs):
+        """
+        Run many commands at once and wait for all of them.
+
+        Args:
+            node_cmds (list): (node, command) tuples.
+
+        Kwargs:
+            Passed on to run_command, e.g. su_root=True.
+
+        Returns:
+            list. (stdout, stderr, rc) of each command, in order.
+        """
+        return gather([self.run_command_async(node, cmd, **kwargs)
+                       for node, cmd in node_cmds])
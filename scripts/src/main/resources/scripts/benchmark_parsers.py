@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Micro-benchmarks of the pure Python parsers and matchers of
+            the testsets, on synthetic inputs scaled to a list of sizes.
+            Needs no deployment; framework modules which are not
+            installed are stubbed, as the parsers do not use them.
+
+Usage:
+    python benchmark_parsers.py [--sizes 100,1000] [--save base.json]
+                                [--compare base.json] [--filter firewall]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import types
+import unittest
+
+from deferred_log_utils import DeferredLogger
+from dhcp_utils import DhcpUtils
+from logrotate_utils import LogrotateUtils
+from model_index_utils import ModelIndex
+from model_state_utils import ModelStateUtils
+
+DEFAULT_SIZES = [100, 1000, 5000]
+# Minimum wall time spent measuring each benchmark and size.
+MIN_MEASURE_SECS = 0.5
+
+
+class BenchmarkSkipped(Exception):
+    """
+    Raised by a benchmark setup when it cannot run here.
+    """
+    pass
+
+
+# Framework modules imported by the benchmarked testsets -> classes they
+# import from them, stubbed where the framework is not installed.
+FRAMEWORK_MODULES = {
+    "litp_generic_test": ["StorageUtils"],
+    "test_constants": [],
+    "networking_utils": ["NetworkingUtils"],
+    "redhat_cmd_utils": ["RHCmdUtils"],
+    "vcs_utils": ["VCSUtils"],
+    "storage_utils": ["StorageUtils"],
+    "simplejson": [],
+}
+
+
+def _stub_framework():
+    """
+    Make the framework modules importable where they are not installed:
+    GenericTest is a plain unittest.TestCase, attr leaves the test
+    methods as they are and the utils classes are empty. The benchmarks
+    only call the parsers of the testsets, which do not use them.
+    """
+    for module_name, class_names in FRAMEWORK_MODULES.items():
+        try:
+            __import__(module_name)
+        except ImportError:
+            stub = types.ModuleType(module_name)
+            for class_name in class_names:
+                setattr(stub, class_name, type(class_name, (object,), {}))
+            if module_name == "litp_generic_test":
+                stub.GenericTest = unittest.TestCase
+                stub.attr = lambda *args, **kwargs: lambda method: method
+            sys.modules[module_name] = stub
+
+
+def _import_testset(module_name, class_name):
+    """ Import a testset class, skipping the benchmark if impossible. """
+    _stub_framework()
+    try:
+        module = __import__(module_name)
+    except (ImportError, SyntaxError) as error:
+        # Testsets are Python 2 only.
+        raise BenchmarkSkipped("{0}: {1}".format(module_name, error))
+    return getattr(module, class_name)
+
+
+def _make_test(module_name, class_name, **attributes):
+    """
+    Return a testset instance usable outside a test run: unittest is set
+    up, but not the framework, and logging is silenced.
+    """
+    cls = _import_testset(module_name, class_name)
+    test = cls.__new__(cls)
+    method = [name for name in dir(cls) if name.startswith("test")][0]
+    unittest.TestCase.__init__(test, method)
+    test.log = lambda *args, **kwargs: None
+    test.logger = DeferredLogger(test)
+    for name, value in attributes.items():
+        setattr(test, name, value)
+    return test
+
+
+def _canned_output(stdout):
+    """ Return a run_command replacement answering with stdout. """
+    def run_command(*args, **kwargs):
+        """ Answer any command with the canned output. """
+        return stdout, [], 0
+    return run_command
+
+
+class _Silence(object):
+    """ Context manager discarding what benchmarked code prints. """
+
+    def __enter__(self):
+        self.stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+    def __exit__(self, *exc_info):
+        sys.stdout.close()
+        sys.stdout = self.stdout
+
+
+# Each benchmark is a function of the size returning the callable to time.
+
+def bench_firewall_verify_iptables(size):
+    """ Firewall._verify_iptables: size rules against size lines. """
+    rules = [["{0:06d} rule".format(index), "INPUT", "tcp", "ACCEPT",
+              str(1000 + index)] for index in range(size)]
+    lines = ["-A INPUT -p tcp -m comment --comment \"{0:06d} rule\" -m tcp "
+             "--dport {1} -j ACCEPT".format(index, 1000 + index)
+             for index in range(size)]
+    test = _make_test("testset_firewall", "Firewall",
+                      run_command=_canned_output(lines))
+    return lambda: test._verify_iptables("ms1", rules)
+
+
+def bench_firewall_process_fw_rule_properties(size):
+    """ Firewall._process_fw_rule_properties over size rules. """
+    props = [{"name": "{0} rule".format(index), "dport": "{0}-{1}".format(
+        index, index + 10), "action": "accept", "proto": "tcp",
+              "provider": "iptables" if index % 2 else "ip6tables"}
+             for index in range(size)]
+    test = _make_test("testset_firewall", "Firewall")
+
+    def run():
+        """ Process every rule into fresh iptable options. """
+        test.iptable_options = dict(
+            (command, {"filter": [], "nat": [], "mangle": [], "raw": []})
+            for command in ("iptables", "ip6tables"))
+        for prop in props:
+            test._process_fw_rule_properties(dict(prop))
+    return run
+
+
+def bench_network_format_file_config_to_dict(size):
+    """ Network.format_file_config_to_dict over size ifcfg files. """
+    network = _import_testset("testset_network", "Network")
+    configs = [["# interface {0}".format(index),
+                "DEVICE=eth{0}".format(index),
+                "HWADDR=52:54:00:00:{0:02x}:{1:02x}".format(index // 256,
+                                                            index % 256),
+                "BOOTPROTO=static", "ONBOOT=yes",
+                "IPADDR=10.{0}.{1}.10".format(index // 256, index % 256),
+                "BONDING_OPTS=\"mode=1 miimon=100\"",
+                "MASTER=bond0"] for index in range(size)]
+    return lambda: [network.format_file_config_to_dict(config)
+                    for config in configs]
+
+
+def _logrotate_config(size):
+    """ Return a logrotate config with size rules. """
+    lines = ["compress"]
+    for index in range(size):
+        lines.extend(["/var/log/app{0}.log {{".format(index),
+                      "    rotate 5", "    size 10M",
+                      "    postrotate",
+                      "        /bin/kill -HUP app{0}".format(index),
+                      "            2>/dev/null || true",
+                      "    endscript", "}"])
+    return lines
+
+
+def bench_logrotate_parse_config(size):
+    """ LogrotateUtils.parse_config of size rules. """
+    lines = _logrotate_config(size)
+    utils = LogrotateUtils()
+    return lambda: utils.parse_config(lines)
+
+
+def bench_logrotate_check_script_properties(size):
+    """ Logrotate.check_logrotate_script_properties over size rules. """
+    config = LogrotateUtils().parse_config(_logrotate_config(size))
+    test = _make_test("testset_logrotate", "Logrotate")
+    checks = [("postrotate", "/bin/kill -HUP app{0} \\n 2>/dev/null || true"
+               .format(index), config.get_rule(
+                   "/var/log/app{0}.log".format(index)))
+              for index in range(size)]
+
+    def run():
+        """ Check the postrotate script of every rule. """
+        for prop, value, rule in checks:
+            test.check_logrotate_script_properties(prop, value, rule)
+    return run
+
+
+def bench_hosts_check_pair(size):
+    """ Hosts._check_pair: size pairs against size /etc/hosts lines. """
+    hosts = _import_testset("testset_hosts", "Hosts")
+    etc_hosts = ["10.0.{0}.{1} node{2} node{2}.example.com".format(
+        index // 256, index % 256, index) for index in range(size)]
+    pairs = [("10.0.{0}.{1}".format(index // 256, index % 256),
+              ["node{0}".format(index)]) for index in range(size)]
+    return lambda: [hosts._check_pair(etc_hosts, address, aliases)
+                    for address, aliases in pairs]
+
+
+def bench_vcs_vm_get_ip_map(size):
+    """ testset_vcs_vm.get_ip_map of a VM network on size nodes. """
+    _import_testset("testset_vcs_vm", "VCSVM")
+    get_ip_map = sys.modules["testset_vcs_vm"].get_ip_map
+    nodes = ["node{0}".format(index) for index in range(size)]
+    vm_net = {"ipaddresses": ",".join("10.1.{0}.{1}".format(
+        index // 256, index % 256) for index in range(size)),
+              "ipv6addresses": ",".join("fd00::{0:x}/64".format(index)
+                                        for index in range(size))}
+    return lambda: get_ip_map(vm_net, nodes)
+
+
+def bench_vcs_vm_format_ipv6_to_list(size):
+    """ VCSVM._format_ipv6_to_list of size addresses. """
+    vcs_vm = _import_testset("testset_vcs_vm", "VCSVM")
+    addresses = ["2001:db8:{0:x}::7516:{1:x}/64".format(index, index % 7)
+                 for index in range(size)]
+    return lambda: [vcs_vm._format_ipv6_to_list(address)
+                    for address in addresses]
+
+
+def bench_snapshot_check_lvm_snap_size(size):
+    """ Snapshot._check_lvm_snap_size for size volumes. """
+    test = _make_test("testset_snapshot", "Snapshot",
+                      run_command=_canned_output(
+                          ["vg_root-L_vg1_-cow 253:3 0 1G 0 lvm"]))
+    node = {"name": "node1"}
+    return lambda: [test._check_lvm_snap_size("10G", "10", node, "L_vg1_")
+                    for _ in range(size)]
+
+
+def bench_dhcp_parse_config(size):
+    """ DhcpUtils.parse_config of size subnets. """
+    lines = []
+    for index in range(size):
+        net = "10.{0}.{1}".format(index // 256, index % 256)
+        lines.extend(["subnet {0}.0 netmask 255.255.255.0 {{".format(net),
+                      "  option routers {0}.1;".format(net),
+                      "  pool {", "    failover peer \"dhcp_failover\";",
+                      "    range {0}.10 {0}.200;".format(net), "  }", "}"])
+    utils = DhcpUtils()
+    return lambda: utils.parse_config(lines)
+
+
+def bench_model_state_unapplied_items(size):
+    """ Parse a recursive show of size items and filter unapplied ones. """
+    stdout = []
+    for index in range(size):
+        stdout.extend(["/deployments/d1/clusters/c1/nodes/n{0}/items/"
+                       "i{1}".format(index % 50, index),
+                       "    type: reference-to-package",
+                       "    state: Applied", "    properties:",
+                       "        name: pkg{0}".format(index)])
+    utils = ModelStateUtils()
+    return lambda: utils.get_unapplied_items(
+        utils.parse_show_output(stdout),
+        ignore_paths=["/deployments/d1/clusters/c1/nodes/n1"])
+
+
+def bench_model_index_scoped_find(size):
+    """ Index size items, then find the items of type in each node. """
+    utils = ModelStateUtils()
+    items = []
+    for index in range(size):
+        node = "/deployments/d1/clusters/c1/nodes/n{0}".format(index % 50)
+        items.append(utils.parse_show_output([
+            "{0}/items/i{1}".format(node, index),
+            "    inherited from: /software/items/i{0}".format(index),
+            "    type: reference-to-package", "    state: Applied"])[0])
+    nodes = ["/deployments/d1/clusters/c1/nodes/n{0}".format(node)
+             for node in range(50)]
+
+    def run():
+        index = ModelIndex(items)
+        return [index.find(node, "package", find_refs=True)
+                for node in nodes]
+    return run
+
+
+BENCHMARKS = sorted((name[len("bench_"):], func)
+                    for name, func in globals().items()
+                    if name.startswith("bench_"))
+
+
+def measure(func):
+    """
+    Time func until MIN_MEASURE_SECS have passed.
+
+    Returns:
+        float. Best seconds per call.
+    """
+    best = None
+    spent = 0.0
+    while spent < MIN_MEASURE_SECS:
+        start = time.time()
+        func()
+        elapsed = time.time() - start
+        spent += elapsed
+        best = elapsed if best is None else min(best, elapsed)
+    return max(best, 1e-9)
+
+
+def run_benchmarks(sizes, name_filter=None):
+    """
+    Run every benchmark at every size.
+
+    Returns:
+        dict. Benchmark name -> {size as str -> seconds per call}, or
+              {'skipped': reason}.
+    """
+    results = {}
+    for name, bench in BENCHMARKS:
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = {}
+        for size in sizes:
+            try:
+                func = bench(size)
+            except BenchmarkSkipped as error:
+                results[name] = {"skipped": str(error)}
+                break
+            with _Silence():
+                results[name][str(size)] = measure(func)
+    return results
+
+
+def format_report(results, baseline=None):
+    """
+    Return the results as lines of text: ops/sec per size, the scaling
+    exponent between consecutive sizes (1 is linear, 2 quadratic) and
+    the speedup against a baseline if given.
+    """
+    lines = []
+    for name in sorted(results):
+        timings = results[name]
+        if "skipped" in timings:
+            lines.append("{0:<40} skipped ({1})".format(name,
+                                                        timings["skipped"]))
+            continue
+        previous = None
+        for size in sorted(timings, key=int):
+            seconds = timings[size]
+            line = "{0:<40} n={1:<7} {2:>12.1f} ops/s".format(
+                name, size, 1.0 / seconds)
+            if previous:
+                line += "  scaling {0:4.2f}".format(
+                    math.log(seconds / previous[1]) /
+                    math.log(float(size) / float(previous[0])))
+            base = (baseline or {}).get(name, {}).get(size)
+            if base:
+                line += "  x{0:.2f} vs baseline".format(base / seconds)
+            lines.append(line)
+            previous = (size, seconds)
+    return lines
+
+
+def main(argv=None):
+    """ Run the benchmarks from the command line. """
+    parser = argparse.ArgumentParser(description=__doc__.split("@")[0])
+    parser.add_argument("--sizes", default=",".join(
+        str(size) for size in DEFAULT_SIZES),
+                        help="comma separated input sizes")
+    parser.add_argument("--filter", help="only run benchmarks whose name "
+                        "contains this")
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run "
+                        "to compare with")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run_benchmarks(sizes, args.filter)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    for line in format_report(results, baseline):
+        print(line)
+    if args.save:
+        with open(args.save, "w") as results_file:
+            json.dump(results, results_file, indent=1, sort_keys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
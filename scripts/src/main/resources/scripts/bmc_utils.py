@@ -0,0 +1,122 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import os
+
+from shell_utils import quote
+
+RESULT_PREFIX = "BMC_RESULT"
+
+# Environment variable enabling the IPMI check: "on" for DEFAULT_IPMI_CMD,
+# or a command template with {ip} and {username} fields, e.g. against a
+# local IPMI simulator standing in for the BMCs.
+IPMI_CMD_ENV = "TAF_BMC_IPMI"
+
+# RMCP presence ping; needs no credentials so it can run against any BMC
+# or a local IPMI simulator standing in for one.
+DEFAULT_IPMI_CMD = "/usr/sbin/ipmiping -c 1 {ip}"
+
+
+def get_ipmi_cmd(spec=None):
+    """
+    Return the IPMI check command template set by spec or TAF_BMC_IPMI,
+    None if the check is not enabled.
+    """
+    spec = spec or os.environ.get(IPMI_CMD_ENV)
+    if not spec:
+        return None
+    return DEFAULT_IPMI_CMD if spec == "on" else spec
+
+
+class BmcUtils(object):
+    """
+    Commands and parsers for checking BMC addresses in one batch.
+    """
+
+    @staticmethod
+    def get_reachability_cmd(addresses, ipmi_cmd=None, timeout=2,
+                             usernames=None):
+        """
+        Return one script which pings every BMC address concurrently and,
+        optionally, checks IPMI responsiveness. Each check reports a line
+        "BMC_RESULT <check> <address> <rc>".
+
+        Args:
+            addresses (list): BMC IP addresses.
+
+        Kwargs:
+            ipmi_cmd (str): Command template with {ip} and {username}
+                            fields checking IPMI responsiveness, no IPMI
+                            check if None.
+
+            timeout (int): Ping timeout in seconds.
+
+            usernames (dict): Address -> modelled BMC username, shell
+                              quoted into the {username} field.
+
+        Returns:
+            str. The script.
+        """
+        checks = []
+        for address in addresses:
+            ping = "/bin/ping6" if ":" in address else "/bin/ping"
+            checks.append("( {0} -c 1 -W {1} {2} >/dev/null 2>&1; "
+                          "echo \"{3} ping {2} $?\" ) &".format(
+                              ping, timeout, address, RESULT_PREFIX))
+            if ipmi_cmd:
+                checks.append("( {0} >/dev/null 2>&1; "
+                              "echo \"{1} ipmi {2} $?\" ) &".format(
+                                  ipmi_cmd.format(
+                                      ip=address,
+                                      username=quote((usernames or {}).get(
+                                          address, ""))),
+                                  RESULT_PREFIX, address))
+        checks.append("wait")
+        return " ".join(checks)
+
+    @staticmethod
+    def parse_reachability_output(stdout):
+        """
+        Parse the output of get_reachability_cmd.
+
+        Returns:
+            dict. (check, address) -> True if the check passed, where check
+            is 'ping' or 'ipmi'.
+        """
+        results = {}
+        for line in stdout:
+            parts = line.split()
+            if len(parts) == 4 and parts[0] == RESULT_PREFIX:
+                results[(parts[1], parts[2])] = parts[3] == "0"
+        return results
+
+    @staticmethod
+    def group_bmcs_by_blade(blades, bmcs):
+        """
+        Assign each bmc item path to the blade it belongs to.
+
+        Args:
+            blades (list): Paths of blade items.
+
+            bmcs (list): Paths of bmc items.
+
+        Returns:
+            dict. Blade path -> list of bmc paths under it.
+        """
+        grouped = dict((blade, []) for blade in blades)
+        # Longest blade path first so nested paths match the closest blade.
+        ordered = sorted(blades, key=len, reverse=True)
+        for bmc in bmcs:
+            for blade in ordered:
+                if bmc.startswith(blade.rstrip("/") + "/"):
+                    grouped[blade].append(bmc)
+                    break
+        return grouped
@@ -0,0 +1,163 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import copy
+import json
+import os
+import threading
+
+# Environment variables enabling a cassette for every test using one.
+CASSETTE_DIR_ENV = "TAF_CASSETTE_DIR"
+CASSETTE_MODE_ENV = "TAF_CASSETTE_MODE"
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# GenericTest methods which reach the deployment.
+RECORDED_METHODS = ["run_command", "run_command_via_node", "find",
+                    "get_props_from_url", "get_file_contents",
+                    "remote_path_exists", "get_model_names_and_urls",
+                    "execute_cli_show_cmd", "get_management_node_filename",
+                    "get_management_node_filenames",
+                    "get_managed_node_filenames"]
+
+
+class CassetteError(Exception):
+    """
+    Raised when a replayed call was not recorded.
+    """
+    pass
+
+
+def _make_key(method, args, kwargs):
+    """ Return the cassette key of a call. """
+    return json.dumps([method, list(args), kwargs], sort_keys=True,
+                      default=repr)
+
+
+class Cassette(object):
+    """
+    Responses of deployment calls, recorded during a real run and replayed
+    in the same order offline. Calls with the same arguments are replayed
+    in the order they were recorded.
+    """
+
+    def __init__(self, path, mode):
+        """
+        Args:
+            path (str): JSON file holding the cassette.
+
+            mode (str): MODE_RECORD or MODE_REPLAY.
+        """
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        # Call key -> list of {'result': value} or {'error': message}.
+        self.calls = {}
+        # Call key -> index of the next response to replay.
+        self.positions = {}
+        # Per thread depth of recorded calls in progress, so calls made
+        # inside a recorded call, e.g. run_command inside find, are not
+        # recorded on their own.
+        self.local = threading.local()
+        if mode == MODE_REPLAY:
+            with open(path) as cassette_file:
+                self.calls = json.load(cassette_file)
+
+    def record(self, key, result=None, error=None):
+        """ Store the response of a call. """
+        if error is not None:
+            entry = {"error": error}
+        else:
+            # Round trip through JSON so recording fails on values which
+            # could not be replayed, rather than at save time.
+            entry = {"result": json.loads(json.dumps(result))}
+        with self.lock:
+            self.calls.setdefault(key, []).append(entry)
+
+    def replay(self, key):
+        """ Return the next recorded response of a call. """
+        with self.lock:
+            responses = self.calls.get(key, [])
+            position = self.positions.get(key, 0)
+            if position >= len(responses):
+                raise CassetteError("Call not recorded in {0}: {1}".format(
+                    self.path, key))
+            self.positions[key] = position + 1
+            entry = responses[position]
+        if "error" in entry:
+            raise AssertionError(entry["error"])
+        return copy.deepcopy(entry["result"])
+
+    def save(self):
+        """ Write the recorded calls to the cassette file. """
+        if self.mode != MODE_RECORD:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with self.lock:
+            with open(self.path, "w") as cassette_file:
+                json.dump(self.calls, cassette_file, indent=1,
+                          sort_keys=True)
+
+    def wrap(self, name, method):
+        """ Return method recording or replaying its calls. """
+        def recorded(*args, **kwargs):
+            """ Call routed through the cassette. """
+            key = _make_key(name, args, kwargs)
+            if self.mode == MODE_REPLAY:
+                return self.replay(key)
+            depth = getattr(self.local, "depth", 0)
+            if depth:
+                return method(*args, **kwargs)
+            self.local.depth = depth + 1
+            try:
+                result = method(*args, **kwargs)
+            except AssertionError as error:
+                self.record(key, error=str(error))
+                raise
+            finally:
+                self.local.depth = depth
+            self.record(key, result=result)
+            return result
+        return recorded
+
+
+def use_cassette(test, cassette_dir=None, mode=None):
+    """
+    Route the deployment calls of a test through a cassette named after
+    the test. Does nothing unless a cassette directory and mode are given,
+    or set in the TAF_CASSETTE_DIR and TAF_CASSETTE_MODE environment
+    variables. Call it in setUp right after the super class setUp.
+
+    Args:
+        test (GenericTest): Test whose calls are recorded or replayed.
+
+    Kwargs:
+        cassette_dir (str): Directory of the cassette files.
+
+        mode (str): MODE_RECORD or MODE_REPLAY.
+
+    Returns:
+        Cassette. The cassette in use, None if not enabled.
+    """
+    cassette_dir = cassette_dir or os.environ.get(CASSETTE_DIR_ENV)
+    mode = mode or os.environ.get(CASSETTE_MODE_ENV)
+    if not cassette_dir or mode not in (MODE_RECORD, MODE_REPLAY):
+        return None
+    cassette = Cassette(os.path.join(cassette_dir, test.id() + ".json"),
+                        mode)
+    for name in RECORDED_METHODS:
+        if hasattr(test, name):
+            setattr(test, name, cassette.wrap(name, getattr(test, name)))
+    test.addCleanup(cassette.save)
+    return cassette
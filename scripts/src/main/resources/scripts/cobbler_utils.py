@@ -0,0 +1,143 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from shell_utils import split_sections
+
+SECTION_MARKER = "==>COBBLER:"
+KICKSTART_SECTION = "ks "
+INTERFACE_KEY = "Interface ====="
+
+# Cobbler object types included in a snapshot.
+REPORT_TYPES = ["system", "profile", "distro"]
+
+# CobblerSnapshot per MS, shared for the lifetime of the run.
+_SNAPSHOT_CACHE = {}
+
+
+def clear_cobbler_snapshot_cache():
+    """ Forget cached snapshots, e.g. after nodes were added. """
+    _SNAPSHOT_CACHE.clear()
+
+
+class CobblerSnapshot(object):
+    """
+    Cobbler systems, profiles and distros of an MS, plus the selinux lines
+    of each kickstart file.
+    """
+
+    def __init__(self):
+        # Object name -> {report key -> value}. Systems also hold an
+        # 'interfaces' dict of interface name -> {report key -> value}.
+        self.systems = {}
+        self.profiles = {}
+        self.distros = {}
+        # Kickstart file name -> list of 'selinux ...' lines.
+        self.kickstarts = {}
+
+    def get_system(self, name):
+        """ Return the report of a system or None. """
+        return self.systems.get(name)
+
+
+class CobblerUtils(object):
+    """
+    Commands and parsers to snapshot the cobbler state of the MS.
+    """
+
+    @staticmethod
+    def get_snapshot_cmd(ksm_path):
+        """
+        Return one command printing the system, profile and distro reports
+        and the selinux line of every kickstart file under ksm_path.
+        """
+        cmds = ["echo \"{0}{1}\"; /usr/bin/cobbler {1} report".format(
+            SECTION_MARKER, report) for report in REPORT_TYPES]
+        cmds.append("for f in {0}/*.ks; do [ -f \"$f\" ] || continue; "
+                    "echo \"{1}{2}$(basename \"$f\")\"; "
+                    "/bin/grep -E '^selinux' \"$f\"; done; true".format(
+                        ksm_path.rstrip("/"), SECTION_MARKER,
+                        KICKSTART_SECTION))
+        return "; ".join(cmds)
+
+    @staticmethod
+    def parse_report(lines):
+        """
+        Parse the output of 'cobbler <type> report'.
+
+        Returns:
+            dict. Object name -> {report key -> value}.
+        """
+        objects = {}
+        current = None
+        interface = None
+        for line in lines:
+            if " : " not in line and not line.rstrip().endswith(":"):
+                continue
+            key, _, value = line.partition(":")
+            key = key.strip()
+            value = value.strip()
+            if key == "Name":
+                current = objects.setdefault(value, {})
+                interface = None
+            if current is None:
+                continue
+            if key.startswith(INTERFACE_KEY):
+                interface = current.setdefault("interfaces", {}) \
+                    .setdefault(value, {})
+            elif interface is not None:
+                interface[key] = value
+            else:
+                current[key] = value
+        return objects
+
+    def parse_snapshot_output(self, stdout):
+        """
+        Parse the output of get_snapshot_cmd.
+
+        Returns:
+            CobblerSnapshot.
+        """
+        sections = split_sections(stdout, SECTION_MARKER)
+        snapshot = CobblerSnapshot()
+        snapshot.systems = self.parse_report(sections.get("system", []))
+        snapshot.profiles = self.parse_report(sections.get("profile", []))
+        snapshot.distros = self.parse_report(sections.get("distro", []))
+        for section, lines in sections.items():
+            if section.startswith(KICKSTART_SECTION):
+                snapshot.kickstarts[section[len(KICKSTART_SECTION):]] = \
+                    [line.strip() for line in lines if line.strip()]
+        return snapshot
+
+    def get_snapshot(self, test, ms_node, ksm_path, refresh=False):
+        """
+        Fetch the cobbler snapshot of the MS once per run.
+
+        Args:
+            test (GenericTest): Test used to run the remote command.
+
+            ms_node (str): The MS.
+
+            ksm_path (str): Kickstart directory of the cobbler-service.
+
+        Kwargs:
+            refresh (bool): Fetch again even if cached.
+
+        Returns:
+            CobblerSnapshot.
+        """
+        key = (ms_node, ksm_path)
+        if refresh or key not in _SNAPSHOT_CACHE:
+            stdout, stderr, rc = test.run_command(
+                ms_node, self.get_snapshot_cmd(ksm_path), su_root=True)
+            test.assertEqual(0, rc)
+            test.assertEqual([], stderr)
+            _SNAPSHOT_CACHE[key] = self.parse_snapshot_output(stdout)
+        return _SNAPSHOT_CACHE[key]
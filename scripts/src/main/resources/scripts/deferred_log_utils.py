@@ -0,0 +1,253 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+# Environment variables setting the lowest level logged, and a file to
+# append JSON records to.
+LOG_LEVEL_ENV = "TAF_LOG_LEVEL"
+LOG_JSON_ENV = "TAF_LOG_JSON"
+
+DEFAULT_LEVEL = "info"
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
+class LogRecord(object):
+    """
+    A log message whose text is only built by the writer thread.
+    """
+
+    def __init__(self, test, write, level, template, args, fields):
+        """
+        Args:
+            test (GenericTest): Test logging the message.
+
+            write (callable): Function writing (level, message) to the
+                              test log.
+
+            level (str): Level name, e.g. 'info'.
+
+            template (str|callable): Format string for args, or function
+                                     returning the message.
+
+            args (tuple): Arguments of the format string.
+
+            fields (dict): Structured fields, e.g. node and step.
+        """
+        self.test = test
+        self.write = write
+        self.level = level
+        self.template = template
+        self.args = args
+        self.fields = fields
+        self.created = time.time()
+
+    def get_message(self):
+        """ Build the message text. """
+        if callable(self.template):
+            return self.template()
+        if self.args:
+            return self.template.format(*self.args)
+        return self.template
+
+    def to_json(self, message):
+        """ Return the record as one line of JSON. """
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S",
+                                        time.localtime(self.created)),
+                  "level": self.level, "test": self.test.id(),
+                  "message": message}
+        record.update(self.fields)
+        return json.dumps(record, sort_keys=True, default=str)
+
+
+class LogWriter(object):
+    """
+    Background thread formatting queued records and writing them to the
+    test log, and as JSON lines to a file if one is set.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._queue = []
+        self._writing = False
+        # Path -> open JSON file.
+        self._json_files = {}
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, record, json_path=None):
+        """ Queue a record. """
+        with self._lock:
+            self._queue.append((record, json_path))
+            self._changed.notify_all()
+
+    def flush(self):
+        """ Wait until every queued record is written. """
+        with self._lock:
+            while self._queue or self._writing:
+                self._changed.wait()
+
+    def _write(self, record, json_path):
+        """ Format and write one record. """
+        message = record.get_message()
+        record.write(record.level, message)
+        if json_path:
+            if json_path not in self._json_files:
+                self._json_files[json_path] = open(json_path, "a")
+            self._json_files[json_path].write(record.to_json(message) +
+                                              "\n")
+            self._json_files[json_path].flush()
+
+    def _run(self):
+        """ Write records as they are queued. """
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._writing = False
+                    self._changed.notify_all()
+                    self._changed.wait()
+                record, json_path = self._queue.pop(0)
+                self._writing = True
+            try:
+                self._write(record, json_path)
+            except Exception as error:  # pylint: disable=broad-except
+                sys.stderr.write("Failed to log {0!r}: {1}\n".format(
+                    record.template, error))
+
+
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_writer():
+    """ Return the writer shared by all testsets, starting it once. """
+    global _WRITER  # pylint: disable=global-statement
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = LogWriter()
+    return _WRITER
+
+
+class DeferredLogger(object):
+    """
+    Logger for a test which drops messages below the level before any
+    formatting, and hands the others to a background writer which formats
+    them. Messages are format strings with arguments, or functions
+    returning the text, so nothing is built for messages not written.
+    Records are flushed when the test finishes, and before any message
+    the test logs directly while some are pending, so the test log keeps
+    the order of the calls.
+    """
+
+    def __init__(self, test, level=None, json_path=None):
+        """
+        Args:
+            test (GenericTest): Test whose log is written to.
+
+        Kwargs:
+            level (str): Lowest level logged, in any case, TAF_LOG_LEVEL
+                         or 'info' if None.
+
+            json_path (str): File to append JSON records to, TAF_LOG_JSON
+                             if None.
+        """
+        self.test = test
+        level = (level or os.environ.get(LOG_LEVEL_ENV) or
+                 DEFAULT_LEVEL).lower()
+        if level not in LEVELS:
+            raise ValueError("Unknown log level {0}, expected one of {1}"
+                             .format(level, ", ".join(sorted(
+                                 LEVELS, key=LEVELS.get))))
+        self.threshold = LEVELS[level]
+        self.json_path = json_path or os.environ.get(LOG_JSON_ENV)
+        self.step_name = None
+        self.writer = get_writer()
+        # True once a record is queued, until the next flush.
+        self._pending = False
+        self._write_log = test.log
+        test.log = self.log_now
+        test.addCleanup(self.flush)
+
+    def log_now(self, level, message):
+        """
+        Write a message at once, after the queued records. Replaces
+        test.log, so direct calls stay in order with deferred ones. Drops
+        messages below the level without waiting for the writer.
+        """
+        if level in LEVELS and not self.enabled(level):
+            return
+        if self._pending:
+            self.flush()
+        self._write_log(level, message)
+
+    def enabled(self, level):
+        """ True if messages of level are written. """
+        return LEVELS[level] >= self.threshold
+
+    def log(self, level, template, *args, **fields):
+        """
+        Log a message.
+
+        Args:
+            level (str): Level name, e.g. 'info'.
+
+            template (str|callable): Format string for args, e.g.
+                                     "{0}: {1} rules", or function
+                                     returning the message.
+
+            args: Arguments of the format string, formatted later by the
+                  writer, so they must not be changed afterwards.
+
+        Kwargs:
+            Structured fields of the JSON record, e.g. node='node1'.
+        """
+        if not self.enabled(level):
+            return
+        if self.step_name is not None:
+            fields.setdefault("step", self.step_name)
+        self.writer.put(LogRecord(self.test, self._write_log, level,
+                                  template, args, fields), self.json_path)
+        self._pending = True
+
+    def log_structure(self, level, title, data, **fields):
+        """
+        Log a nested structure of dicts and lists, e.g. service groups
+        found in the model, as indented JSON. The structure is serialized
+        right away if the level is logged, as the caller may change it
+        before the writer gets to the record.
+        """
+        if not self.enabled(level):
+            return
+        self.log(level, "{0}:\n{1}", title,
+                 json.dumps(data, indent=1, sort_keys=True, default=str),
+                 **fields)
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """ Tag the records logged inside the with block with a step. """
+        previous = self.step_name
+        self.step_name = name
+        try:
+            yield
+        finally:
+            self.step_name = previous
+
+    def flush(self):
+        """ Wait until the queued records are written. """
+        self._pending = False
+        self.writer.flush()
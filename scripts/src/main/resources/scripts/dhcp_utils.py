@@ -0,0 +1,380 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import bisect
+import binascii
+import socket
+
+from shell_utils import split_sections
+
+DHCPD_CONF = "/etc/dhcp/dhcpd.conf"
+DHCPD6_CONF = "/etc/dhcp/dhcpd6.conf"
+DHCPD_LEASES = "/var/lib/dhcpd/dhcpd.leases"
+DHCPD6_LEASES = "/var/lib/dhcpd/dhcpd6.leases"
+
+FILE_MARKER = "==>DHCP_FILE:"
+
+# Facts per DHCP server node, shared for the lifetime of the run.
+_FACTS_CACHE = {}
+
+
+def clear_dhcp_facts_cache():
+    """ Forget all cached DHCP facts, e.g. after a plan changed them. """
+    _FACTS_CACHE.clear()
+
+
+def ip_to_int(address):
+    """
+    Convert an IPv4 or IPv6 address, with or without prefix, to an int so
+    that addresses of the same family can be compared and sorted.
+    """
+    address = address.split("/")[0]
+    if ":" in address:
+        return int(binascii.hexlify(socket.inet_pton(socket.AF_INET6,
+                                                     address)), 16)
+    # Parsed by octet, as inet_pton rejects zero padded octets like '01'.
+    octets = [int(octet) for octet in address.split(".")]
+    if len(octets) != 4 or any(octet > 255 for octet in octets):
+        raise ValueError("Invalid IPv4 address {0}".format(address))
+    return sum(octet << (8 * (3 - idx)) for idx, octet in enumerate(octets))
+
+
+def _ip_key(address):
+    """ Sort key keeping IPv4 and IPv6 addresses apart. """
+    return (6 if ":" in address else 4, ip_to_int(address))
+
+
+def _tokenize(lines):
+    """ Split ISC dhcpd config/lease syntax into tokens. """
+    tokens = []
+    for line in lines:
+        idx = 0
+        length = len(line)
+        while idx < length:
+            char = line[idx]
+            if char == "#":
+                break
+            if char.isspace():
+                idx += 1
+            elif char in "{};":
+                tokens.append(char)
+                idx += 1
+            elif char == '"':
+                end = line.find('"', idx + 1)
+                end = length if end == -1 else end
+                tokens.append(line[idx:end + 1])
+                idx = end + 1
+            else:
+                start = idx
+                while idx < length and not line[idx].isspace() and \
+                        line[idx] not in "{};#":
+                    idx += 1
+                tokens.append(line[start:idx])
+    return tokens
+
+
+def parse_statements(lines):
+    """
+    Parse ISC dhcpd config or lease file lines into a statement tree.
+
+    Args:
+        lines (list): Lines of the file.
+
+    Returns:
+        list. (words, children) tuples, where children is a list of
+        statements for block statements and None for simple statements.
+    """
+    root = []
+    stack = [root]
+    words = []
+    for token in _tokenize(lines):
+        if token == ";":
+            if words:
+                stack[-1].append((words, None))
+            words = []
+        elif token == "{":
+            children = []
+            stack[-1].append((words, children))
+            stack.append(children)
+            words = []
+        elif token == "}":
+            if words:
+                stack[-1].append((words, None))
+            words = []
+            if len(stack) > 1:
+                stack.pop()
+        else:
+            words.append(token.strip('"'))
+    return root
+
+
+class DhcpSubnet(object):
+    """ A subnet/subnet6 declaration of dhcpd.conf or dhcpd6.conf. """
+
+    def __init__(self, network, prefix):
+        # Network address and netmask (IPv4) or prefix length (IPv6).
+        self.network = network
+        self.prefix = prefix
+        # (start, end) address tuples of the subnet and its pools.
+        self.ranges = []
+        # Names of failover peers referenced by the subnet's pools.
+        self.failover_peers = []
+        # Option name -> value string.
+        self.options = {}
+
+
+class DhcpRangeIndex(object):
+    """
+    Interval index of DHCP address ranges for O(log n) address lookups.
+    DHCP ranges served by one server may not overlap, so each address is
+    in at most one range; build one index per server.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._ranges = []
+
+    def add(self, start, end, data=None):
+        """ Add the range start-end with data returned on lookup. """
+        start_key = _ip_key(start)
+        idx = bisect.bisect_right(self._starts, start_key)
+        self._starts.insert(idx, start_key)
+        self._ranges.insert(idx, (start_key, _ip_key(end), start, end,
+                                  data))
+
+    def find(self, address):
+        """
+        Return the range containing the address.
+
+        Returns:
+            tuple. (start, end, data) or None if no range holds the address.
+        """
+        addr_key = _ip_key(address)
+        idx = bisect.bisect_right(self._starts, addr_key) - 1
+        if idx < 0:
+            return None
+        start_key, end_key, start, end, data = self._ranges[idx]
+        if start_key <= addr_key <= end_key:
+            return (start, end, data)
+        return None
+
+    def __len__(self):
+        return len(self._ranges)
+
+
+class DhcpFacts(object):
+    """ Parsed DHCP server configuration and leases of one node. """
+
+    def __init__(self):
+        self.subnets = []
+        # Failover peer name -> {'role': 'primary'|'secondary', ...}
+        self.failover_peers = {}
+        # Leased address -> {'state': .., 'hardware': .., 'hostname': ..}
+        self.leases = {}
+        self.ranges = DhcpRangeIndex()
+
+    def get_subnet(self, network):
+        """ Return the subnet declared for the network address or None. """
+        network = network.split("/")[0]
+        for subnet in self.subnets:
+            if subnet.network == network:
+                return subnet
+        return None
+
+    def has_range(self, start, end):
+        """ Return True if start-end is configured as a range. """
+        found = self.ranges.find(start)
+        return found is not None and \
+            _ip_key(found[0]) == _ip_key(start) and \
+            _ip_key(found[1]) == _ip_key(end)
+
+    def get_lease(self, address):
+        """
+        Return the lease of an address, or None if it was never leased.
+        Addresses are compared parsed, so any IPv6 notation matches.
+        """
+        if address in self.leases:
+            return self.leases[address]
+        key = _ip_key(address)
+        for leased, lease in self.leases.items():
+            if _ip_key(leased) == key:
+                return lease
+        return None
+
+
+class DhcpUtils(object):
+    """
+    Commands and parsers for ISC dhcpd configuration and lease files.
+    """
+
+    @staticmethod
+    def get_fetch_files_cmd(paths=None):
+        """
+        Return a command which prints the dhcpd config and lease files in
+        one transfer, each preceded by a marker line. Missing files are
+        reported with no content.
+        """
+        paths = paths or [DHCPD_CONF, DHCPD6_CONF, DHCPD_LEASES,
+                          DHCPD6_LEASES]
+        return "; ".join(
+            "echo \"{0}{1}\"; [ -f {1} ] && /bin/cat {1}; echo".format(
+                FILE_MARKER, path)
+            for path in paths)
+
+    @staticmethod
+    def split_files_output(stdout):
+        """ Split get_fetch_files_cmd output into path -> lines. """
+        return split_sections(stdout, FILE_MARKER)
+
+    @staticmethod
+    def _add_ranges(facts, subnet, statements):
+        """ Collect range/range6/failover statements of a subnet/pool. """
+        for words, children in statements:
+            if not words:
+                continue
+            if words[0] in ("range", "range6") and children is None:
+                addrs = [word for word in words[1:]
+                         if word != "dynamic-bootp"]
+                if len(addrs) == 1:
+                    addrs.append(addrs[0])
+                if len(addrs) == 2 and "/" not in addrs[0]:
+                    subnet.ranges.append((addrs[0], addrs[1]))
+                    facts.ranges.add(addrs[0], addrs[1], subnet)
+            elif words[:2] == ["failover", "peer"] and len(words) > 2:
+                subnet.failover_peers.append(words[2])
+            elif words[0] == "option" and len(words) > 1:
+                subnet.options[words[1]] = " ".join(words[2:])
+            elif words[0] == "pool" and children is not None:
+                DhcpUtils._add_ranges(facts, subnet, children)
+
+    def parse_config(self, lines, facts=None):
+        """
+        Parse dhcpd.conf or dhcpd6.conf lines.
+
+        Args:
+            lines (list): Lines of the config file.
+
+        Kwargs:
+            facts (DhcpFacts): Facts to add to, a new object if None.
+
+        Returns:
+            DhcpFacts.
+        """
+        facts = facts or DhcpFacts()
+        pending = list(parse_statements(lines))
+        while pending:
+            words, children = pending.pop(0)
+            if not words or children is None:
+                continue
+            if words[0] == "subnet" and len(words) >= 4:
+                subnet = DhcpSubnet(words[1], words[3])
+            elif words[0] == "subnet6" and len(words) >= 2:
+                network, _, prefix = words[1].partition("/")
+                subnet = DhcpSubnet(network, prefix)
+            elif words[:2] == ["failover", "peer"] and len(words) > 2:
+                peer = {}
+                for peer_words, _ in children:
+                    if peer_words and peer_words[0] in ("primary",
+                                                        "secondary"):
+                        peer['role'] = peer_words[0]
+                    elif peer_words:
+                        peer[" ".join(peer_words[:-1])] = peer_words[-1]
+                facts.failover_peers[words[2]] = peer
+                continue
+            else:
+                # shared-network, group etc. may hold subnets
+                pending.extend(children)
+                continue
+            self._add_ranges(facts, subnet, children)
+            facts.subnets.append(subnet)
+        return facts
+
+    @staticmethod
+    def parse_leases(lines, facts=None):
+        """
+        Parse dhcpd.leases or dhcpd6.leases lines. The lease files are
+        append only, so the last entry for an address wins.
+
+        Args:
+            lines (list): Lines of the lease file.
+
+        Kwargs:
+            facts (DhcpFacts): Facts to add to, a new object if None.
+
+        Returns:
+            DhcpFacts.
+        """
+        facts = facts or DhcpFacts()
+
+        def lease_props(statements):
+            """ Return the interesting properties of a lease block. """
+            lease = {}
+            for words, _ in statements:
+                if words[:2] == ["binding", "state"] and len(words) > 2:
+                    lease['state'] = words[2]
+                elif words[:2] == ["hardware", "ethernet"] and \
+                        len(words) > 2:
+                    lease['hardware'] = words[2]
+                elif words and words[0] == "client-hostname" and \
+                        len(words) > 1:
+                    lease['hostname'] = words[1]
+            return lease
+
+        for words, children in parse_statements(lines):
+            if not words or children is None:
+                continue
+            if words[0] == "lease" and len(words) > 1:
+                facts.leases[words[1]] = lease_props(children)
+            elif words[0] in ("ia-na", "ia-ta", "ia-pd"):
+                for sub_words, sub_children in children:
+                    if sub_words and sub_words[0] in ("iaaddr", "iaprefix") \
+                            and sub_children is not None:
+                        facts.leases[sub_words[1]] = \
+                            lease_props(sub_children)
+        return facts
+
+    def parse_files_output(self, stdout):
+        """
+        Parse the output of get_fetch_files_cmd.
+
+        Returns:
+            DhcpFacts. Subnets, failover peers and leases of the node.
+        """
+        facts = DhcpFacts()
+        files = self.split_files_output(stdout)
+        for path in (DHCPD_CONF, DHCPD6_CONF):
+            self.parse_config(files.get(path, []), facts)
+        for path in (DHCPD_LEASES, DHCPD6_LEASES):
+            self.parse_leases(files.get(path, []), facts)
+        return facts
+
+    def get_dhcp_facts(self, test, node, refresh=False):
+        """
+        Fetch and parse the DHCP config and leases of a node once per run.
+
+        Args:
+            test (GenericTest): Test used to run the remote command.
+
+            node (str): DHCP server node.
+
+        Kwargs:
+            refresh (bool): Re-read the files even if already cached.
+
+        Returns:
+            DhcpFacts.
+        """
+        if refresh or node not in _FACTS_CACHE:
+            stdout, stderr, rc = test.run_command(
+                node, self.get_fetch_files_cmd(), su_root=True)
+            test.assertEqual(0, rc)
+            test.assertEqual([], stderr)
+            _FACTS_CACHE[node] = self.parse_files_output(stdout)
+        return _FACTS_CACHE[node]
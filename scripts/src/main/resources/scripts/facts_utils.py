@@ -0,0 +1,372 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import json
+import os
+
+from parallel_utils import run_in_parallel
+
+FACT_PREFIX = "FACT:"
+
+# Environment variable naming a file the facts are kept in for the run, so
+# testsets started in separate processes share one sweep.
+FACTS_FILE_ENV = "TAF_FACTS_FILE"
+# Environment variable identifying the run, stamped in the facts file so a
+# file left by another run is ignored. The process starting the testsets
+# identifies the run if it is not set.
+RUN_ID_ENV = "TAF_RUN_ID"
+
+# Fact name -> command printing the fact on a single line.
+OS_FACTS = [
+    ("release", "/bin/rpm -qa '*release-server*' | /usr/bin/head -1"),
+    ("kernel", "/bin/uname -r"),
+    ("arch", "/bin/uname -m"),
+    ("cmdline", "/bin/cat /proc/cmdline"),
+    ("timezone", "/bin/readlink /etc/localtime | /bin/sed 's|.*zoneinfo/||'"),
+    ("abv_timezone", "/bin/date +%Z"),
+    ("hostname", "/bin/hostname"),
+    ("uptime", "/usr/bin/cut -d' ' -f1 /proc/uptime"),
+    ("boot_id", "/bin/cat /proc/sys/kernel/random/boot_id"),
+    ("rhel_version", "/bin/sed 's/[^0-9]*\\([0-9.]*\\).*/\\1/' "
+                     "/etc/redhat-release"),
+    ("interfaces", "/bin/ls /sys/class/net | /usr/bin/tr '\\n' ' '"),
+    ("mounts", "/bin/awk '$1 ~ /^\\// {print $2}' /proc/mounts | "
+               "/usr/bin/tr '\\n' ' '"),
+]
+
+# Facts which still hold on SFS nodes, which are not RHEL.
+SFS_FACTS = [fact for fact in OS_FACTS
+             if fact[0] in ("kernel", "arch", "hostname", "uptime",
+                            "boot_id")]
+
+# Facts changed by tests which reboot or upgrade nodes.
+MUTABLE_FACTS = ["kernel", "uptime", "boot_id", "mounts"]
+
+# NodeFacts per node, shared by all testsets for the lifetime of the run.
+# Nodes reached through another node, e.g. VMs, are keyed by
+# (via node, node), as the same name may be reached through several
+# nodes, and are not kept in the facts file as they come and go with the
+# tests.
+_FACTS_CACHE = {}
+# SFS node -> error of the sweep which could not reach it, so the run
+# does not try it again.
+_UNREACHABLE_NODES = {}
+
+
+def clear_facts_cache(nodes=None):
+    """
+    Forget cached facts so they are collected again on next use, also by
+    the testsets sharing the facts file.
+
+    Kwargs:
+        nodes (list): Nodes to forget, also when reached through another
+                      node, all nodes if None.
+    """
+    if nodes is None:
+        _FACTS_CACHE.clear()
+        _UNREACHABLE_NODES.clear()
+    for node in nodes or []:
+        for key in list(_FACTS_CACHE):
+            if key == node or isinstance(key, tuple) and key[1] == node:
+                del _FACTS_CACHE[key]
+        _UNREACHABLE_NODES.pop(node, None)
+    save_facts()
+
+
+def get_run_id():
+    """ Return the id of the run, TAF_RUN_ID or the parent process. """
+    return os.environ.get(RUN_ID_ENV) or "ppid-{0}".format(os.getppid())
+
+
+def save_facts(path=None):
+    """
+    Write the cached facts of the MS and nodes to a JSON file, stamped
+    with the run id. The file is replaced in one rename, so a testset
+    reading it at the same time never sees it half written.
+
+    Kwargs:
+        path (str): File to write, TAF_FACTS_FILE if None. Nothing is
+                    written if neither is set.
+    """
+    path = path or os.environ.get(FACTS_FILE_ENV)
+    if not path:
+        return
+    tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+    with open(tmp_path, "w") as facts_file:
+        json.dump({"run_id": get_run_id(),
+                   "facts": dict((node, node_facts.raw)
+                                 for node, node_facts in _FACTS_CACHE.items()
+                                 if not isinstance(node, tuple))},
+                  facts_file, indent=1, sort_keys=True)
+    os.rename(tmp_path, path)
+
+
+def load_facts(path=None):
+    """
+    Read facts written by save_facts into the cache. Facts already
+    cached are kept, and a file written by another run is ignored.
+
+    Kwargs:
+        path (str): File to read, TAF_FACTS_FILE if None.
+
+    Returns:
+        list. Nodes whose facts were read.
+    """
+    path = path or os.environ.get(FACTS_FILE_ENV)
+    if not path or not os.path.exists(path):
+        return []
+    with open(path) as facts_file:
+        saved = json.load(facts_file)
+    if saved.get("run_id") != get_run_id():
+        return []
+    loaded = []
+    for node, facts in saved["facts"].items():
+        if node not in _FACTS_CACHE:
+            _FACTS_CACHE[node] = NodeFacts(node, facts)
+            loaded.append(node)
+    return loaded
+
+
+class NodeFacts(object):
+    """
+    Basic OS facts of a node.
+    """
+
+    def __init__(self, node, facts):
+        """
+        Args:
+            node (str): Node the facts were collected from.
+
+            facts (dict): Fact name -> raw value.
+        """
+        self.node = node
+        self.raw = {}
+        self.update(facts)
+
+    def update(self, facts):
+        """
+        Set the given facts, keeping the others.
+
+        Args:
+            facts (dict): Fact name -> raw value.
+        """
+        self.raw.update(facts)
+        facts = self.raw
+        self.release = facts.get("release", "")
+        self.kernel = facts.get("kernel", "")
+        self.arch = facts.get("arch", "")
+        self.cmdline = facts.get("cmdline", "")
+        self.timezone = facts.get("timezone", "")
+        self.abv_timezone = facts.get("abv_timezone", "")
+        self.hostname = facts.get("hostname", "")
+        self.boot_id = facts.get("boot_id", "")
+        self.rhel_version = facts.get("rhel_version", "")
+        self.interfaces = facts.get("interfaces", "").split()
+        self.mounts = facts.get("mounts", "").split()
+        try:
+            self.uptime = float(facts.get("uptime", ""))
+        except ValueError:
+            self.uptime = None
+
+    def __repr__(self):
+        return "NodeFacts({0}: {1})".format(self.node, self.raw)
+
+
+class FactsCollector(object):
+    """
+    Collects facts of many nodes, one remote script per node with all
+    nodes swept concurrently, and caches them for the run. If
+    TAF_FACTS_FILE is set the cache is kept in that file, so later
+    testsets of the run read it instead of contacting the nodes.
+    """
+
+    def __init__(self, test):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+        """
+        self.test = test
+
+    @staticmethod
+    def get_facts_cmd(facts=None):
+        """
+        Return one script which prints every fact as "FACT:<name>=<value>".
+
+        Kwargs:
+            facts (list): (name, command) tuples, OS_FACTS if None.
+        """
+        facts = facts or OS_FACTS
+        return "; ".join("echo \"{0}{1}=$({{ {2}; }} 2>/dev/null)\"".format(
+            FACT_PREFIX, name, cmd) for name, cmd in facts)
+
+    @staticmethod
+    def parse_facts_output(stdout):
+        """
+        Parse the output of get_facts_cmd.
+
+        Returns:
+            dict. Fact name -> value.
+        """
+        facts = {}
+        for line in stdout:
+            if line.startswith(FACT_PREFIX) and "=" in line:
+                name, value = line[len(FACT_PREFIX):].split("=", 1)
+                facts[name] = value.strip()
+        return facts
+
+    def _collect_node(self, node, via_node=None, facts=None):
+        """ Collect the facts of a single node. """
+        cmd = self.get_facts_cmd(facts)
+        if via_node:
+            stdout, stderr, rc = self.test.run_command_via_node(via_node,
+                                                                node, cmd)
+        else:
+            stdout, stderr, rc = self.test.run_command(node, cmd)
+        self.test.assertEqual(0, rc)
+        self.test.assertEqual([], stderr)
+        return NodeFacts(node, self.parse_facts_output(stdout))
+
+    def _sweep_node(self, node, sfs):
+        """
+        Collect the facts of a node of a sweep. For an SFS node only the
+        SFS_FACTS are collected, and the error is returned instead of
+        raised if the node cannot be reached.
+        """
+        if not sfs:
+            return self._collect_node(node)
+        try:
+            return self._collect_node(node, facts=SFS_FACTS)
+        except Exception as err:  # pylint: disable=broad-except
+            return err
+
+    def collect(self, nodes, refresh=False, sfs_nodes=()):
+        """
+        Collect facts of the given nodes in one parallel sweep. Nodes
+        whose facts are already cached are not contacted again. SFS
+        nodes which cannot be reached are recorded and left out of the
+        result instead of failing the sweep.
+
+        Args:
+            nodes (list): Node names.
+
+        Kwargs:
+            refresh (bool): Collect again even if cached, e.g. after a
+                            reboot.
+
+            sfs_nodes (list): Nodes among nodes which are SFS nodes, of
+                              which only SFS_FACTS are collected.
+
+        Returns:
+            dict. Node -> NodeFacts.
+        """
+        if not _FACTS_CACHE:
+            load_facts()
+        todo = [node for node in nodes
+                if refresh or node not in _FACTS_CACHE and
+                node not in _UNREACHABLE_NODES]
+        if todo:
+            self.test.log("info", "Collecting OS facts from {0}"
+                          .format(", ".join(todo)))
+            results = run_in_parallel(
+                self._sweep_node,
+                [(node, node in sfs_nodes) for node in todo])
+            for node, node_facts in zip(todo, results):
+                if isinstance(node_facts, Exception):
+                    _UNREACHABLE_NODES[node] = "{0}: {1}".format(
+                        type(node_facts).__name__, node_facts)
+                    self.test.log("warning", "No facts of SFS node {0}, "
+                                  "{1}".format(node, _UNREACHABLE_NODES[node]))
+                    continue
+                _UNREACHABLE_NODES.pop(node, None)
+                _FACTS_CACHE[node] = node_facts
+            save_facts()
+        return dict((node, _FACTS_CACHE[node]) for node in nodes
+                    if node in _FACTS_CACHE)
+
+    @staticmethod
+    def get_unreachable_nodes():
+        """
+        Return the SFS nodes the sweeps of the run could not reach.
+
+        Returns:
+            dict. Node -> error.
+        """
+        return dict(_UNREACHABLE_NODES)
+
+    def sweep(self, refresh=False):
+        """
+        Collect facts of the MS, all managed nodes and the SFS nodes. The
+        first testset to call this pays for the sweep, later ones read
+        the cache. SFS nodes which cannot be reached are recorded, see
+        get_unreachable_nodes.
+
+        Returns:
+            dict. Node -> NodeFacts.
+        """
+        sfs_nodes = self.test.get_sfs_node_filenames()
+        nodes = self.test.get_management_node_filenames() + \
+            self.test.get_managed_node_filenames() + sfs_nodes
+        return self.collect(nodes, refresh=refresh, sfs_nodes=sfs_nodes)
+
+    def refresh(self, nodes, facts=None):
+        """
+        Collect selected facts again, e.g. after a test rebooted or
+        upgraded nodes, keeping the other cached facts.
+
+        Args:
+            nodes (list): Node names.
+
+        Kwargs:
+            facts (list): Fact names, MUTABLE_FACTS if None.
+
+        Returns:
+            dict. Node -> NodeFacts.
+        """
+        names = facts or MUTABLE_FACTS
+        selected = [fact for fact in OS_FACTS if fact[0] in names]
+        self.test.log("info", "Refreshing {0} facts of {1}".format(
+            ", ".join(names), ", ".join(nodes)))
+        results = run_in_parallel(self._collect_node,
+                                  [(node, None, selected) for node in nodes])
+        for node, node_facts in zip(nodes, results):
+            if node in _FACTS_CACHE:
+                _FACTS_CACHE[node].update(dict(
+                    (name, value) for name, value in node_facts.raw.items()
+                    if name in names))
+            else:
+                _FACTS_CACHE[node] = node_facts
+        save_facts()
+        return dict((node, _FACTS_CACHE[node]) for node in nodes)
+
+    def get_node_facts(self, node, via_node=None, refresh=False):
+        """
+        Return the facts of a single node, collecting them if needed.
+
+        Args:
+            node (str): Node name.
+
+        Kwargs:
+            via_node (str): Node to reach the node through, e.g. for VMs.
+
+            refresh (bool): Collect again even if cached.
+
+        Returns:
+            NodeFacts.
+        """
+        if via_node:
+            key = (via_node, node)
+            if refresh or key not in _FACTS_CACHE:
+                _FACTS_CACHE[key] = self._collect_node(node, via_node)
+            return _FACTS_CACHE[key]
+        if node not in _FACTS_CACHE and not refresh:
+            # Collect everything at once on first use.
+            self.sweep()
+        return self.collect([node], refresh=refresh)[node]
@@ -0,0 +1,179 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import base64
+import difflib
+import hashlib
+import re
+
+from shell_utils import quote, split_sections
+
+FILE_MARKER = "==>EDIT_FILE:"
+MISSING_MARKER = "==>EDIT_MISSING"
+
+
+def checksum(content):
+    """ Return the md5 of file content given as text. """
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+class EnsureLine(object):
+    """
+    Appends a line to a file unless the file already holds it.
+    """
+
+    def __init__(self, line):
+        self.line = line
+
+    def apply(self, lines):
+        """ Return the edited list of lines. """
+        if self.line in lines:
+            return lines
+        return lines + [self.line]
+
+
+class ReplaceRegex(object):
+    """
+    Replaces every match of a regular expression on each line, unless a
+    line already holds guard.
+    """
+
+    def __init__(self, pattern, replacement, guard=None):
+        """
+        Args:
+            pattern (str): Regular expression.
+
+            replacement (str): Replacement, as for re.sub.
+
+        Kwargs:
+            guard (str): Text whose presence means the edit was done
+                         already, e.g. when the replacement contains the
+                         matched text.
+        """
+        self.pattern = re.compile(pattern)
+        self.replacement = replacement
+        self.guard = guard
+
+    def apply(self, lines):
+        """ Return the edited list of lines. """
+        if self.guard and any(self.guard in line for line in lines):
+            return lines
+        return [self.pattern.sub(self.replacement, line) for line in lines]
+
+
+class InsertAfter(object):
+    """
+    Inserts lines after every line containing an anchor, unless the file
+    already holds guard.
+    """
+
+    def __init__(self, anchor, new_lines, guard=None):
+        """
+        Args:
+            anchor (str): Text of the lines to insert after.
+
+            new_lines (list): Lines to insert.
+
+        Kwargs:
+            guard (str): Text whose presence means the edit was done
+                         already, the first new line by default.
+        """
+        self.anchor = anchor
+        self.new_lines = new_lines
+        self.guard = guard or new_lines[0]
+
+    def apply(self, lines):
+        """ Return the edited list of lines. """
+        if any(self.guard in line for line in lines):
+            return lines
+        edited = []
+        for line in lines:
+            edited.append(line)
+            if self.anchor in line:
+                edited.extend(self.new_lines)
+        return edited
+
+
+def apply_edits(content, edits):
+    """
+    Apply edits to file content.
+
+    Args:
+        content (str): Current content, None for a missing file.
+
+        edits (list): EnsureLine, ReplaceRegex or InsertAfter objects.
+
+    Returns:
+        str. The target content.
+    """
+    content = content or ""
+    lines = content.splitlines()
+    for edit in edits:
+        lines = edit.apply(lines)
+    if not lines:
+        return ""
+    return "\n".join(lines) + "\n"
+
+
+class FileEditor(object):
+    """
+    Commands to fetch files from a node and to write edited content back
+    only where its checksum differs, plus dry-run diffs.
+    """
+
+    @staticmethod
+    def get_fetch_cmd(file_names):
+        """
+        Return one command printing every file base64 encoded after a
+        marker line, or a missing marker for files that do not exist.
+        """
+        return "; ".join(
+            "echo {0}; if [ -f {1} ]; then /usr/bin/base64 {1}; "
+            "else echo \"{2}\"; fi".format(quote(FILE_MARKER + file_name),
+                                           quote(file_name), MISSING_MARKER)
+            for file_name in file_names)
+
+    @staticmethod
+    def parse_fetch_output(stdout):
+        """
+        Parse the output of get_fetch_cmd.
+
+        Returns:
+            dict. File name -> content as text, None if missing.
+        """
+        contents = {}
+        for file_name, lines in split_sections(stdout, FILE_MARKER).items():
+            chunks = [line.strip() for line in lines]
+            contents[file_name] = None if MISSING_MARKER in chunks else \
+                base64.b64decode("".join(chunks)).decode("utf-8")
+        return contents
+
+    @staticmethod
+    def get_write_cmd(file_name, content):
+        """
+        Return the command writing content to a file in place, keeping its
+        owner and mode, and failing unless the written file has the
+        expected checksum.
+        """
+        return ("echo {0} | /usr/bin/base64 -d > {1}; "
+                "[ \"$(/usr/bin/md5sum < {1} | /usr/bin/cut -d' ' -f1)\" = "
+                "\"{2}\" ]; echo {3}".format(
+                    base64.b64encode(content.encode("utf-8")).decode("ascii"),
+                    quote(file_name), checksum(content),
+                    quote("written " + file_name)))
+
+    @staticmethod
+    def get_diff(file_name, old_content, new_content):
+        """ Return the unified diff of an edit as a list of lines. """
+        return [line.rstrip("\n") for line in difflib.unified_diff(
+            (old_content or "").splitlines(True),
+            new_content.splitlines(True),
+            fromfile=file_name, tofile=file_name)]
@@ -0,0 +1,78 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import copy
+
+from artifact_utils import clear_artifact_manifests
+from cobbler_utils import clear_cobbler_snapshot_cache
+from dhcp_utils import clear_dhcp_facts_cache
+from facts_utils import clear_facts_cache
+from model_index_utils import clear_model_indexes
+from repo_probe_utils import clear_probe_cache
+
+# Tag of tests which change the model, e.g. @attr('all', 'mutating').
+MUTATING_TAG = "mutating"
+
+# Deployment discovery shared by all testsets until a mutating test ends.
+_MODEL_FIXTURE = {}
+
+
+def clear_model_fixtures():
+    """
+    Forget the discovered deployment, model indexes and everything cached
+    about the nodes, which a test changing the model may have changed.
+    """
+    _MODEL_FIXTURE.clear()
+    clear_model_indexes()
+    clear_facts_cache()
+    clear_dhcp_facts_cache()
+    clear_cobbler_snapshot_cache()
+    clear_probe_cache()
+    clear_artifact_manifests()
+
+
+def is_mutating(test):
+    """ True if the running test method is tagged as mutating. """
+    method = getattr(test, test._testMethodName, None)
+    return bool(getattr(method, MUTATING_TAG, False))
+
+
+def invalidate_if_mutating(test):
+    """
+    Forget the model fixtures once the running test ends if it is tagged
+    as mutating. Call it in setUp of testsets changing the model.
+
+    Args:
+        test (GenericTest): The running test.
+    """
+    if is_mutating(test):
+        test.addCleanup(clear_model_fixtures)
+
+
+def get_model(test):
+    """
+    Return the MS, nodes and clusters of the deployment as
+    get_model_names_and_urls does, discovered once for the run. Each call
+    returns its own copy, so a test changing it does not affect others.
+    Calls answered by a cassette or synthetic deployment are not cached.
+
+    Args:
+        test (GenericTest): The running test.
+
+    Returns:
+        dict. Model names and URLs.
+    """
+    invalidate_if_mutating(test)
+    if "get_model_names_and_urls" in vars(test):
+        return test.get_model_names_and_urls()
+    if "model" not in _MODEL_FIXTURE:
+        _MODEL_FIXTURE["model"] = test.get_model_names_and_urls()
+    return copy.deepcopy(_MODEL_FIXTURE["model"])
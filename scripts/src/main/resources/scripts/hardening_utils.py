@@ -0,0 +1,282 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import os
+
+from file_edit_utils import FileEditor, apply_edits, checksum
+from parallel_utils import run_in_parallel
+
+STEP_MARKER = "==>STEP:"
+STEP_RESULT = "STEP_RESULT"
+
+# Environment variable making the hardening testsets only log the file
+# changes they would make, e.g. TAF_HARDENING_DRY_RUN=on.
+DRY_RUN_ENV = "TAF_HARDENING_DRY_RUN"
+
+
+def is_dry_run(spec=None):
+    """
+    True if spec or TAF_HARDENING_DRY_RUN asks for a dry run, any value
+    but "", "0", "off" and "false".
+    """
+    spec = spec or os.environ.get(DRY_RUN_ENV)
+    return bool(spec) and spec.lower() not in ("0", "off", "false")
+
+
+class HardeningStep(object):
+    """
+    A named hardening step: shell commands run as root on some nodes,
+    and/or declarative file edits.
+    """
+
+    def __init__(self, name, commands, nodes=None, file_edits=None):
+        """
+        Args:
+            name (str): Step name, e.g. 'set_idle_timeout'.
+
+            commands (list): Commands run in order, stopping at the first
+                             failure.
+
+        Kwargs:
+            nodes (list): Nodes the step applies to, every node if None.
+
+            file_edits (list): (file name, edit) tuples, edits from
+                               file_edit_utils applied before commands.
+        """
+        self.name = name
+        self.commands = commands
+        self.nodes = nodes
+        self.file_edits = file_edits or []
+
+    def applies_to(self, node):
+        """ True if the step is run on node. """
+        return self.nodes is None or node in self.nodes
+
+
+class StepResult(object):
+    """
+    Outcome of a HardeningStep on a node.
+    """
+
+    def __init__(self, node, step, rc, output):
+        self.node = node
+        self.step = step
+        self.rc = rc
+        self.output = output
+
+    @property
+    def passed(self):
+        """ True if every command of the step succeeded. """
+        return self.rc == 0
+
+    def __repr__(self):
+        return "{0} on {1}: rc {2}, output {3}".format(
+            self.step, self.node, self.rc, self.output)
+
+
+class HardeningEngine(object):
+    """
+    Compiles hardening steps into one remote script per node and runs the
+    scripts on all nodes in parallel.
+    """
+
+    def __init__(self, test):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+        """
+        self.test = test
+        self.steps = []
+
+    def add_step(self, name, commands, nodes=None):
+        """ Add a step, see HardeningStep. """
+        self.steps.append(HardeningStep(name, commands, nodes))
+
+    def add_edit_step(self, name, file_edits, nodes=None):
+        """
+        Add a step editing files. The target content is computed locally
+        from the current content and only files whose checksum changes
+        are written.
+
+        Args:
+            name (str): Step name.
+
+            file_edits (list): (file name, edit) tuples.
+
+        Kwargs:
+            nodes (list): Nodes the step applies to, every node if None.
+        """
+        self.steps.append(HardeningStep(name, [], nodes, file_edits))
+
+    def _get_edited_files(self, node):
+        """ Return the names of the files edited on node. """
+        return sorted(set(file_name for step in self.steps
+                          if step.applies_to(node)
+                          for file_name, _ in step.file_edits))
+
+    def _fetch_files(self, node):
+        """ Fetch the files edited on node in one call. """
+        file_names = self._get_edited_files(node)
+        if not file_names:
+            return {}
+        stdout, _, rc = self.test.run_command(
+            node, FileEditor.get_fetch_cmd(file_names), su_root=True)
+        self.test.assertEqual(0, rc)
+        return FileEditor.parse_fetch_output(stdout)
+
+    def _edit_contents(self, node, contents):
+        """
+        Apply the file edits of each step in order.
+
+        Args:
+            node (str): Node the contents were fetched from.
+
+            contents (dict): File name -> current content.
+
+        Returns:
+            list. (step, [(file name, old content, new content)]) for
+                  every step applying to node, only listing files the
+                  step changes.
+        """
+        contents = dict(contents)
+        edited = []
+        for step in self.steps:
+            if not step.applies_to(node):
+                continue
+            changes = []
+            for file_name in sorted(set(name for name, _ in
+                                        step.file_edits)):
+                old = contents.get(file_name)
+                new = apply_edits(old, [edit for name, edit in
+                                        step.file_edits
+                                        if name == file_name])
+                if checksum(old or "") != checksum(new):
+                    changes.append((file_name, old, new))
+                    contents[file_name] = new
+            edited.append((step, changes))
+        return edited
+
+    def get_script(self, node, contents=None):
+        """
+        Return the script running every step applying to node. Each step
+        runs in its own subshell so a failing step does not stop the
+        next ones, and is reported as "STEP_RESULT <name> <rc>".
+
+        Kwargs:
+            contents (dict): File name -> current content on node, needed
+                             when steps edit files.
+        """
+        steps = []
+        for step, changes in self._edit_contents(node, contents or {}):
+            commands = [FileEditor.get_write_cmd(file_name, new)
+                        for file_name, _, new in changes]
+            commands.extend(step.commands)
+            steps.append("echo \"{0}{1}\"; ( set -e; {2} ) 2>&1; "
+                         "echo \"{3} {1} $?\"".format(
+                             STEP_MARKER, step.name,
+                             "; ".join(commands) or "true", STEP_RESULT))
+        return "; ".join(steps)
+
+    def get_diffs(self, node, contents):
+        """
+        Return what the file edits would change on node, without writing.
+
+        Args:
+            node (str): Node name.
+
+            contents (dict): File name -> current content on node.
+
+        Returns:
+            list. (step name, unified diff lines) of each change.
+        """
+        return [(step.name, FileEditor.get_diff(file_name, old, new))
+                for step, changes in self._edit_contents(node, contents)
+                for file_name, old, new in changes]
+
+    def parse_script_output(self, node, stdout):
+        """
+        Parse the output of get_script.
+
+        Returns:
+            list. StepResult of each step applying to node, in step order.
+                  A step without result line has rc None.
+        """
+        rcs = {}
+        outputs = {}
+        current = None
+        for line in stdout:
+            if line.startswith(STEP_MARKER):
+                current = outputs.setdefault(line[len(STEP_MARKER):], [])
+            elif line.startswith(STEP_RESULT + " "):
+                _, name, rc = line.split()
+                rcs[name] = int(rc)
+            elif current is not None:
+                current.append(line)
+        return [StepResult(node, step.name, rcs.get(step.name),
+                           outputs.get(step.name, []))
+                for step in self.steps if step.applies_to(node)]
+
+    def _run_node(self, node):
+        """ Run the script of a node, returning its step results. """
+        script = self.get_script(node, self._fetch_files(node))
+        if not script:
+            return []
+        stdout, _, _ = self.test.run_command(node, script, su_root=True)
+        return self.parse_script_output(node, stdout)
+
+    def _diff_node(self, node):
+        """ Return the diffs of the file edits on a node. """
+        return self.get_diffs(node, self._fetch_files(node))
+
+    def dry_run(self, nodes):
+        """
+        Report what the file edits would change on each node, without
+        changing anything. Steps only running commands are not reported.
+
+        Args:
+            nodes (list): Nodes to check.
+
+        Returns:
+            dict. Node -> list of (step name, unified diff lines).
+        """
+        return dict(zip(nodes, run_in_parallel(self._diff_node,
+                                               [(node,) for node in nodes])))
+
+    def run(self, nodes):
+        """
+        Run every step on the nodes: one round trip per node, plus one to
+        fetch the edited files if any step edits files.
+
+        Args:
+            nodes (list): Nodes to harden.
+
+        Returns:
+            dict. Node -> list of StepResult.
+        """
+        for node in nodes:
+            self.test.log("info", "Applying hardening steps on {0}: {1}"
+                          .format(node, ", ".join(
+                              step.name for step in self.steps
+                              if step.applies_to(node))))
+        return dict(zip(nodes, run_in_parallel(self._run_node,
+                                               [(node,) for node in nodes])))
+
+    def assert_passed(self, results):
+        """
+        Assert that every step passed on every node.
+
+        Args:
+            results (dict): Node -> list of StepResult from run().
+        """
+        failed = [result for node in sorted(results)
+                  for result in results[node] if not result.passed]
+        self.test.assertEqual([], failed,
+                              "Hardening steps failed: {0}".format(failed))
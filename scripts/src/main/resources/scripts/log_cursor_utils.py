@@ -0,0 +1,228 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from shell_utils import quote
+
+CURSOR_PREFIX = "LOG_CURSOR"
+JOURNAL_CURSOR_PREFIX = "-- cursor: "
+
+
+def get_filter_cmd(patterns):
+    """
+    Return the command filtering new log lines in a single pass: every
+    line matching any of the fixed string patterns, or all lines if no
+    patterns are given.
+    """
+    if not patterns:
+        return "/bin/cat"
+    return "/bin/grep -F {0}".format(
+        " ".join("-e {0}".format(quote(pattern)) for pattern in patterns))
+
+
+def match_patterns(lines, patterns):
+    """
+    Match lines against several patterns in one pass.
+
+    Returns:
+        dict. Pattern -> list of lines containing it.
+    """
+    matches = dict((pattern, []) for pattern in patterns)
+    for line in lines:
+        for pattern in patterns:
+            if pattern in line:
+                matches[pattern].append(line)
+    return matches
+
+
+class LogCursor(object):
+    """
+    Remembers a position in a log file on a node and reads only the bytes
+    written after it.
+
+    The position is an (inode, byte offset) pair, so a rotation is
+    detected when the inode of the path changes; the rest of the rotated
+    file is then read from the old offset (if it is still in the same
+    directory and uncompressed) followed by the new file from its start.
+    """
+
+    def __init__(self, test, node, log_file, su_root=True):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+
+            node (str): Node holding the log.
+
+            log_file (str): Path to the log file.
+
+        Kwargs:
+            su_root (bool): Read the log as root.
+        """
+        self.test = test
+        self.node = node
+        self.log_file = log_file
+        self.su_root = su_root
+        self.inode = None
+        self.offset = 0
+        self.mark()
+
+    def _run(self, cmd):
+        """ Run a command on the node, returning stdout. """
+        stdout, stderr, rc = self.test.run_command(self.node, cmd,
+                                                   su_root=self.su_root)
+        self.test.assertEqual(0, rc)
+        self.test.assertEqual([], stderr)
+        return stdout
+
+    def _stat_cmd(self):
+        """ Command printing 'LOG_CURSOR <inode> <size>' of the log. """
+        return "echo \"{0} $(/usr/bin/stat -c '%i %s' {1})\"".format(
+            CURSOR_PREFIX, quote(self.log_file))
+
+    def _update(self, line):
+        """ Set the position from a 'LOG_CURSOR <inode> <size>' line. """
+        parts = line.split()
+        self.inode = parts[1]
+        self.offset = int(parts[2])
+
+    def mark(self):
+        """ Move the cursor to the current end of the log. """
+        self._update(self._run(self._stat_cmd())[0])
+
+    def get_read_cmd(self, patterns=None):
+        """
+        Return the script which prints the new position and the lines
+        written since the cursor, filtered by patterns.
+        """
+        log = quote(self.log_file)
+        return (
+            "set -- $(/usr/bin/stat -c '%i %s' {log}); "
+            "echo \"{prefix} $1 $2\"; "
+            "if [ \"$1\" = \"{inode}\" ] && [ \"$2\" -ge {offset} ]; then "
+            "/usr/bin/tail -c +{start} {log} | /usr/bin/head -c "
+            "$(($2 - {offset})); "
+            "else "
+            "old=$(/bin/find $(/usr/bin/dirname {log}) -maxdepth 1 "
+            "-inum {inode} 2>/dev/null | /usr/bin/head -1); "
+            "{{ [ -n \"$old\" ] && /usr/bin/tail -c +{start} \"$old\"; "
+            "/usr/bin/head -c $2 {log}; }}; "
+            "fi | {filter}; true".format(
+                log=log, prefix=CURSOR_PREFIX, inode=self.inode,
+                offset=self.offset, start=self.offset + 1,
+                filter=get_filter_cmd(patterns)))
+
+    def read(self, patterns=None):
+        """
+        Return the lines written since the cursor and advance it.
+
+        Kwargs:
+            patterns (list): Only return lines containing one of these
+                             strings, filtered on the node.
+
+        Returns:
+            list. New log lines.
+        """
+        stdout = self._run(self.get_read_cmd(patterns))
+        self._update(stdout[0])
+        return stdout[1:]
+
+    def find(self, patterns):
+        """
+        Match several patterns against the new lines in one pass and
+        advance the cursor.
+
+        Args:
+            patterns (list): Strings to look for.
+
+        Returns:
+            dict. Pattern -> list of new lines containing it.
+        """
+        return match_patterns(self.read(patterns), patterns)
+
+    def contains(self, pattern):
+        """ Return True if a new line contains pattern. """
+        return bool(self.find([pattern])[pattern])
+
+
+class JournalCursor(object):
+    """
+    Same interface as LogCursor, backed by a journald cursor.
+    """
+
+    def __init__(self, test, node, unit=None, su_root=True):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+
+            node (str): Node holding the journal.
+
+        Kwargs:
+            unit (str): Only read messages of this systemd unit.
+
+            su_root (bool): Read the journal as root.
+        """
+        self.test = test
+        self.node = node
+        self.unit = unit
+        self.su_root = su_root
+        self.cursor = None
+        self.mark()
+
+    def _journalctl(self):
+        """ Base journalctl command. """
+        cmd = "/usr/bin/journalctl --no-pager -o short --show-cursor"
+        if self.unit:
+            cmd += " -u {0}".format(quote(self.unit))
+        return cmd
+
+    def _run(self, cmd):
+        """ Run a command on the node, returning stdout. """
+        stdout, stderr, rc = self.test.run_command(self.node, cmd,
+                                                   su_root=self.su_root)
+        self.test.assertEqual(0, rc)
+        self.test.assertEqual([], stderr)
+        return stdout
+
+    def _update(self, stdout):
+        """ Take the cursor from journalctl output, return other lines. """
+        lines = []
+        for line in stdout:
+            if line.startswith(JOURNAL_CURSOR_PREFIX):
+                self.cursor = line[len(JOURNAL_CURSOR_PREFIX):].strip()
+            else:
+                lines.append(line)
+        return lines
+
+    def mark(self):
+        """ Move the cursor to the current end of the journal. """
+        self._update(self._run(self._journalctl() + " -n 1"))
+
+    def read(self, patterns=None):
+        """
+        Return the journal lines written since the cursor and advance it.
+        """
+        cmd = self._journalctl()
+        if self.cursor:
+            cmd += " --after-cursor={0}".format(quote(self.cursor))
+        if patterns:
+            # Keep the cursor line whatever the patterns.
+            patterns = list(patterns) + [JOURNAL_CURSOR_PREFIX]
+        cmd += " | {0}; true".format(get_filter_cmd(patterns))
+        lines = self._update(self._run(cmd))
+        return [line for line in lines if line.strip() and
+                not line.startswith("-- Logs begin")]
+
+    def find(self, patterns):
+        """ See LogCursor.find. """
+        return match_patterns(self.read(patterns), patterns)
+
+    def contains(self, pattern):
+        """ Return True if a new line contains pattern. """
+        return bool(self.find([pattern])[pattern])
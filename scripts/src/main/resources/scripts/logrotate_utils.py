@@ -0,0 +1,183 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from shell_utils import split_sections
+
+# Keywords which open a script section terminated by 'endscript'.
+SCRIPT_KEYWORDS = ["prerotate", "postrotate", "firstaction", "lastaction",
+                   "preremove"]
+
+# Marker printed before each file in the bulk fetch of a config directory.
+FILE_MARKER = "==>LOGROTATE_FILE:"
+
+try:
+    _STRING_TYPES = basestring  # pylint: disable=undefined-variable
+except NameError:
+    _STRING_TYPES = str
+
+
+class LogrotateRule(object):
+    """
+    A single logrotate rule block, e.g.
+        /var/log/a.log /var/log/b.log {
+            rotate 5
+            postrotate
+                /bin/kill -HUP `cat /var/run/a.pid`
+            endscript
+        }
+    """
+
+    def __init__(self, paths):
+        # Log paths the rule applies to, in the order they are listed.
+        self.paths = paths
+        # Directive keyword -> argument string ('' for flag directives).
+        self.directives = {}
+        # Script keyword -> list of stripped script lines.
+        self.scripts = {}
+
+    def has(self, directive):
+        """ Return True if the flag or directive is set in the rule. """
+        return directive in self.directives or directive in self.scripts
+
+    def get(self, directive, default=None):
+        """ Return the argument string of a directive. """
+        return self.directives.get(directive, default)
+
+
+class LogrotateConfig(object):
+    """
+    Parsed logrotate config file: global directives plus rule blocks.
+    """
+
+    def __init__(self):
+        self.globals = LogrotateRule([])
+        self.rules = []
+        self._by_paths = {}
+
+    def add_rule(self, rule):
+        """ Add a rule block and index it by its set of paths. """
+        self.rules.append(rule)
+        self._by_paths[tuple(sorted(rule.paths))] = rule
+
+    def get_rule(self, paths):
+        """
+        Return the rule block matching the given paths.
+
+        Args:
+            paths (list|str): Log paths as a list, or a LITP style comma
+                              separated string.
+
+        Returns:
+            LogrotateRule or None if no block covers exactly those paths.
+        """
+        if isinstance(paths, _STRING_TYPES):
+            paths = paths.split(",")
+        return self._by_paths.get(tuple(sorted(p.strip() for p in paths)))
+
+
+class LogrotateUtils(object):
+    """
+    Commands and parsers for logrotate configuration.
+    """
+
+    @staticmethod
+    def get_fetch_config_dir_cmd(config_dir):
+        """
+        Return a command which prints every file in a logrotate config
+        directory in one transfer, each preceded by a marker line.
+
+        Args:
+            config_dir (str): Directory to dump, e.g. /etc/logrotate.d/
+
+        Returns:
+            str. The command.
+        """
+        return ("for f in {0}/*; do [ -f \"$f\" ] || continue; "
+                "echo \"{1}$(basename \"$f\")\"; cat \"$f\"; echo; done"
+                .format(config_dir.rstrip("/"), FILE_MARKER))
+
+    @staticmethod
+    def split_config_dir_output(stdout):
+        """
+        Split the output of get_fetch_config_dir_cmd into files.
+
+        Args:
+            stdout (list): Output lines of the fetch command.
+
+        Returns:
+            dict. File name -> list of lines.
+        """
+        return split_sections(stdout, FILE_MARKER)
+
+    @staticmethod
+    def parse_config(lines):
+        """
+        Parse the lines of a logrotate config file.
+
+        Args:
+            lines (list): Lines of the config file.
+
+        Returns:
+            LogrotateConfig. Globals and rule blocks of the file.
+        """
+        config = LogrotateConfig()
+        target = config.globals
+        script = None
+
+        for line in lines:
+            line = line.strip()
+
+            if script is not None:
+                # Inside a script everything up to 'endscript' is verbatim.
+                if line == "endscript":
+                    script = None
+                else:
+                    script.append(line)
+                continue
+
+            if not line or line.startswith("#"):
+                continue
+
+            if line == "}":
+                target = config.globals
+                continue
+
+            if line.endswith("{"):
+                # A rule block header: one or more whitespace separated
+                # paths, optionally quoted.
+                paths = [p.strip("\"'") for p in line[:-1].split()]
+                target = LogrotateRule(paths)
+                config.add_rule(target)
+                continue
+
+            parts = line.split(None, 1)
+            keyword = parts[0]
+            if keyword in SCRIPT_KEYWORDS:
+                script = target.scripts.setdefault(keyword, [])
+                continue
+            target.directives[keyword] = parts[1].strip() \
+                if len(parts) > 1 else ""
+
+        return config
+
+    def parse_config_dir_output(self, stdout):
+        """
+        Parse the output of get_fetch_config_dir_cmd.
+
+        Args:
+            stdout (list): Output lines of the fetch command.
+
+        Returns:
+            dict. File name -> LogrotateConfig.
+        """
+        files = self.split_config_dir_output(stdout)
+        return dict((name, self.parse_config(lines))
+                    for name, lines in files.items())
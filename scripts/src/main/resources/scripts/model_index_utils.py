@@ -0,0 +1,249 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import bisect
+
+from model_state_utils import ModelStateUtils, split_path
+
+# ModelIndex per MS, shared by all testsets until the model changes.
+_INDEXES = {}
+
+
+def clear_model_indexes(ms_node=None):
+    """
+    Forget built indexes, e.g. after a test created or removed items.
+
+    Kwargs:
+        ms_node (str): MS whose index is forgotten, all if None.
+    """
+    if ms_node is None:
+        _INDEXES.clear()
+    else:
+        _INDEXES.pop(ms_node, None)
+
+
+def get_model_index(test, ms_node, refresh=False):
+    """
+    Return the index of the model on the MS, building it from one
+    recursive show on first use.
+
+    Args:
+        test (GenericTest): Test used to run the CLI command.
+
+        ms_node (str): The MS.
+
+    Kwargs:
+        refresh (bool): Build again even if already built.
+
+    Returns:
+        ModelIndex.
+    """
+    if refresh or ms_node not in _INDEXES:
+        _INDEXES[ms_node] = ModelIndex(
+            ModelStateUtils().get_model_items(test, ms_node))
+    return _INDEXES[ms_node]
+
+
+def _get_subtree_paths(paths, path):
+    """
+    Return the sorted paths at or below path. Paths sharing a prefix are
+    adjacent once sorted, so the subtree is found by bisection.
+    """
+    path = path.rstrip("/")
+    # '0' is the character after '/', so every path below path sorts
+    # between path + '/' and path + '0'.
+    found = paths[bisect.bisect_left(paths, path + "/"):
+                  bisect.bisect_left(paths, path + "0")]
+    index = bisect.bisect_left(paths, path)
+    if path and index < len(paths) and paths[index] == path:
+        found.insert(0, path)
+    return found
+
+
+class _TrieNode(object):
+    """ A model path segment with its child segments. """
+
+    __slots__ = ("item", "children")
+
+    def __init__(self):
+        self.item = None
+        self.children = {}
+
+
+class ModelIndex(object):
+    """
+    In-process index of every model item from one recursive show,
+    answering the find queries of GenericTest without running commands.
+    Items of each type are kept in a sorted path list, so a find scoped
+    to a path is a bisection rather than a scan of the subtree, and a
+    trie of path segments gives the children of any item.
+    """
+
+    def __init__(self, items):
+        """
+        Args:
+            items (list): ModelItem of every item, in show order, e.g.
+                          from ModelStateUtils.get_model_items.
+        """
+        self.items = {}
+        # Path -> position in show order, which finds return.
+        self.order = {}
+        # Item type -> sorted paths of the items of that type.
+        self.type_paths = {}
+        # Source path -> paths of the items inherited from it.
+        self.inherited = {}
+        self.trie = _TrieNode()
+        for position, item in enumerate(items):
+            self.items[item.path] = item
+            self.order[item.path] = position
+            self.type_paths.setdefault(item.item_type, []).append(item.path)
+            if item.source:
+                self.inherited.setdefault(item.source, []).append(item.path)
+            node = self.trie
+            for segment in split_path(item.path):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _TrieNode()
+                node = child
+            node.item = item
+        for paths in self.type_paths.values():
+            paths.sort()
+
+    def __len__(self):
+        return len(self.items)
+
+    def _in_show_order(self, paths):
+        """ Sort paths into the order of the show output. """
+        return sorted(paths, key=self.order.get)
+
+    def get_item(self, path):
+        """ Return the ModelItem at path, or None. """
+        return self.items.get(path.rstrip("/") or "/")
+
+    def get_children(self, path):
+        """ Return the paths of the direct children of an item. """
+        node = self.trie
+        for segment in split_path(path):
+            node = node.children.get(segment)
+            if node is None:
+                return []
+        return self._in_show_order(child.item.path
+                                   for child in node.children.values()
+                                   if child.item is not None)
+
+    def find_type(self, path, item_type):
+        """
+        Return the paths of the items of exactly item_type at or below
+        path, in show order.
+        """
+        return self._in_show_order(_get_subtree_paths(
+            self.type_paths.get(item_type, []), path))
+
+    def find(self, path, resource, rtn_type_children=True, find_refs=False,
+             exclude_services=False):
+        """
+        Index version of GenericTest.find.
+
+        Args:
+            path (str): Path to search below.
+
+            resource (str): Item type, e.g. 'firewall-rule'.
+
+        Kwargs:
+            rtn_type_children (bool): Return the items if True, or their
+                                      parent collections if False.
+
+            find_refs (bool): Find only 'reference-to-' items of the
+                              type, i.e. items inherited from one. Both
+                              are found if False, as GenericTest does.
+
+            exclude_services (bool): Leave out items below a 'services'
+                                     collection.
+
+        Returns:
+            list. Paths found, in show order.
+        """
+        item_types = ["reference-to-" + resource]
+        if not find_refs:
+            item_types.append(resource)
+        found = []
+        seen = set()
+        for item_path in self._in_show_order(
+                item_path for item_type in item_types
+                for item_path in _get_subtree_paths(
+                    self.type_paths.get(item_type, []), path)):
+            if exclude_services and "/services/" in item_path:
+                continue
+            if not rtn_type_children:
+                item_path = item_path.rsplit("/", 1)[0]
+            if item_path not in seen:
+                seen.add(item_path)
+                found.append(item_path)
+        return found
+
+    def find_children_of_collect(self, path, resource):
+        """
+        Index version of GenericTest.find_children_of_collect: the
+        children of every collection of resource at or below path,
+        whatever their extension type, e.g. 'eth' and 'bridge' items of
+        a 'network-interface' collection.
+
+        Returns:
+            list. Paths of the children, in show order.
+        """
+        children = []
+        for collection_type in ("collection-of-" + resource,
+                                "ref-collection-of-" + resource):
+            for collection in self.find_type(path, collection_type):
+                children.extend(self.get_children(collection))
+        return self._in_show_order(children)
+
+    def get_source(self, path):
+        """
+        Return the path of the item an inherited item was inherited from,
+        following chains of inheritance, or path itself if the item is
+        not inherited.
+        """
+        seen = set()
+        item = self.get_item(path)
+        while item is not None and item.source and item.path not in seen:
+            seen.add(item.path)
+            path = item.source
+            item = self.get_item(path)
+        return path
+
+    def get_inherited(self, source):
+        """ Return the paths of the items inherited from source. """
+        return self._in_show_order(self.inherited.get(source, []))
+
+    def get_props(self, path, filter_prop=None):
+        """
+        Return the properties of an item, with the values of inherited
+        items falling back to those of their source.
+
+        Kwargs:
+            filter_prop (str): Return only the value of this property.
+
+        Returns:
+            dict, or str if filter_prop is given, or None if there is no
+            such item.
+        """
+        item = self.get_item(path)
+        if item is None:
+            return None
+        props = {}
+        source = self.get_item(self.get_source(path))
+        if source is not None and source is not item:
+            props.update(source.properties)
+        props.update(item.properties)
+        if filter_prop:
+            return props.get(filter_prop)
+        return props
@@ -0,0 +1,113 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from xml.sax.saxutils import escape, quoteattr
+
+XML_HEADER = "<?xml version='1.0' encoding='utf-8'?>"
+XML_NAMESPACES = ('xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                  'xmlns:litp="http://www.ericsson.com/litp" '
+                  'xsi:schemaLocation="http://www.ericsson.com/litp '
+                  'litp-xml-schema/litp.xsd"')
+
+
+class ModelFragment(object):
+    """
+    Items to be created under one model collection, written out as a
+    single XML document for 'litp load'.
+    """
+
+    def __init__(self, collection_url, collection_tag):
+        """
+        Args:
+            collection_url (str): Collection the items are created in,
+                                  e.g. '/software/items'.
+
+            collection_tag (str): XML tag of the collection as in a
+                                  'litp export' of its parent, e.g.
+                                  'software-items-collection'.
+        """
+        self.collection_url = collection_url.rstrip("/")
+        self.collection_tag = collection_tag
+        # (item id, item type, properties dict), in creation order.
+        self.items = []
+
+    @property
+    def parent_url(self):
+        """ Path the fragment is loaded into. """
+        return self.collection_url.rsplit("/", 1)[0] or "/"
+
+    @property
+    def collection_id(self):
+        """ Name of the collection under its parent. """
+        return self.collection_url.rsplit("/", 1)[1]
+
+    def get_item_url(self, item_id):
+        """ Return the model path of an item of the fragment. """
+        return "{0}/{1}".format(self.collection_url, item_id)
+
+    def add_item(self, url, item_type, props):
+        """
+        Add an item to the fragment.
+
+        Args:
+            url (str): Path of the item, a direct child of the collection.
+
+            item_type (str): Item type, e.g. 'test-config'.
+
+            props (dict): Property name -> value.
+        """
+        parent, item_id = url.rstrip("/").rsplit("/", 1)
+        if parent != self.collection_url:
+            raise ValueError("{0} is not a child of {1}".format(
+                url, self.collection_url))
+        self.items.append((item_id, item_type, dict(props)))
+
+    def to_xml(self):
+        """
+        Return the fragment as a list of XML lines.
+        """
+        lines = [XML_HEADER,
+                 "<litp:{0} {1} id={2}>".format(self.collection_tag,
+                                                XML_NAMESPACES,
+                                                quoteattr(self.collection_id))]
+        for item_id, item_type, props in self.items:
+            lines.append("  <litp:{0} id={1}>".format(item_type,
+                                                      quoteattr(item_id)))
+            for name in sorted(props):
+                lines.append("    <{0}>{1}</{0}>".format(
+                    name, escape(str(props[name]))))
+            lines.append("  </litp:{0}>".format(item_type))
+        lines.append("</litp:{0}>".format(self.collection_tag))
+        return lines
+
+    def load(self, test, ms_node, file_path, args="--merge"):
+        """
+        Write the fragment to the MS and apply it with one 'litp load'.
+        The file is removed from the MS when the test ends.
+
+        Args:
+            test (GenericTest): Test used to run the commands.
+
+            ms_node (str): The MS.
+
+            file_path (str): Path of the XML file on the MS.
+
+        Kwargs:
+            args (str): Extra load arguments, merging into the model by
+                        default.
+        """
+        test.assertTrue(test.create_file_on_node(ms_node, file_path,
+                                                 self.to_xml()))
+        test.del_file_after_run(ms_node, file_path)
+        _, stderr, rc = test.execute_cli_load_cmd(ms_node, self.parent_url,
+                                                  file_path, args)
+        test.assertEqual([], stderr)
+        test.assertEqual(0, rc)
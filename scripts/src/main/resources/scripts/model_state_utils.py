@@ -0,0 +1,184 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+APPLIED_STATE = "Applied"
+# Suffix 'litp show' adds to properties holding their default value.
+DEFAULT_VALUE_MARK = " [*]"
+
+
+def split_path(path):
+    """ Return the segments of a model path, e.g. ['ms', 'services']. """
+    return [segment for segment in path.split("/") if segment]
+
+
+class PathTrie(object):
+    """
+    Prefix trie of model paths answering "is this path at or below any of
+    the added paths" in time proportional to the path depth.
+    """
+
+    def __init__(self, paths=None):
+        """
+        Kwargs:
+            paths (list): Paths to add.
+        """
+        self.root = {}
+        self.is_empty = True
+        for path in paths or []:
+            self.add(path)
+
+    def add(self, path):
+        """ Add a path, covering its whole subtree. """
+        node = self.root
+        for segment in split_path(path):
+            node = node.setdefault(segment, {})
+        # An empty dict marks the end of an added path.
+        node[None] = {}
+        self.is_empty = False
+
+    def covers(self, path):
+        """ True if path is an added path or lies below one. """
+        node = self.root
+        if None in node:
+            return True
+        for segment in split_path(path):
+            node = node.get(segment)
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+
+class ModelItem(object):
+    """
+    Path, type, state and properties of a model item from a recursive
+    show, and the path it was inherited from if it is inherited.
+    """
+
+    def __init__(self, path, item_type=None, state=None, properties=None,
+                 source=None):
+        self.path = path
+        self.item_type = item_type
+        self.state = state
+        self.properties = properties or {}
+        self.source = source
+
+    def __repr__(self):
+        return "{0} ({1}): {2}".format(self.path, self.item_type, self.state)
+
+
+class ModelStateUtils(object):
+    """
+    Reads the state of every model item from one recursive 'litp show'.
+    """
+
+    @staticmethod
+    def parse_show_output(stdout):
+        """
+        Parse the output of 'litp show -p <path> -r'. Item paths are the
+        lines holding a single absolute path, followed by their indented
+        'inherited from:', 'type:' and 'state:' lines and a 'properties:'
+        block.
+
+        Returns:
+            list. ModelItem of every item, in output order.
+        """
+        items = []
+        current = None
+        in_properties = False
+        for line in stdout:
+            stripped = line.strip()
+            if stripped.startswith("/") and " " not in stripped:
+                current = ModelItem(stripped.rstrip("/") or "/")
+                items.append(current)
+                in_properties = False
+                continue
+            if current is None or ":" not in stripped:
+                continue
+            key, _, value = stripped.partition(":")
+            value = value.strip()
+            if key == "properties" and not value:
+                in_properties = True
+            elif in_properties:
+                if value.endswith(DEFAULT_VALUE_MARK):
+                    value = value[:-len(DEFAULT_VALUE_MARK)]
+                current.properties[key] = value
+            elif key == "inherited from" and current.source is None:
+                current.source = value.rstrip("/")
+            elif key == "type" and current.item_type is None:
+                current.item_type = value
+            elif key == "state" and current.state is None:
+                # e.g. 'Applied' or 'Applied (deprecated)'
+                current.state = value.split()[0] if value else value
+        return items
+
+    @staticmethod
+    def index_by_path(items):
+        """ Return a dict of item path -> ModelItem. """
+        return dict((item.path, item) for item in items)
+
+    @staticmethod
+    def get_unapplied_items(items, ignore_types=None, ignore_paths=None,
+                            skip_types=None):
+        """
+        Filter items down to those not in Applied state.
+
+        Args:
+            items (list): ModelItem from parse_show_output.
+
+        Kwargs:
+            ignore_types (list): Item types whose whole subtree is ignored,
+                                 e.g. ['upgrade'].
+
+            ignore_paths (list): Paths whose whole subtree is ignored.
+
+            skip_types (list): Item types which are ignored themselves,
+                               while the items below them are still
+                               checked, e.g. ['deployment'].
+
+        Returns:
+            list. ModelItem of every item not Applied.
+        """
+        ignored = PathTrie(ignore_paths)
+        ignore_types = set(ignore_types or [])
+        skip_types = set(skip_types or [])
+        for item in items:
+            if item.item_type in ignore_types:
+                ignored.add(item.path)
+        unapplied = [item for item in items
+                     if item.state != APPLIED_STATE and
+                     item.item_type not in skip_types]
+        if ignored.is_empty:
+            return unapplied
+        return [item for item in unapplied if not ignored.covers(item.path)]
+
+    def get_model_items(self, test, ms_node, path="/"):
+        """
+        Fetch path, type, state and properties of every item under path
+        with a single recursive show.
+
+        Args:
+            test (GenericTest): Test used to run the CLI command.
+
+            ms_node (str): The MS.
+
+        Kwargs:
+            path (str): Root of the subtree to read.
+
+        Returns:
+            list. ModelItem of every item.
+        """
+        stdout, stderr, rc = test.execute_cli_show_cmd(ms_node, path,
+                                                       args="-r")
+        test.assertEqual(0, rc)
+        test.assertEqual([], stderr)
+        return self.parse_show_output(stdout)
@@ -0,0 +1,74 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import sys
+import threading
+
+# Upper bound on worker threads used by run_in_parallel.
+DEFAULT_MAX_WORKERS = 16
+
+
+def run_in_parallel(func, args_list, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Call func once per entry of args_list on a pool of threads.
+
+    Intended for fanning out one remote call per node, so each worker
+    talks to a different host. Exceptions (including assertion errors)
+    raised by a worker are re-raised in the caller once all workers are
+    done, so test failures keep their original type and message.
+
+    Args:
+        func (callable): Function to call.
+
+        args_list (list): One tuple of positional args per call.
+
+    Kwargs:
+        max_workers (int): Maximum number of concurrent threads.
+
+    Returns:
+        list. Return values of func, in the same order as args_list.
+    """
+    args_list = list(args_list)
+    results = [None] * len(args_list)
+    errors = []
+    lock = threading.Lock()
+    pending = list(range(len(args_list)))
+
+    def worker():
+        """ Take calls off the pending list until it is empty. """
+        while True:
+            with lock:
+                if not pending:
+                    return
+                idx = pending.pop(0)
+            try:
+                results[idx] = func(*args_list[idx])
+            except Exception:  # pylint: disable=broad-except
+                with lock:
+                    errors.append((idx, sys.exc_info()))
+
+    if len(args_list) == 1:
+        return [func(*args_list[0])]
+
+    threads = [threading.Thread(target=worker)
+               for _ in range(min(max_workers, len(args_list)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        # Re-raise the error of the earliest call for a stable report.
+        _, exc_info = sorted(errors, key=lambda err: err[0])[0]
+        raise exc_info[1]
+
+    return results
@@ -0,0 +1,216 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import threading
+import time
+
+from parallel_utils import run_in_parallel
+
+# Boot phases a node passes through, in order.
+STAGE_PING = "ping"
+STAGE_SSH = "ssh"
+STAGE_SYSTEMD = "systemd"
+STAGE_PUPPET = "puppet"
+STAGE_MCO = "mco"
+STAGES = [STAGE_PING, STAGE_SSH, STAGE_SYSTEMD, STAGE_PUPPET, STAGE_MCO]
+
+# States of 'systemctl is-system-running' of a booted node. A degraded
+# node has finished booting with some unit failed, which the service
+# checks of the testsets report.
+BOOTED_SYSTEM_STATES = ["running", "degraded"]
+
+# Lock file held by the puppet agent while it applies a catalog.
+PUPPET_RUN_LOCKS = ["/var/lib/puppet/state/agent_catalog_run.lock",
+                    "/opt/puppetlabs/puppet/cache/state/"
+                    "agent_catalog_run.lock"]
+
+
+class NodeReadiness(object):
+    """
+    Boot phase timings of a node seen by a ReadinessGate.
+    """
+
+    def __init__(self, node):
+        self.node = node
+        # Stage -> seconds from the start of the gate until it passed.
+        self.timings = {}
+        self.failed_stage = None
+
+    @property
+    def ready(self):
+        """ True if the node passed every stage. """
+        return self.failed_stage is None and \
+            all(stage in self.timings for stage in STAGES)
+
+    @property
+    def ready_after(self):
+        """ Seconds until the node was ready, None if it never was. """
+        return self.timings.get(STAGE_MCO) if self.ready else None
+
+    def __repr__(self):
+        return "NodeReadiness({0}: {1}{2})".format(
+            self.node, ", ".join("{0} {1:.0f}s".format(stage,
+                                                        self.timings[stage])
+                                 for stage in STAGES
+                                 if stage in self.timings),
+            ", stuck at {0}".format(self.failed_stage)
+            if self.failed_stage else "")
+
+
+class ReadinessGate(object):
+    """
+    Waits for rebooted nodes to be ready, watching all nodes concurrently.
+    Each node goes through staged probes: ICMP and SSH banner from the MS,
+    'systemctl is-system-running' and an idle puppet agent on the node,
+    then 'mco ping' from the MS. Probes run on the MS one at a time, as
+    the watchers of all nodes share its connection. A probe which fails
+    to connect, e.g. to a node still rebooting, counts as not passed.
+    """
+
+    def __init__(self, test, ms_node):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+
+            ms_node (str): The MS, probing the nodes from the outside.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self._ms_lock = threading.Lock()
+
+    @staticmethod
+    def get_ping_cmd(address):
+        """ Command checking the node answers one ICMP echo. """
+        ping = "/bin/ping6" if ":" in address else "/bin/ping"
+        return "{0} -c 1 -W 2 {1}".format(ping, address)
+
+    @staticmethod
+    def get_ssh_banner_cmd(address):
+        """ Command printing the SSH banner of the node. """
+        return ("/usr/bin/timeout 5 /bin/bash -c "
+                "'exec 3<>/dev/tcp/{0}/22 && /usr/bin/head -1 <&3'"
+                .format(address))
+
+    @staticmethod
+    def get_node_state_cmd():
+        """
+        Command run on the node printing the systemd state and whether the
+        puppet agent is applying a catalog.
+        """
+        return ("echo \"systemd=$(/usr/bin/systemctl is-system-running)\"; "
+                "busy=no; for lock in {0}; do [ -e \"$lock\" ] && busy=yes; "
+                "done; echo \"puppet_busy=$busy\"".format(
+                    " ".join(PUPPET_RUN_LOCKS)))
+
+    @staticmethod
+    def parse_node_state_output(stdout):
+        """
+        Parse the output of get_node_state_cmd.
+
+        Returns:
+            dict. 'systemd' -> system state, 'puppet_busy' -> yes or no.
+        """
+        return dict(line.strip().split("=", 1) for line in stdout
+                    if "=" in line)
+
+    def _probe_ms(self, cmd):
+        """ Run a probe on the MS, returning (stdout, passed). """
+        with self._ms_lock:
+            stdout, _, rc = self.test.run_command(self.ms_node, cmd)
+        return stdout, rc == 0
+
+    def _try_probe(self, stage, node, address, hostname):
+        """ Probe as _probe does, counting errors as not passed. """
+        try:
+            return self._probe(stage, node, address, hostname)
+        except Exception as error:  # pylint: disable=broad-except
+            self.test.log("info", "{0} probe of {1} failed: {2}".format(
+                stage, node, error))
+            return False
+
+    def _probe(self, stage, node, address, hostname):
+        """ Return True if the node passes stage now. """
+        if stage == STAGE_PING:
+            return self._probe_ms(self.get_ping_cmd(address))[1]
+        if stage == STAGE_SSH:
+            stdout, passed = self._probe_ms(self.get_ssh_banner_cmd(address))
+            return passed and any("SSH" in line for line in stdout)
+        if stage == STAGE_MCO:
+            stdout, passed = self._probe_ms(
+                "/usr/bin/mco ping -I {0}".format(hostname))
+            return passed and any(line.split() and
+                                  line.split()[0] == hostname
+                                  for line in stdout)
+        stdout, _, rc = self.test.run_command(node,
+                                              self.get_node_state_cmd())
+        state = self.parse_node_state_output(stdout)
+        if stage == STAGE_SYSTEMD:
+            return rc == 0 and state.get("systemd") in BOOTED_SYSTEM_STATES
+        return rc == 0 and state.get("puppet_busy") == "no"
+
+    def _watch_node(self, node, start, deadline, interval):
+        """ Walk one node through all stages until ready or deadline. """
+        readiness = NodeReadiness(node)
+        address = self.test.get_node_att(node, "ipv4")
+        hostname = self.test.get_node_att(node, "hostname")
+        for stage in STAGES:
+            while not self._try_probe(stage, node, address, hostname):
+                if time.time() > deadline:
+                    readiness.failed_stage = stage
+                    return readiness
+                time.sleep(interval)
+            readiness.timings[stage] = time.time() - start
+        return readiness
+
+    def wait(self, nodes, timeout_mins=30, interval=10):
+        """
+        Wait until every node passed every stage, returning as soon as the
+        last node is ready.
+
+        Args:
+            nodes (list): Node filenames.
+
+        Kwargs:
+            timeout_mins (int): Give up on nodes not ready by then.
+
+            interval (int): Seconds between two probes of a node.
+
+        Returns:
+            dict. Node -> NodeReadiness.
+        """
+        start = time.time()
+        deadline = start + timeout_mins * 60
+        results = run_in_parallel(self._watch_node,
+                                  [(node, start, deadline, interval)
+                                   for node in nodes])
+        readiness = dict(zip(nodes, results))
+        for node in nodes:
+            self.test.log("info", "Readiness of {0}".format(readiness[node]))
+        ready = [node for node in nodes if readiness[node].ready]
+        if ready:
+            slowest = max(ready, key=lambda node: readiness[node].ready_after)
+            self.test.log("info", "Slowest node {0} ready after {1:.0f}s"
+                          .format(slowest, readiness[slowest].ready_after))
+        return readiness
+
+    def assert_ready(self, nodes, timeout_mins=30, interval=10):
+        """
+        Wait for nodes as wait() does and assert they all became ready.
+
+        Returns:
+            dict. Node -> NodeReadiness.
+        """
+        readiness = self.wait(nodes, timeout_mins, interval)
+        not_ready = [readiness[node] for node in nodes
+                     if not readiness[node].ready]
+        self.test.assertEqual([], not_ready,
+                              "Nodes not ready: {0}".format(not_ready))
+        return readiness
@@ -0,0 +1,184 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from parallel_utils import run_in_parallel
+from shell_utils import quote
+
+# Probe kinds.
+# A yum repository: base URL (http(s):// or file://) holding repodata.
+PROBE_REPO = "repo"
+# A plain URL, e.g. a vm-image source_uri, checked without downloading it.
+PROBE_URL = "url"
+# A directory on the probing node.
+PROBE_DIR = "dir"
+
+REPOMD_PATH = "repodata/repomd.xml"
+RESULT_PREFIX = "PROBE_RESULT"
+
+# Successful results shared by every RepoProbe for the lifetime of the
+# run, keyed by (node, kind, target). Failed probes are not cached, so a
+# target which comes up later is probed again.
+_PROBE_CACHE = {}
+
+
+def clear_probe_cache():
+    """ Forget all cached probe results, e.g. after repos are changed. """
+    _PROBE_CACHE.clear()
+
+
+def get_probe_cmd(kind, target):
+    """
+    Return the shell test for a single probe. The test exits 0 when the
+    target is reachable.
+
+    Args:
+        kind (str): One of PROBE_REPO, PROBE_URL or PROBE_DIR.
+
+        target (str): URL or path to probe.
+
+    Returns:
+        str. The command.
+    """
+    if kind == PROBE_DIR:
+        return "[ -d {0} ]".format(quote(target))
+
+    if kind == PROBE_REPO:
+        if target.startswith("file://"):
+            # Local repositories only need to exist on the node.
+            return "[ -d {0} ]".format(quote(target[len("file://"):]))
+        url = "{0}/{1}".format(target.rstrip("/"), REPOMD_PATH)
+        return "/usr/bin/curl -s -f -o /dev/null {0}".format(quote(url))
+
+    return "/usr/bin/curl -s -f -I -o /dev/null {0}".format(quote(target))
+
+
+def get_batch_probe_cmd(probes):
+    """
+    Return one script which runs every probe in order and reports the
+    exit code of each as "PROBE_RESULT <index> <rc>".
+
+    Args:
+        probes (list): (kind, target) tuples.
+
+    Returns:
+        str. The script.
+    """
+    lines = ["{0}; echo \"{1} {2} $?\"".format(get_probe_cmd(kind, target),
+                                               RESULT_PREFIX, idx)
+             for idx, (kind, target) in enumerate(probes)]
+    return "; ".join(lines)
+
+
+def parse_batch_probe_output(stdout, count):
+    """
+    Parse the output of get_batch_probe_cmd.
+
+    Args:
+        stdout (list): Output lines of the script.
+
+        count (int): Number of probes in the script.
+
+    Returns:
+        list. True/False per probe, in script order. Probes with no result
+        line are reported as unreachable.
+    """
+    results = [False] * count
+    for line in stdout:
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == RESULT_PREFIX:
+            idx = int(parts[1])
+            if idx < count:
+                results[idx] = parts[2] == "0"
+    return results
+
+
+class RepoProbe(object):
+    """
+    Checks reachability of yum repositories and URLs from nodes.
+
+    Probes are deduplicated by (node, kind, target), run as one script per
+    node with the nodes probed concurrently, and successful ones cached
+    for the run so that several testsets asking about the same repository
+    share a single remote check.
+    """
+
+    def __init__(self, test):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+        """
+        self.test = test
+
+    def _probe_node(self, node, probes, via_node):
+        """ Run all probes for one node in a single remote call. """
+        cmd = get_batch_probe_cmd(probes)
+        if via_node:
+            stdout, _, _ = self.test.run_command_via_node(via_node, node,
+                                                          cmd)
+        else:
+            stdout, _, _ = self.test.run_command(node, cmd)
+        return parse_batch_probe_output(stdout, len(probes))
+
+    def probe(self, requests, via_nodes=None):
+        """
+        Probe a set of targets, reusing cached results where possible.
+
+        Args:
+            requests (list): (node, kind, target) tuples.
+
+        Kwargs:
+            via_nodes (dict): node -> host to reach the node through, for
+                              nodes such as VMs which are only reachable
+                              via another node.
+
+        Returns:
+            dict. (node, kind, target) -> True if reachable.
+        """
+        via_nodes = via_nodes or {}
+        per_node = {}
+        for request in requests:
+            if request in _PROBE_CACHE:
+                continue
+            node, kind, target = request
+            probes = per_node.setdefault(node, [])
+            if (kind, target) not in probes:
+                probes.append((kind, target))
+
+        nodes = sorted(per_node)
+        results = []
+        if nodes:
+            self.test.log("info", "Probing {0} repositories/URLs on {1}"
+                          .format(sum(len(p) for p in per_node.values()),
+                                  ", ".join(nodes)))
+            results = run_in_parallel(
+                self._probe_node,
+                [(node, per_node[node], via_nodes.get(node))
+                 for node in nodes])
+        found = {}
+        for node, node_results in zip(nodes, results):
+            for (kind, target), result in zip(per_node[node], node_results):
+                found[(node, kind, target)] = result
+                if result:
+                    _PROBE_CACHE[(node, kind, target)] = result
+
+        return dict((request, _PROBE_CACHE.get(request, found.get(request)))
+                    for request in requests)
+
+    def is_reachable(self, node, kind, target, via_node=None):
+        """
+        Probe a single target. Prefer probe() when checking many targets.
+
+        Returns:
+            bool. True if the target is reachable from the node.
+        """
+        via_nodes = {node: via_node} if via_node else None
+        request = (node, kind, target)
+        return self.probe([request], via_nodes=via_nodes)[request]
@@ -0,0 +1,186 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from parallel_utils import run_in_parallel
+from shell_utils import split_sections
+
+# systemd unit properties collected for every unit.
+UNIT_PROPERTIES = ["Id", "LoadState", "UnitFileState", "ActiveState",
+                   "SubState", "MainPID", "ExecMainStartTimestamp",
+                   "NRestarts"]
+
+UNIT_MARKER = "==>UNIT:"
+
+
+def unit_name(service):
+    """ Return the systemd unit name of a service, e.g. ntpd.service. """
+    if "." in service:
+        return service
+    return service + ".service"
+
+
+class ServiceState(object):
+    """
+    State of a systemd unit on a node.
+    """
+
+    def __init__(self, service, props):
+        """
+        Args:
+            service (str): Service name as requested, e.g. 'ntpd'.
+
+            props (dict): Property -> value from 'systemctl show'.
+        """
+        self.service = service
+        self.props = props
+        self.unit = props.get("Id", unit_name(service))
+        self.loaded = props.get("LoadState") == "loaded"
+        self.enabled = props.get("UnitFileState") == "enabled"
+        self.active_state = props.get("ActiveState", "")
+        self.sub_state = props.get("SubState", "")
+        self.start_timestamp = props.get("ExecMainStartTimestamp", "")
+        try:
+            self.main_pid = int(props.get("MainPID", "0"))
+        except ValueError:
+            self.main_pid = 0
+        # NRestarts is only reported by newer systemd versions.
+        try:
+            self.restarts = int(props["NRestarts"])
+        except (KeyError, ValueError):
+            self.restarts = None
+
+    @property
+    def running(self):
+        """ True if the unit is active, as 'service <name> status' is. """
+        return self.active_state == "active"
+
+    def is_flapping(self, max_restarts):
+        """ True if systemd restarted the unit more than max_restarts. """
+        return self.restarts is not None and self.restarts > max_restarts
+
+    def __repr__(self):
+        return "ServiceState({0}: {1}/{2}, pid {3}, restarts {4})".format(
+            self.unit, self.active_state, self.sub_state, self.main_pid,
+            self.restarts)
+
+
+class ServiceStateCollector(object):
+    """
+    Collects the state of many services on a node with a single
+    'systemctl show' call.
+    """
+
+    def __init__(self, test):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+        """
+        self.test = test
+
+    @staticmethod
+    def get_show_units_cmd(services):
+        """
+        Return one command showing the state of all services. Each unit's
+        properties are preceded by a marker line naming the service.
+        """
+        return "; ".join(
+            "echo \"{0}{1}\"; /usr/bin/systemctl show {2} {3}".format(
+                UNIT_MARKER, service,
+                " ".join("-p " + prop for prop in UNIT_PROPERTIES),
+                unit_name(service))
+            for service in services)
+
+    @staticmethod
+    def parse_show_units_output(stdout):
+        """
+        Parse the output of get_show_units_cmd.
+
+        Returns:
+            dict. Service -> ServiceState.
+        """
+        states = {}
+        for service, lines in split_sections(stdout, UNIT_MARKER).items():
+            unit_props = dict((name.strip(), value.strip())
+                              for name, value in (line.split("=", 1)
+                                                  for line in lines
+                                                  if "=" in line))
+            states[service] = ServiceState(service, unit_props)
+        return states
+
+    def collect(self, node, services, via_node=None):
+        """
+        Collect the state of services on a node in one call.
+
+        Args:
+            node (str): Node name.
+
+            services (list): Service names.
+
+        Kwargs:
+            via_node (str): Node to reach the node through, e.g. for VMs.
+
+        Returns:
+            dict. Service -> ServiceState.
+        """
+        services = sorted(set(services))
+        if not services:
+            return {}
+        cmd = self.get_show_units_cmd(services)
+        if via_node:
+            stdout, stderr, rc = self.test.run_command_via_node(via_node,
+                                                                node, cmd)
+        else:
+            stdout, stderr, rc = self.test.run_command(node, cmd)
+        self.test.assertEqual(0, rc)
+        self.test.assertEqual([], stderr)
+        return self.parse_show_units_output(stdout)
+
+    def collect_many(self, node_services):
+        """
+        Collect the state of services on many nodes concurrently.
+
+        Args:
+            node_services (dict): Node -> list of service names.
+
+        Returns:
+            dict. Node -> dict of service -> ServiceState.
+        """
+        nodes = sorted(node_services)
+        results = run_in_parallel(self.collect,
+                                  [(node, node_services[node])
+                                   for node in nodes])
+        return dict(zip(nodes, results))
+
+    def assert_running(self, node, states, services=None):
+        """
+        Assert that services are running, reporting restarts of any
+        service systemd had to restart.
+
+        Args:
+            node (str): Node the states were collected on.
+
+            states (dict): Service -> ServiceState from collect().
+
+        Kwargs:
+            services (list): Services to check, all in states if None.
+        """
+        for service in services or sorted(states):
+            self.test.assertTrue(service in states,
+                                 "No state collected for {0} on {1}"
+                                 .format(service, node))
+            state = states[service]
+            self.test.assertTrue(state.running,
+                                 "Service {0} is not running on {1}: {2}"
+                                 .format(service, node, state))
+            if state.restarts:
+                self.test.log("info", "Service {0} on {1} has been "
+                              "restarted {2} times".format(
+                                  service, node, state.restarts))
@@ -0,0 +1,46 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+try:
+    _STRING_TYPES = basestring  # pylint: disable=undefined-variable
+except NameError:
+    _STRING_TYPES = str
+
+
+def quote(value):
+    """ Single quote a value for use in a shell command. """
+    if not isinstance(value, _STRING_TYPES):
+        value = str(value)
+    return "'{0}'".format(value.replace("'", "'\\''"))
+
+
+def split_sections(stdout, marker):
+    """
+    Split the output of a batched command whose parts each start with a
+    "<marker><name>" line, e.g. "==>DHCP_FILE:/etc/dhcp/dhcpd.conf".
+
+    Args:
+        stdout (list): Output lines of the command.
+
+        marker (str): Prefix of the lines starting a section.
+
+    Returns:
+        dict. Section name -> lines of the section. Lines before the first
+        marker are dropped.
+    """
+    sections = {}
+    current = None
+    for line in stdout:
+        if line.startswith(marker):
+            current = sections.setdefault(line[len(marker):], [])
+        elif current is not None:
+            current.append(line)
+    return sections
@@ -0,0 +1,244 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import sys
+import time
+
+from async_utils import reraise
+from shell_utils import quote
+
+STREAM_PREFIX = "==>STREAM:"
+STREAM_RC_PREFIX = "==>STREAM_RC:"
+
+# Lines fetched per round trip.
+DEFAULT_CHUNK_LINES = 5000
+
+
+class RemoteStream(object):
+    """
+    Output of a remote command read as it is produced, a chunk of lines
+    per round trip, instead of buffered whole by run_command.
+
+    The command runs in the background on the node, in its own process
+    group, writing stdout and stderr to a temporary file. Reading stops
+    when the command ends, when the consumer stops iterating, e.g. once a
+    matcher is satisfied, after max_lines lines or after timeout seconds.
+    The command, with every process it started, is then killed and the
+    file removed.
+    """
+
+    def __init__(self, test, node, cmd, su_root=False,
+                 chunk_lines=DEFAULT_CHUNK_LINES, max_lines=None,
+                 timeout=None, poll_interval=1):
+        """
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+
+            node (str): Node to run the command on.
+
+            cmd (str): Command to stream, e.g. '/usr/bin/tail -F <log>'.
+
+        Kwargs:
+            su_root (bool): Run the command as root.
+
+            chunk_lines (int): Maximum lines fetched per round trip, and
+                               so held in memory at once.
+
+            max_lines (int): Stop after reading this many lines.
+
+            timeout (float): Stop after this many seconds.
+
+            poll_interval (float): Seconds between two reads while the
+                                   command produces no new lines.
+        """
+        self.test = test
+        self.node = node
+        self.cmd = cmd
+        self.su_root = su_root
+        self.chunk_lines = chunk_lines
+        self.max_lines = max_lines
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.out_file = None
+        self.pid = None
+        # Bytes of the output file read so far.
+        self.offset = 0
+        self.lines_read = 0
+        # Exit code of the command, None unless it ended on its own.
+        self.rc = None
+        self.truncated = False
+        self.timed_out = False
+
+    def _run(self, cmd):
+        """ Run a command on the node, returning stdout. """
+        stdout, stderr, rc = self.test.run_command(self.node, cmd,
+                                                   su_root=self.su_root)
+        self.test.assertEqual(0, rc)
+        self.test.assertEqual([], stderr)
+        return stdout
+
+    def get_start_cmd(self):
+        """
+        Return the command starting the stream in the background, which
+        prints "==>STREAM:<output file> <pid>". Output goes through awk
+        flushing each line, so the file only ever holds whole lines, and
+        the exit code file appears once all output is written.
+        """
+        script = ("{{ ( {0}\n); echo $? > \"$0.rc.tmp\"; }} 2>&1 | "
+                  "/bin/awk '{{ print; fflush() }}'; "
+                  "/bin/mv \"$0.rc.tmp\" \"$0.rc\"".format(self.cmd))
+        return ("out=$(/bin/mktemp /tmp/taf_stream.XXXXXX); "
+                "/usr/bin/nohup /usr/bin/setsid /bin/sh -c {0} \"$out\" "
+                "> \"$out\" 2>&1 < /dev/null & "
+                "echo \"{1}$out $!\"".format(quote(script), STREAM_PREFIX))
+
+    def get_read_cmd(self):
+        """
+        Return the command printing up to chunk_lines lines from the
+        current byte offset, then "==>STREAM_RC:<rc> <bytes read>", with
+        rc empty while the command runs. The exit code is read first, so
+        when it is set, every line was written before the read. Only the
+        lines read are scanned, however large the output already is.
+        """
+        return ("rc=$(/bin/cat {out}.rc 2>/dev/null); "
+                "chunk=$(/usr/bin/tail -c +{start} {out} | "
+                "/usr/bin/head -n {lines}; echo x); chunk=${{chunk%x}}; "
+                "printf '%s' \"$chunk\"; "
+                "echo \"{prefix}$rc $(printf '%s' \"$chunk\" | "
+                "/usr/bin/wc -c)\"".format(out=self.out_file,
+                                            start=self.offset + 1,
+                                            lines=self.chunk_lines,
+                                            prefix=STREAM_RC_PREFIX))
+
+    def get_close_cmd(self):
+        """ Return the command killing the stream and removing its files. """
+        return ("kill -TERM -- -{pid} 2>/dev/null || "
+                "kill -TERM {pid} 2>/dev/null; "
+                "/bin/rm -f {out} {out}.rc {out}.rc.tmp; true".format(
+                    pid=self.pid, out=self.out_file))
+
+    def start(self):
+        """ Start the command on the node. """
+        for line in self._run(self.get_start_cmd()):
+            if line.startswith(STREAM_PREFIX):
+                self.out_file, self.pid = line[len(STREAM_PREFIX):].split()
+
+    def _read_chunk(self):
+        """ Return (lines, rc) of the next chunk, rc None while running. """
+        stdout = self._run(self.get_read_cmd())
+        rc, size = stdout[-1][len(STREAM_RC_PREFIX):].rsplit(" ", 1)
+        self.offset += int(size)
+        return stdout[:-1], int(rc) if rc.strip() else None
+
+    def close(self):
+        """ Stop the command if still running and remove its output. """
+        if self.out_file:
+            self._run(self.get_close_cmd())
+            self.out_file = None
+
+    def lines(self):
+        """
+        Yield the output lines of the command as they arrive. Breaking out
+        of the loop closes the stream. A failure to close after an error
+        is logged, so the error itself is what the test reports.
+        """
+        if not self.out_file:
+            self.start()
+        try:
+            for line in self._read_lines():
+                yield line
+        except GeneratorExit:
+            self.close()
+            raise
+        except BaseException:
+            exc_info = sys.exc_info()
+            try:
+                self.close()
+            except Exception as error:  # pylint: disable=broad-except
+                self.test.log("error", "Failed to close the stream of {0} "
+                              "on {1}: {2}".format(self.cmd, self.node,
+                                                   error))
+            reraise(exc_info)
+        self.close()
+
+    def _read_lines(self):
+        """ Yield the output lines until the command or reading ends. """
+        deadline = time.time() + self.timeout if self.timeout else None
+        while True:
+            chunk, rc = self._read_chunk()
+            for line in chunk:
+                if self.max_lines and self.lines_read >= self.max_lines:
+                    self.truncated = True
+                    return
+                self.lines_read += 1
+                yield line
+            if len(chunk) == self.chunk_lines:
+                continue
+            if rc is not None:
+                self.rc = rc
+                return
+            if deadline and time.time() > deadline:
+                self.timed_out = True
+                return
+            time.sleep(self.poll_interval)
+
+    def __iter__(self):
+        return self.lines()
+
+    def find_each(self, patterns):
+        """
+        Read until every pattern was seen in a line, or the output ends.
+
+        Args:
+            patterns (list): Strings to look for.
+
+        Returns:
+            dict. Pattern -> first line containing it, None if none did.
+        """
+        found = dict((pattern, None) for pattern in patterns)
+        missing = set(patterns)
+        if not missing:
+            return found
+        lines = self.lines()
+        try:
+            for line in lines:
+                for pattern in [pattern for pattern in missing
+                                if pattern in line]:
+                    found[pattern] = line
+                    missing.discard(pattern)
+                if not missing:
+                    break
+        finally:
+            lines.close()
+        return found
+
+    def find_first(self, matcher):
+        """
+        Read until a line satisfies matcher, or the output ends.
+
+        Args:
+            matcher (str|callable): String the line contains, or function
+                                    taking a line and returning a bool.
+
+        Returns:
+            str. The first matching line, None if no line matched.
+        """
+        if not callable(matcher):
+            pattern = matcher
+            matcher = lambda line: pattern in line
+        lines = self.lines()
+        try:
+            for line in lines:
+                if matcher(line):
+                    return line
+        finally:
+            lines.close()
+        return None
@@ -0,0 +1,1207 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Synthetic LITP deployments of any size for scale testing: a
+            generated model tree and node fixtures, served to a testset by
+            a local stand-in for the MS and nodes instead of a vApp.
+
+Usage:
+    TAF_SYNTHETIC_DEPLOYMENT="clusters=10,nodes=10" to run testsets
+    calling use_synthetic_deployment() against a generated deployment,
+    or the path of a JSON fixture written by:
+    python synthetic_deployment_utils.py clusters=10,nodes=10 out.json
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import uuid
+
+from facts_utils import FACT_PREFIX
+from model_state_utils import APPLIED_STATE, ModelItem
+from repo_probe_utils import RESULT_PREFIX as PROBE_RESULT_PREFIX
+from service_utils import UNIT_MARKER
+from stream_utils import STREAM_PREFIX, STREAM_RC_PREFIX
+
+# Environment variable holding a ScaleProfile string or a fixture path.
+SYNTHETIC_DEPLOYMENT_ENV = "TAF_SYNTHETIC_DEPLOYMENT"
+
+# GenericTest methods answered by the stand-in.
+EMULATED_METHODS = ["run_command", "run_command_via_node", "find",
+                    "get_props_from_url", "get_file_contents",
+                    "remote_path_exists", "get_model_names_and_urls",
+                    "execute_cli_show_cmd", "get_node_att",
+                    "get_node_filename_from_url",
+                    "get_management_node_filename",
+                    "get_management_node_filenames",
+                    "get_managed_node_filenames",
+                    "get_sfs_node_filenames", "add_vm_to_nodelist",
+                    "run_vcs_hastatus_sum_command",
+                    "run_vcs_hares_display_command",
+                    "run_vcs_hagrp_display_command",
+                    "get_timezone_on_node", "is_ip_pingable"]
+
+MS_NAME = "ms1"
+ETC_HOSTS = "/etc/hosts"
+# Where the MS serves the VM images and the nodes keep them and the VM
+# instances, as in test_constants.
+MS_WEB_ROOT = "/var/www/html"
+VM_IMAGE_MS_DIR = MS_WEB_ROOT + "/images"
+LIBVIRT_IMAGE_DIR = "/var/lib/libvirt/images"
+LIBVIRT_INSTANCES_DIR = "/var/lib/libvirt/instances"
+ADAPTOR_VERSION = "2.1.5"
+
+# Ports opened by default by the linuxfirewall plugin, as in
+# testset_firewall.py.
+DEFAULT_FW_PORTS = [("tcp", "8140,8139,9999"),
+                    ("tcp", "4369,9100,9101,9102,9103,9104,9105,61614"),
+                    ("udp", "123"), ("tcp", "80"), ("tcp", "22")]
+MS_DEFAULT_FW_PORTS = [("tcp", "443"), ("tcp", "8140,8139,9999"),
+                       ("tcp", "4369,9100,9101,9102,9103,9104,9105,"
+                               "61613,61614"),
+                       ("udp", "123"), ("tcp", "80"), ("udp", "67,68,69"),
+                       ("tcp", "22")]
+
+# Generated deployments per profile string, shared by all testsets.
+_DEPLOYMENTS = {}
+
+
+def _get_fw_numbers(start, count):
+    """
+    Return count numbers from start usable as generated rule ports and
+    name prefixes: testset_firewall matches rules to iptables lines by
+    substring, so no number, also with the "1" prefix of OUTPUT rule
+    names, may hold a default port.
+    """
+    default_ports = set(port for _, ports in DEFAULT_FW_PORTS +
+                        MS_DEFAULT_FW_PORTS for port in ports.split(","))
+    numbers = []
+    number = start
+    while len(numbers) < count:
+        if not any(port in "1{0}".format(number) for port in default_ports):
+            numbers.append(number)
+        number += 1
+    return numbers
+
+
+def _get_reference_type(item_type):
+    """ Return the type shown for an item inherited from item_type. """
+    if item_type.startswith("collection-of-"):
+        return "ref-" + item_type
+    if item_type.startswith(("reference-to-", "ref-collection-of-")):
+        return item_type
+    return "reference-to-" + item_type
+
+
+class SyntheticDeploymentError(Exception):
+    """
+    Raised when a synthetic deployment is requested for a test which is
+    connected to a real deployment.
+    """
+    pass
+
+
+def clear_synthetic_deployments():
+    """ Forget the generated deployments. """
+    _DEPLOYMENTS.clear()
+
+
+class ScaleProfile(object):
+    """
+    Size of a synthetic deployment: N clusters of M nodes, and how many
+    items of each kind every MS, cluster or node gets.
+    """
+
+    # Field -> default count.
+    FIELDS = [("clusters", 1), ("nodes", 2), ("fw_rules", 5),
+              ("file_systems", 3), ("vm_services", 1), ("aliases", 5),
+              ("packages", 10)]
+
+    def __init__(self, **counts):
+        """
+        Kwargs:
+            clusters (int): Number of clusters.
+
+            nodes (int): Nodes per cluster.
+
+            fw_rules (int): Firewall rules of the MS, of each cluster and
+                            of each node.
+
+            file_systems (int): File systems of each storage profile.
+
+            vm_services (int): VM service groups of each cluster.
+
+            aliases (int): Aliases of each node.
+
+            packages (int): Packages of each node.
+        """
+        unknown = set(counts) - set(name for name, _ in self.FIELDS)
+        if unknown:
+            raise ValueError("Unknown scale profile fields: {0}".format(
+                ", ".join(sorted(unknown))))
+        for name, default in self.FIELDS:
+            setattr(self, name, int(counts.get(name, default)))
+
+    @classmethod
+    def from_string(cls, profile):
+        """ Build a profile from e.g. "clusters=10,nodes=10". """
+        return cls(**dict(field.strip().split("=", 1)
+                          for field in profile.split(",") if field.strip()))
+
+    def __str__(self):
+        return ",".join("{0}={1}".format(name, getattr(self, name))
+                        for name, _ in self.FIELDS)
+
+
+class SyntheticNode(object):
+    """
+    Fixture of a node: what the stand-in answers for commands run on it.
+    """
+
+    def __init__(self, name, hostname, url, ipv4, cluster_url=None):
+        self.name = name
+        self.hostname = hostname
+        self.url = url
+        self.ipv4 = ipv4
+        self.cluster_url = cluster_url
+        # Fact name of facts_utils -> value.
+        self.facts = {}
+        # Path -> list of lines.
+        self.files = {}
+        self.packages = []
+        self.iptables = []
+        self.ip6tables = []
+        # (device, mount point, size) of the file systems.
+        self.file_systems = []
+        # Service name -> True if running.
+        self.services = {}
+        # VM name -> (cpus, max memory in KiB) of the libvirt domains.
+        self.domains = {}
+        # (device, ipv4, mac) of the network interfaces.
+        self.interfaces = []
+
+    def to_dict(self):
+        """ Return the fixture as JSON serializable data. """
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Rebuild a fixture from to_dict() data. """
+        node = cls(data["name"], data["hostname"], data["url"],
+                   data["ipv4"], data.get("cluster_url"))
+        node.__dict__.update(data)
+        node.file_systems = [tuple(fs) for fs in node.file_systems]
+        node.interfaces = [tuple(nic) for nic in node.interfaces]
+        node.domains = dict((name, tuple(domain))
+                            for name, domain in node.domains.items())
+        return node
+
+
+# A '| grep X' stage of a command, without options.
+_GREP_STAGE = re.compile(r"^(/bin/)?grep ([^-\s]\S*)$")
+
+
+def _pipe_filter(stdout, greps):
+    """ Apply the '| grep X' stages of a command to its output. """
+    for grep in greps:
+        stdout = [line for line in stdout if grep in line]
+    return stdout
+
+
+class SyntheticDeployment(object):
+    """
+    Local stand-in for the MS and nodes of a deployment: answers model
+    queries from an in-memory model tree and the commands run on nodes
+    from their fixtures. Commands it does not know fail with rc 127 so
+    the testsets show where they need more of the deployment.
+    """
+
+    def __init__(self):
+        # Path -> ModelItem, in creation order.
+        self.items = {}
+        self.paths = []
+        # Node name -> SyntheticNode, the MS first.
+        self.nodes = {}
+        self.node_names = []
+        self.cluster_urls = []
+        # (host node name, VM hostname) -> SyntheticNode of the VMs, which
+        # are reached through the node hosting them.
+        self.vms = {}
+        # (compiled regex, handler(node, match) -> (stdout, stderr, rc)).
+        self.handlers = []
+        # Output file -> (stdout, rc) of the RemoteStream commands.
+        self.streams = {}
+        self.add_command_handler(FACT_PREFIX, self._answer_facts)
+        self.add_command_handler(r"^/sbin/(ip6?tables) -t (\w+) -S$",
+                                 self._answer_iptables)
+        self.add_command_handler(r"^(/bin/)?cat '?([^'\s]+)'?$",
+                                 self._answer_cat)
+        self.add_command_handler(r"^(/bin/)?hostname$",
+                                 lambda node, _: ([node.hostname], [], 0))
+        self.add_command_handler(r"^(/bin/)?rpm -qa$",
+                                 lambda node, _: (list(node.packages), [],
+                                                  0))
+        self.add_command_handler(r"^(/bin/)?df( -\w+)*$", self._answer_df)
+        self.add_command_handler(r"^(/bin/)?mount$", self._answer_mount)
+        self.add_command_handler(r"^/sbin/lvscan$", self._answer_lvscan)
+        self.add_command_handler(r"^/usr/bin/mco ping$", self._answer_mco)
+        self.add_command_handler(r"/bin/sh -c '\{ \( (.*)\n\); echo",
+                                 self._start_stream)
+        self.add_command_handler(r"tail -c \+(\d+) (\S+) \| "
+                                 r"/usr/bin/head -n (\d+)",
+                                 self._read_stream)
+        self.add_command_handler(r"/bin/rm -f (/tmp/taf_stream\S+)",
+                                 self._remove_stream)
+        self.add_command_handler(r"^/usr/bin/md5sum (\S+)$",
+                                 self._answer_md5sum)
+        self.add_command_handler(UNIT_MARKER, self._answer_units)
+        self.add_command_handler(PROBE_RESULT_PREFIX, self._answer_probes)
+        self.add_command_handler(r"^/bin/rpm -q ([^|]+)$",
+                                 self._answer_rpm_query)
+        self.add_command_handler(r"^/sbin/service (\S+) status$",
+                                 self._answer_service_status)
+        self.add_command_handler(r"^/sbin/chkconfig --list (\S+)$",
+                                 self._answer_chkconfig)
+        self.add_command_handler(r"^/usr/bin/virsh dominfo (\S+)$",
+                                 self._answer_dominfo)
+        self.add_command_handler(r"^/sbin/ifconfig( -a)?( (\w+))?$",
+                                 self._answer_ifconfig)
+        self.add_command_handler(r"^/sbin/ifconfig \| grep -E '\^(\w+) ",
+                                 self._answer_ifconfig_header)
+
+    def add_command_handler(self, pattern, handler):
+        """
+        Answer commands matching a regular expression, taking precedence
+        over handlers added before.
+
+        Args:
+            pattern (str): Regular expression searched in the command,
+                           '| grep X' stages excluded.
+
+            handler (function): Called with the SyntheticNode and the
+                                match, returns (stdout, stderr, rc).
+        """
+        self.handlers.insert(0, (re.compile(pattern), handler))
+
+    def add_item(self, path, item_type, properties=None):
+        """ Add a model item, returning it. """
+        item = ModelItem(path, item_type, APPLIED_STATE,
+                         dict(properties or {}))
+        if path not in self.items:
+            self.paths.append(path)
+        self.items[path] = item
+        return item
+
+    def inherit(self, source, path):
+        """
+        Add a copy of the subtree at source below path, whose items have
+        the reference types LITP shows for inherited items.
+        """
+        for source_path in self._subtree(source):
+            item = self.items[source_path]
+            self.add_item(path + source_path[len(source):],
+                          _get_reference_type(item.item_type),
+                          item.properties).source = source_path
+
+    def add_node(self, node):
+        """ Add a node fixture. """
+        self.nodes[node.name] = node
+        self.node_names.append(node.name)
+
+    def _subtree(self, path):
+        """ Return the paths at and below path, in creation order. """
+        prefix = path.rstrip("/") + "/"
+        return [item_path for item_path in self.paths
+                if item_path == path or item_path.startswith(prefix)]
+
+    # Model queries, with the signatures of GenericTest.
+
+    def find(self, node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, find_refs=False,
+             exclude_services=False):
+        """
+        Return the paths of items of type resource below path, or of
+        their parent collections if rtn_type_children is False. Items
+        inherited from one are found too, or only them if find_refs.
+        """
+        item_types = ["reference-to-" + resource]
+        if not find_refs:
+            item_types.append(resource)
+        found = []
+        for item_path in self._subtree(path):
+            if self.items[item_path].item_type not in item_types:
+                continue
+            if exclude_services and "/services/" in item_path:
+                continue
+            if not rtn_type_children:
+                item_path = item_path.rsplit("/", 1)[0]
+            if item_path not in found:
+                found.append(item_path)
+        if assert_not_empty and not found:
+            raise AssertionError("No {0} found below {1} on {2}".format(
+                resource, path, node))
+        return found
+
+    def get_props_from_url(self, node, url, filter_prop=None, **kwargs):
+        """
+        Return the properties of an item, or the value of filter_prop.
+        """
+        item = self.items.get(url)
+        if item is None:
+            return None
+        if filter_prop:
+            return item.properties.get(filter_prop)
+        return dict(item.properties)
+
+    def execute_cli_show_cmd(self, node, url, args="", **kwargs):
+        """ Return the output of 'litp show -p url args'. """
+        if url not in self.items:
+            return [], ["InvalidLocationError    Not found"], 1
+        paths = self._subtree(url) if "-r" in args.split() else [url]
+        stdout = []
+        for path in paths:
+            item = self.items[path]
+            stdout.append(path)
+            if item.source:
+                stdout.append("    inherited from: {0}".format(item.source))
+            stdout.extend(["    type: {0}".format(item.item_type),
+                           "    state: {0}".format(item.state),
+                           "    properties:"])
+            stdout.extend("        {0}: {1}".format(name, value)
+                          for name, value in sorted(item.properties.items()))
+        return stdout, [], 0
+
+    def _node_entry(self, node):
+        """ Return the get_model_names_and_urls entry of a node. """
+        return {"name": node.name, "url": node.url,
+                "hostname": node.hostname}
+
+    def get_model_names_and_urls(self):
+        """ Return the MS, nodes and clusters as GenericTest does. """
+        managed = [self.nodes[name] for name in self.node_names[1:]]
+        return {"ms": [self._node_entry(self.nodes[self.node_names[0]])],
+                "nodes": [self._node_entry(node) for node in managed],
+                "clusters": [{"url": url,
+                              "nodes": [self._node_entry(node)
+                                        for node in managed
+                                        if node.cluster_url == url]}
+                             for url in self.cluster_urls]}
+
+    def get_management_node_filename(self):
+        """ Return the name of the MS. """
+        return self.node_names[0]
+
+    def get_management_node_filenames(self):
+        """ Return the name of the MS as a list. """
+        return self.node_names[:1]
+
+    def get_managed_node_filenames(self):
+        """ Return the names of the managed nodes. """
+        return self.node_names[1:]
+
+    @staticmethod
+    def get_sfs_node_filenames():
+        """ Return the names of the SFS nodes, none are emulated. """
+        return []
+
+    def get_node_att(self, node, attribute):
+        """ Return 'ipv4' or 'hostname' of a node. """
+        return getattr(self.nodes[node], attribute)
+
+    def get_node_filename_from_url(self, node, url):
+        """ Return the name of the node modelled at url. """
+        for name in self.node_names:
+            if self.nodes[name].url == url:
+                return name
+        return None
+
+    # Commands run on the nodes.
+
+    def run_command(self, node, cmd, su_root=False, **kwargs):
+        """ Return (stdout, stderr, rc) of cmd on a node fixture. """
+        if node not in self.nodes:
+            return [], ["Unknown node {0}".format(node)], 255
+        return self._run_on(self.nodes[node], cmd)
+
+    def _run_on(self, fixture, cmd):
+        """ Return (stdout, stderr, rc) of cmd on a node or VM fixture. """
+        stages = [stage.strip() for stage in cmd.split("|")]
+        greps = [match.group(2).strip("'\"") for match in
+                 [_GREP_STAGE.match(stage) for stage in stages[1:]]
+                 if match]
+        base = stages[0] if len(greps) == len(stages) - 1 else cmd
+        for pattern, handler in self.handlers:
+            match = pattern.search(base)
+            if match:
+                stdout, stderr, rc = handler(fixture, match)
+                if greps:
+                    stdout = _pipe_filter(stdout, greps)
+                    rc = rc or (0 if stdout else 1)
+                return stdout, stderr, rc
+        return [], ["synthetic deployment: command not emulated: {0}"
+                    .format(cmd)], 127
+
+    def run_command_via_node(self, via_node, node, cmd, **kwargs):
+        """ Run cmd on node, e.g. a VM hosted by via_node. """
+        vm = self.vms.get((via_node, node))
+        if vm is None:
+            return self.run_command(node, cmd)
+        return self._run_on(vm, cmd)
+
+    def add_vm_to_nodelist(self, hostname, ipv4, username, password,
+                           ipv6=None, **kwargs):
+        """ Check a VM fixture answers for hostname at ipv4. """
+        if not any(vm.hostname == hostname and vm.ipv4 == ipv4
+                   for vm in self.vms.values()):
+            raise AssertionError("No VM {0} at {1} in the synthetic "
+                                 "deployment".format(hostname, ipv4))
+
+    def get_timezone_on_node(self, node, via_node=None, **kwargs):
+        """ Return the timezone of a node or VM fixture. """
+        fixture = self.vms.get((via_node, node)) or self.nodes[node]
+        return fixture.facts.get("timezone", "")
+
+    def is_ip_pingable(self, node, ip_address, **kwargs):
+        """ True if a node or VM fixture has the address. """
+        return any(ip_address == fixture.ipv4 or
+                   ip_address in [nic[1] for nic in fixture.interfaces]
+                   for fixture in list(self.nodes.values()) +
+                   list(self.vms.values()))
+
+    # VCS queries, with the signatures and parsed results of GenericTest.
+
+    def _get_vcs_groups(self, node):
+        """
+        Return the VCS service groups of the cluster of a node, named as
+        VCSUtils names them, e.g. Grp_CS_c1_cs_vm0.
+
+        Returns:
+            list. Dicts of 'group', 'states', a list of (system, online)
+            tuples, and 'resources', resource name -> attribute -> value.
+        """
+        cluster_url = self.nodes[node].cluster_url
+        if not cluster_url:
+            return []
+        cluster_id = cluster_url.rsplit("/", 1)[-1]
+        groups = []
+        for path in self.find(node, cluster_url, "vcs-clustered-service",
+                              assert_not_empty=False):
+            props = self.items[path].properties
+            active = int(props.get("active", "1"))
+            states = [(self.get_node_filename_from_url(
+                node, "{0}/nodes/{1}".format(cluster_url, node_id)),
+                       index < active)
+                      for index, node_id in
+                      enumerate(props["node_list"].split(","))]
+            resources = {}
+            for app in self.find(node, path, "vm-service",
+                                 assert_not_empty=False):
+                resources["Res_App_{0}_{1}_{2}".format(
+                    cluster_id, props["name"], app.rsplit("/", 1)[-1])] = {
+                        "OnlineTimeout": props.get("online_timeout", ""),
+                        "OfflineTimeout": props.get("offline_timeout", ""),
+                        "CleanProgram": self.items[app].properties.get(
+                            "cleanup_command", "")}
+            groups.append({"group": "Grp_CS_{0}_{1}".format(
+                cluster_id, path.rsplit("/", 1)[-1]),
+                           "states": states, "resources": resources})
+        return groups
+
+    def run_vcs_hastatus_sum_command(self, node, **kwargs):
+        """ Return the parsed 'hastatus -sum' of the node's cluster. """
+        return {"SERVICE_GROUPS": [
+            {"GROUP": group["group"], "SYSTEM": system, "PROBED": "Y",
+             "AUTODISABLED": "N",
+             "STATE": "ONLINE" if online else "OFFLINE"}
+            for group in self._get_vcs_groups(node)
+            for system, online in group["states"]]}
+
+    def run_vcs_hagrp_display_command(self, node, group_name, attribute="",
+                                      **kwargs):
+        """ Return the parsed 'hagrp -display' of a service group. """
+        for group in self._get_vcs_groups(node):
+            if group["group"] == group_name:
+                return {"State": [
+                    {"SYSTEM": system,
+                     "VALUE": "|ONLINE|" if online else "|OFFLINE|"}
+                    for system, online in group["states"]]}
+        return {}
+
+    def run_vcs_hares_display_command(self, node, resource, attribute="",
+                                      **kwargs):
+        """ Return the parsed 'hares -display' of a resource. """
+        for group in self._get_vcs_groups(node):
+            if resource in group["resources"]:
+                return dict((name, [{"SYSTEM": "global", "VALUE": value}])
+                            for name, value in
+                            group["resources"][resource].items())
+        return {}
+
+    def get_file_contents(self, node, path, su_root=False,
+                          assert_not_empty=True, **kwargs):
+        """ Return the lines of a file of a node fixture. """
+        lines = self.nodes[node].files.get(path, [])
+        if assert_not_empty and not lines:
+            raise AssertionError("{0} is empty or missing on {1}".format(
+                path, node))
+        return list(lines)
+
+    def remote_path_exists(self, node, path, expect_file=True,
+                           su_root=False, **kwargs):
+        """ True if a node fixture holds the file. """
+        if expect_file:
+            return path in self.nodes[node].files
+        prefix = path.rstrip("/") + "/"
+        return any(file_path.startswith(prefix)
+                   for file_path in self.nodes[node].files)
+
+    @staticmethod
+    def _answer_facts(node, _):
+        """ Answer a FactsCollector script. """
+        return ["{0}{1}={2}".format(FACT_PREFIX, name, node.facts[name])
+                for name in sorted(node.facts)], [], 0
+
+    @staticmethod
+    def _answer_iptables(node, match):
+        """ Answer 'iptables -S' with the rules of the filter table. """
+        if match.group(2) != "filter":
+            return [], [], 0
+        return list(getattr(node, match.group(1))), [], 0
+
+    @staticmethod
+    def _answer_cat(node, match):
+        """ Answer 'cat' of a file. """
+        path = match.group(2)
+        if path not in node.files:
+            return [], ["cat: {0}: No such file or directory".format(
+                path)], 1
+        return list(node.files[path]), [], 0
+
+    @staticmethod
+    def _answer_df(node, _):
+        """ Answer 'df' with the file systems. """
+        return ["Filesystem Size Used Avail Use% Mounted on"] + \
+            ["{0} {1} 33M {1} 4% {2}".format(device, size, mount)
+             for device, mount, size in node.file_systems], [], 0
+
+    @staticmethod
+    def _answer_mount(node, _):
+        """ Answer 'mount' with the file systems. """
+        return ["{0} on {1} type ext4 (rw,relatime)".format(device, mount)
+                for device, mount, _ in node.file_systems], [], 0
+
+    @staticmethod
+    def _answer_lvscan(node, _):
+        """ Answer 'lvscan' with the logical volumes. """
+        return ["  ACTIVE            '{0}' [{1}] inherit".format(
+            device.replace("/mapper/", "/").replace("-", "/", 1), size)
+                for device, _, size in node.file_systems], [], 0
+
+    def _start_stream(self, node, match):
+        """ Answer the start of a RemoteStream, running its command. """
+        cmd = match.group(1).replace("'\\''", "'")
+        stdout, stderr, rc = self._run_on(node, cmd)
+        out_file = "/tmp/taf_stream.{0}".format(len(self.streams))
+        self.streams[out_file] = (stdout + stderr, rc)
+        return ["{0}{1} 1".format(STREAM_PREFIX, out_file)], [], 0
+
+    def _read_stream(self, node, match):
+        """ Answer a RemoteStream read from a byte offset. """
+        stdout, rc = self.streams[match.group(2)]
+        offset = 0
+        chunk = []
+        for line in stdout:
+            if offset >= int(match.group(1)) - 1:
+                chunk.append(line)
+                if len(chunk) == int(match.group(3)):
+                    break
+            offset += len(line.encode("utf-8")) + 1
+        return chunk + ["{0}{1} {2}".format(
+            STREAM_RC_PREFIX, rc, sum(len(line.encode("utf-8")) + 1
+                                      for line in chunk))], [], 0
+
+    def _remove_stream(self, node, match):
+        """ Answer the removal of a RemoteStream output file. """
+        self.streams.pop(match.group(1), None)
+        return [], [], 0
+
+    @staticmethod
+    def _answer_md5sum(node, match):
+        """ Answer 'md5sum' of a file. """
+        path = match.group(1)
+        if path not in node.files:
+            return [], ["/usr/bin/md5sum: {0}: No such file or "
+                        "directory".format(path)], 1
+        return ["{0}  {1}".format(hashlib.md5("\n".join(
+            node.files[path]).encode("utf-8")).hexdigest(), path)], [], 0
+
+    @staticmethod
+    def _answer_units(node, match):
+        """ Answer a ServiceStateCollector 'systemctl show' script. """
+        stdout = []
+        for service in re.findall(re.escape(UNIT_MARKER) + r'([^"]+)"',
+                                  match.string):
+            stdout.append(UNIT_MARKER + service)
+            unit = service if "." in service else service + ".service"
+            if service not in node.services:
+                stdout.extend(["Id={0}".format(unit), "LoadState=not-found",
+                               "ActiveState=inactive", "SubState=dead"])
+                continue
+            running = node.services[service]
+            stdout.extend(["Id={0}".format(unit), "LoadState=loaded",
+                           "UnitFileState=enabled",
+                           "ActiveState={0}".format(
+                               "active" if running else "inactive"),
+                           "SubState={0}".format(
+                               "running" if running else "dead"),
+                           "MainPID={0}".format(1234 if running else 0),
+                           "NRestarts=0"])
+        return stdout, [], 0
+
+    def _answer_probes(self, node, match):
+        """
+        Answer a RepoProbe script: URLs of the MS are reachable if it
+        holds the file or directory below its web root.
+        """
+        ms_files = self.nodes[self.node_names[0]].files
+        prefix = "http://{0}/".format(MS_NAME)
+        stdout = []
+        for probe, index in re.findall(
+                r"(/usr/bin/curl [^;]*|\[ -d [^\]]*\]); echo \"" +
+                PROBE_RESULT_PREFIX + r" (\d+) \$\?\"", match.string):
+            target = probe.split()[-1].strip("'")
+            if probe.startswith("["):
+                files, path = node.files, probe.split()[2].strip("'")
+            elif target.startswith(prefix):
+                files = ms_files
+                path = "{0}/{1}".format(MS_WEB_ROOT, target[len(prefix):])
+            else:
+                files, path = {}, None
+            found = path in files or any(
+                file_path.startswith(path.rstrip("/") + "/")
+                for file_path in files)
+            stdout.append("{0} {1} {2}".format(PROBE_RESULT_PREFIX, index,
+                                               0 if found else 22))
+        return stdout, [], 0
+
+    @staticmethod
+    def _answer_rpm_query(node, match):
+        """ Answer 'rpm -q' of packages. """
+        stdout = []
+        rc = 0
+        for name in match.group(1).split():
+            name = name.strip("'\"")
+            found = [package for package in node.packages
+                     if package == name or package.startswith(name + "-")]
+            if found:
+                stdout.append(found[0])
+            else:
+                stdout.append("package {0} is not installed".format(name))
+                rc = 1
+        return stdout, [], rc
+
+    @staticmethod
+    def _answer_service_status(node, match):
+        """ Answer 'service <name> status'. """
+        service = match.group(1)
+        if node.services.get(service):
+            return ["{0} (pid 1234) is running...".format(service)], [], 0
+        return ["{0} is stopped".format(service)], [], 3
+
+    @staticmethod
+    def _answer_chkconfig(node, match):
+        """ Answer 'chkconfig --list' of a service. """
+        service = match.group(1)
+        if service not in node.services:
+            return [], ["error reading information on service {0}: No such "
+                        "file or directory".format(service)], 1
+        return ["{0:<14}0:off\t1:off\t2:off\t3:on\t4:on\t5:on\t6:off"
+                .format(service)], [], 0
+
+    @staticmethod
+    def _answer_dominfo(node, match):
+        """ Answer 'virsh dominfo' of a libvirt domain. """
+        name = match.group(1)
+        if name not in node.domains:
+            return [], ["error: failed to get domain '{0}'".format(name)], 1
+        cpus, memory = node.domains[name]
+        return ["Name:           {0}".format(name),
+                "State:          running",
+                "CPU(s):         {0}".format(cpus),
+                "Max memory:     {0} KiB".format(memory),
+                "Used memory:    {0} KiB".format(memory)], [], 0
+
+    @staticmethod
+    def _answer_ifconfig(node, match):
+        """ Answer 'ifconfig' of all or one network interface. """
+        device = match.group(3)
+        stdout = []
+        for name, ipv4, mac in node.interfaces:
+            if device in (None, name):
+                stdout.extend(_get_ifconfig_lines(name, ipv4, mac))
+        if device and not stdout:
+            return [], ["{0}: error fetching interface information: Device "
+                        "not found".format(device)], 1
+        return stdout, [], 0
+
+    @staticmethod
+    def _answer_ifconfig_header(node, match):
+        """ Answer 'ifconfig' filtered on the first line of a device. """
+        for name, ipv4, mac in node.interfaces:
+            if name == match.group(1):
+                return _get_ifconfig_lines(name, ipv4, mac)[:1], [], 0
+        return [], [], 1
+
+    def _answer_mco(self, node, _):
+        """ Answer 'mco ping' with every node. """
+        return ["{0:<30} time=10.00 ms".format(self.nodes[name].hostname)
+                for name in self.node_names] + \
+            ["", "---- ping statistics ----",
+             "{0} replies max: 10.00 min: 10.00 avg: 10.00".format(
+                 len(self.node_names))], [], 0
+
+    # Fixtures.
+
+    def dump(self, path):
+        """ Write the model and node fixtures to a JSON file. """
+        with open(path, "w") as fixture_file:
+            json.dump({"items": [[item_path, self.items[item_path].item_type,
+                                  self.items[item_path].properties,
+                                  self.items[item_path].source]
+                                 for item_path in self.paths],
+                       "clusters": self.cluster_urls,
+                       "nodes": [self.nodes[name].to_dict()
+                                 for name in self.node_names],
+                       "vms": [[host, vm.to_dict()] for (host, _), vm in
+                               sorted(self.vms.items())]},
+                      fixture_file, indent=1, sort_keys=True)
+
+    @classmethod
+    def load(cls, path):
+        """ Read a deployment written by dump(). """
+        with open(path) as fixture_file:
+            data = json.load(fixture_file)
+        deployment = cls()
+        for entry in data["items"]:
+            item_path, item_type, properties = entry[:3]
+            deployment.add_item(item_path, item_type, properties).source = \
+                entry[3] if len(entry) > 3 else None
+        deployment.cluster_urls = data["clusters"]
+        for node in data["nodes"]:
+            deployment.add_node(SyntheticNode.from_dict(node))
+        for host, vm in data.get("vms", []):
+            vm = SyntheticNode.from_dict(vm)
+            deployment.vms[(host, vm.name)] = vm
+        return deployment
+
+
+def _get_ifconfig_lines(device, ipv4, mac):
+    """ Return the RHEL 7 'ifconfig' lines of a network interface. """
+    return ["{0}: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500"
+            .format(device),
+            "        inet {0}  netmask 255.255.255.0  broadcast {1}.255"
+            .format(ipv4, ipv4.rsplit(".", 1)[0]),
+            "        ether {0}  txqueuelen 1000  (Ethernet)".format(mac), ""]
+
+
+def _get_iptables_lines(rules, default_ports, version):
+    """
+    Return 'iptables -S' lines of the default and modelled rules as the
+    linuxfirewall plugin writes them.
+
+    Args:
+        rules (list): Properties of the firewall-rule items.
+
+        default_ports (list): (proto, ports) opened by default.
+
+        version (str): 'ipv4' or 'ipv6'.
+    """
+    lines = ["-P INPUT ACCEPT", "-P FORWARD ACCEPT", "-P OUTPUT ACCEPT"]
+    rules = [dict(rule) for rule in rules] + \
+        [{"name": "0{0:02d} default {1}".format(index, proto),
+          "proto": proto, "dport": ports, "action": "accept"}
+         for index, (proto, ports) in enumerate(default_ports, 10)]
+    for chain, prefix in (("INPUT", ""), ("OUTPUT", "1")):
+        for rule in rules:
+            if rule.get("provider", "iptables" if version == "ipv4"
+                        else "ip6tables") != \
+                    ("iptables" if version == "ipv4" else "ip6tables"):
+                continue
+            lines.append("-A {0} -p {1} -m multiport --dports {2} -m comment "
+                         "--comment \"{3}{4} {5}\" -m state --state NEW "
+                         "-j {6}".format(chain, rule["proto"],
+                                         rule["dport"].replace("-", ":"),
+                                         prefix, rule["name"], version,
+                                         rule["action"].upper()))
+        lines.append("-A {0} -m comment --comment \"{1}999 drop all {2}\" "
+                     "-j DROP".format(chain, prefix, version))
+    return lines
+
+
+class SyntheticModelGenerator(object):
+    """
+    Generates a SyntheticDeployment from a ScaleProfile: MS, clusters,
+    nodes, firewall rules, storage profiles with file systems, VM service
+    groups with their network interfaces, aliases and packages, plus the
+    matching node and VM fixtures.
+    """
+
+    def __init__(self, profile):
+        """
+        Args:
+            profile (ScaleProfile): Size of the deployment.
+        """
+        self.profile = profile
+        self.deployment = SyntheticDeployment()
+
+    def _add_fw_rules(self, config_url, config_type, tag, port_base):
+        """
+        Add a firewall config and its rules, returning their props. The
+        rule names are made of a number and tag, which holds no digits.
+        """
+        deployment = self.deployment
+        deployment.add_item(config_url, config_type, {"drop_all": "true"})
+        rules = []
+        for index, (number, port) in enumerate(zip(
+                _get_fw_numbers(100, self.profile.fw_rules),
+                _get_fw_numbers(port_base, self.profile.fw_rules))):
+            props = {"name": "{0} {1}".format(number, tag),
+                     "proto": "tcp", "action": "accept", "dport": str(port)}
+            deployment.add_item("{0}/rules/fw{1}".format(config_url, index),
+                                "firewall-rule", props)
+            rules.append(props)
+        return rules
+
+    def _add_software(self):
+        """ Add the packages, VM images and VM services to inherit. """
+        deployment = self.deployment
+        ms_node = deployment.nodes[MS_NAME]
+        deployment.add_item("/software", "software")
+        for index in range(self.profile.packages):
+            deployment.add_item("/software/items/pkg{0}".format(index),
+                                "package", {"name": "pkg{0}".format(index),
+                                            "epoch": "0"})
+        for index in range(self.profile.vm_services):
+            name = "vm{0}".format(index)
+            deployment.add_item("/software/images/img{0}".format(index),
+                                "vm-image", {"name": "img{0}".format(index),
+                                             "source_uri": "http://{0}/"
+                                             "images/img{1}.qcow2".format(
+                                                 MS_NAME, index)})
+            ms_node.files["{0}/img{1}.qcow2".format(VM_IMAGE_MS_DIR,
+                                                    index)] = \
+                ["synthetic image img{0}".format(index)]
+            service = "/software/services/{0}".format(name)
+            deployment.add_item(service, "vm-service", {
+                "service_name": name, "image_name": "img{0}".format(index),
+                "cpus": "1", "ram": "256M", "internal_status_check": "off",
+                "adaptor_version": ADAPTOR_VERSION,
+                "cleanup_command": "/sbin/service {0} stop-undefine "
+                                   "--stop-timeout=45".format(name)})
+            # The addresses are set on the copies inherited by clusters.
+            deployment.add_item(
+                service + "/vm_network_interfaces/net0",
+                "vm-network-interface", {"device_name": "eth0",
+                                         "host_device": "br0",
+                                         "network_name": "mgmt"})
+            for alias in range(self.profile.aliases):
+                deployment.add_item(
+                    "{0}/vm_aliases/a{1}".format(service, alias), "vm-alias",
+                    {"alias_names": "{0}-alias{1}".format(name, alias),
+                     "address": "172.16.{0}.{1}".format(index % 250,
+                                                        alias % 250 + 1)})
+            for package in range(min(self.profile.packages, 3)):
+                deployment.add_item(
+                    "{0}/vm_packages/p{1}".format(service, package),
+                    "vm-package", {"name": "pkg{0}".format(package)})
+
+    def _add_storage_profile(self, cluster):
+        """ Add the storage profile of a cluster, returning its url. """
+        deployment = self.deployment
+        url = "/infrastructure/storage/storage_profiles/sp{0}".format(
+            cluster)
+        deployment.add_item(url, "storage-profile", {"volume_driver": "lvm"})
+        deployment.add_item(url + "/volume_groups/vg1", "volume-group",
+                            {"volume_group_name": "vg_root"})
+        for index in range(self.profile.file_systems):
+            deployment.add_item(
+                "{0}/volume_groups/vg1/file_systems/fs{1}".format(url, index),
+                "file-system", {"type": "ext4", "size": "1G",
+                                "snap_size": "10",
+                                "mount_point": "/fs{0}".format(index)})
+        return url
+
+    def _add_node(self, cluster_url, cluster, index, number, cluster_rules):
+        """ Add a managed node item and fixture. """
+        deployment = self.deployment
+        profile = self.profile
+        item_id = "n{0}".format(index + 1)
+        url = "{0}/nodes/{1}".format(cluster_url, item_id)
+        hostname = "c{0}{1}".format(cluster + 1, item_id)
+        node = SyntheticNode("node{0}".format(number), hostname, url,
+                             "10.10.{0}.{1}".format(number // 250,
+                                                    number % 250 + 2),
+                             cluster_url)
+        deployment.add_item(url, "node", {"hostname": hostname,
+                                          "node_id": str(index + 1)})
+        deployment.inherit("/infrastructure/storage/storage_profiles/"
+                           "sp{0}".format(cluster), url + "/storage_profile")
+        node.file_systems = [
+            ("/dev/mapper/vg_root-vg1_fs{0}".format(fs), "/fs{0}".format(fs),
+             "1.0G") for fs in range(profile.file_systems)]
+        for package in range(profile.packages):
+            deployment.inherit("/software/items/pkg{0}".format(package),
+                               "{0}/items/pkg{1}".format(url, package))
+        node.packages = ["pkg{0}-1.0-1.el7.noarch".format(package)
+                         for package in range(profile.packages)]
+        rules = self._add_fw_rules(url + "/configs/fw_config",
+                                   "firewall-node-config",
+                                   "noderule", 33000)
+        node.iptables = _get_iptables_lines(cluster_rules + rules,
+                                            DEFAULT_FW_PORTS, "ipv4")
+        node.ip6tables = _get_iptables_lines(cluster_rules + rules,
+                                             DEFAULT_FW_PORTS, "ipv6")
+        aliases = url + "/configs/alias_config"
+        deployment.add_item(aliases, "alias-node-config")
+        node.files[ETC_HOSTS] = []
+        for alias in range(profile.aliases):
+            props = {"alias_names": "{0}-alias{1}".format(hostname, alias),
+                     "address": "10.20.{0}.{1}".format(number % 250,
+                                                       alias % 250 + 1)}
+            deployment.add_item("{0}/aliases/a{1}".format(aliases, alias),
+                                "alias", props)
+            node.files[ETC_HOSTS].append("{0} {1}".format(
+                props["address"], props["alias_names"]))
+        node.facts = {
+            "release": "redhat-release-server-7.9-6.el7.x86_64",
+            "kernel": "3.10.0-1160.el7.x86_64", "arch": "x86_64",
+            "cmdline": "BOOT_IMAGE=/vmlinuz-3.10.0-1160.el7.x86_64 ro "
+                       "crashkernel=auto rd.lvm.lv=vg_root/lv_root",
+            "timezone": "Europe/Dublin", "abv_timezone": "IST",
+            "hostname": hostname, "uptime": "86400.00",
+            "boot_id": str(uuid.uuid5(uuid.NAMESPACE_DNS, hostname)),
+            "rhel_version": "7.9", "interfaces": "br0 eth0 eth1 lo",
+            "mounts": " ".join(["/", "/boot"] + [
+                mount for _, mount, _ in node.file_systems])}
+        deployment.add_node(node)
+        return node
+
+    def _add_vm(self, host, application, ipv4, online, hostname):
+        """
+        Add the fixture of the VM of an application to the node hosting
+        it, and the image, instance files and domain of the VM to the
+        node. The VM is running if online.
+        """
+        deployment = self.deployment
+        props = deployment.items[application].properties
+        name = props["service_name"]
+        image = "{0}.qcow2".format(props["image_name"])
+        vm = SyntheticNode(hostname, hostname, application, ipv4,
+                           host.cluster_url)
+        vm.interfaces = [("eth0", ipv4, "52:54:00:{0:02x}:{1:02x}:{2:02x}"
+                          .format(*[int(octet) for octet in
+                                    ipv4.split(".")[1:]]))]
+        vm.services = {"vmmonitord": True}
+        vm.facts = dict(host.facts, hostname=hostname, interfaces="eth0 lo",
+                        mounts="/", boot_id=str(uuid.uuid5(
+                            uuid.NAMESPACE_DNS, host.name + hostname)))
+        vm.files[ETC_HOSTS] = ["127.0.0.1 localhost"] + [
+            "{0} {1}".format(deployment.items[alias].properties["address"],
+                             deployment.items[alias].properties[
+                                 "alias_names"])
+            for alias in deployment.find(host.name, application, "vm-alias",
+                                         assert_not_empty=False)]
+        deployment.vms[(host.name, hostname)] = vm
+        host.files["{0}/{1}".format(LIBVIRT_IMAGE_DIR, image)] = list(
+            deployment.nodes[MS_NAME].files["{0}/{1}".format(
+                VM_IMAGE_MS_DIR, image)])
+        instance = "{0}/{1}".format(LIBVIRT_INSTANCES_DIR, name)
+        host.files[instance + "/user-data"] = ["#cloud-config", "packages:"] \
+            + ["- {0}".format(deployment.items[package].properties["name"])
+               for package in deployment.find(host.name, application,
+                                              "vm-package",
+                                              assert_not_empty=False)]
+        host.files[instance + "/config.json"] = [json.dumps(
+            {"adaptor_data": {"internal_status_check": {
+                "active": props["internal_status_check"]}}})]
+        host.services[name] = online
+        host.services["tuned"] = True
+        host.domains[name] = (props["cpus"],
+                              str(int(props["ram"].rstrip("M")) * 1024))
+        for package in ["tuned-2.11.0-9.el7.noarch",
+                        "ERIClitpmnlibvirt_CXP9031529-{0}-1.noarch".format(
+                            props["adaptor_version"])]:
+            if package not in host.packages:
+                host.packages.append(package)
+
+    def _add_cluster(self, cluster):
+        """ Add a cluster with its nodes and VM service groups. """
+        deployment = self.deployment
+        profile = self.profile
+        url = "/deployments/d1/clusters/c{0}".format(cluster + 1)
+        deployment.add_item(url, "vcs-cluster", {
+            "cluster_type": "sfha", "cluster_id": str(4700 + cluster),
+            "low_prio_net": "mgmt", "llt_nets": "hb1,hb2"})
+        deployment.cluster_urls.append(url)
+        cluster_rules = self._add_fw_rules(url + "/configs/fw_config",
+                                           "firewall-cluster-config",
+                                           "clusterrule", 32000)
+        self._add_storage_profile(cluster)
+        nodes = [self._add_node(url, cluster, index,
+                                cluster * profile.nodes + index + 1,
+                                cluster_rules)
+                 for index in range(profile.nodes)]
+        node_ids = [node.url.split("/")[-1] for node in nodes]
+        for index in range(profile.vm_services):
+            service = "{0}/services/cs_vm{1}".format(url, index)
+            standby = 1 if len(node_ids) > 1 else 0
+            deployment.add_item(service, "vcs-clustered-service", {
+                "name": "cs_vm{0}".format(index), "active": "1",
+                "standby": str(standby), "online_timeout": "900",
+                "offline_timeout": "300",
+                "node_list": ",".join(node_ids[:1 + standby])})
+            application = "{0}/applications/vm{1}".format(service, index)
+            deployment.inherit("/software/services/vm{0}".format(index),
+                               application)
+            # One address for the VM, failing over between the nodes.
+            ipv4 = "10.30.{0}.{1}".format(cluster % 250, index % 250 + 1)
+            deployment.items[application + "/vm_network_interfaces/net0"] \
+                .properties["ipaddresses"] = ipv4
+            for host_index, host in enumerate(nodes[:1 + standby]):
+                # A failover VM keeps the service name as hostname, the
+                # VMs of a parallel service are named after their node.
+                self._add_vm(host, application, ipv4, host_index == 0,
+                             "vm{0}".format(index) if standby else
+                             "{0}-vm{1}".format(node_ids[host_index], index))
+        hosts = ["{0} {1}".format(self.deployment.nodes[MS_NAME].ipv4,
+                                  MS_NAME)] + \
+            ["{0} {1}".format(node.ipv4, node.hostname) for node in nodes]
+        for node in nodes:
+            node.files[ETC_HOSTS] = ["127.0.0.1 localhost"] + hosts + \
+                node.files[ETC_HOSTS]
+
+    def generate(self):
+        """
+        Generate the deployment.
+
+        Returns:
+            SyntheticDeployment.
+        """
+        deployment = self.deployment
+        deployment.add_item("/", "root")
+        deployment.add_item("/infrastructure", "infrastructure")
+        deployment.add_item("/deployments", "collection-of-deployment")
+        ms_node = SyntheticNode(MS_NAME, MS_NAME, "/ms", "10.10.0.1")
+        deployment.add_item("/ms", "ms", {"hostname": MS_NAME})
+        ms_rules = self._add_fw_rules("/ms/configs/fw_config",
+                                      "firewall-node-config", "msrule",
+                                      31000)
+        ms_node.iptables = _get_iptables_lines(ms_rules, MS_DEFAULT_FW_PORTS,
+                                               "ipv4")
+        ms_node.ip6tables = _get_iptables_lines(ms_rules,
+                                                MS_DEFAULT_FW_PORTS, "ipv6")
+        ms_node.files[ETC_HOSTS] = ["127.0.0.1 localhost",
+                                    "10.10.0.1 {0}".format(MS_NAME)]
+        ms_node.facts = {"hostname": MS_NAME, "arch": "x86_64",
+                         "kernel": "3.10.0-1160.el7.x86_64",
+                         "rhel_version": "7.9",
+                         "timezone": "Europe/Dublin", "abv_timezone": "IST",
+                         "interfaces": "br0 eth0 lo",
+                         "boot_id": str(uuid.uuid5(uuid.NAMESPACE_DNS,
+                                                   MS_NAME))}
+        deployment.add_node(ms_node)
+        self._add_software()
+        deployment.add_item("/deployments/d1", "deployment")
+        for cluster in range(self.profile.clusters):
+            self._add_cluster(cluster)
+        return deployment
+
+
+def get_synthetic_deployment(spec):
+    """
+    Return the deployment of a profile string or fixture path, generating
+    or loading it once per run.
+
+    Args:
+        spec (str): ScaleProfile string, or path of a dump() JSON file.
+
+    Returns:
+        SyntheticDeployment.
+    """
+    if spec not in _DEPLOYMENTS:
+        if os.path.isfile(spec):
+            _DEPLOYMENTS[spec] = SyntheticDeployment.load(spec)
+        else:
+            _DEPLOYMENTS[spec] = SyntheticModelGenerator(
+                ScaleProfile.from_string(spec)).generate()
+    return _DEPLOYMENTS[spec]
+
+
+def use_synthetic_deployment(test, spec=None):
+    """
+    Answer the deployment calls of a test from a synthetic deployment.
+    Does nothing unless a spec is given or set in the
+    TAF_SYNTHETIC_DEPLOYMENT environment variable. Refuses to run when
+    the connection data of the test names a real MS, so a leftover
+    variable cannot make a run against a vApp pass without checking it.
+    Call it in setUp right after the super class setUp.
+
+    Args:
+        test (GenericTest): Test to run against the synthetic deployment.
+
+    Kwargs:
+        spec (str): ScaleProfile string, or path of a fixture file.
+
+    Returns:
+        SyntheticDeployment. The deployment in use, None if not enabled.
+
+    Raises:
+        SyntheticDeploymentError. If a real deployment is configured.
+    """
+    spec = spec or os.environ.get(SYNTHETIC_DEPLOYMENT_ENV)
+    if not spec:
+        return None
+    if "get_management_node_filenames" not in vars(test):
+        try:
+            real_ms = test.get_management_node_filenames()
+        except Exception:  # pylint: disable=broad-except
+            real_ms = []
+        if real_ms:
+            raise SyntheticDeploymentError(
+                "{0} is set to {1} but the test is connected to {2}; unset "
+                "it to test the real deployment".format(
+                    SYNTHETIC_DEPLOYMENT_ENV, spec, ", ".join(real_ms)))
+    warning = ("WARNING: {0} runs against the synthetic deployment {1}, "
+               "not a real one".format(test.id(), spec))
+    sys.stderr.write("{0}\n".format(warning))
+    test.log("warning", warning)
+    deployment = get_synthetic_deployment(spec)
+    for name in EMULATED_METHODS:
+        setattr(test, name, getattr(deployment, name))
+    return deployment
+
+
+def main(argv=None):
+    """ Write the fixture of a profile to a JSON file. """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        sys.stderr.write(__doc__.split("Usage:")[1])
+        return 2
+    profile = ScaleProfile.from_string(argv[0])
+    deployment = SyntheticModelGenerator(profile).generate()
+    deployment.dump(argv[1])
+    sys.stdout.write("{0}: {1} items, {2} nodes\n".format(
+        profile, len(deployment.paths), len(deployment.node_names)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,11 @@ program(s) have been supplied.
 
 import test_constants
 from litp_generic_test import GenericTest, attr
+from fixture_utils import invalidate_if_mutating
+from watchdog_utils import use_watchdog
+from hardening_utils import HardeningEngine, is_dry_run
+from file_edit_utils import EnsureLine, ReplaceRegex, InsertAfter
+import re
 
 
 class ApplyNodeHardeningSteps(GenericTest):
@@ -24,9 +29,15 @@ class ApplyNodeHardeningSteps(GenericTest):
         Runs before every test
         """
         super(ApplyNodeHardeningSteps, self).setUp()
+        use_watchdog(self)
+        invalidate_if_mutating(self)
         self.all_nodes = [self.get_management_node_filenames()[0]]
         for node in self.get_managed_node_filenames():
             self.all_nodes.append(node)
+        self.hardening = HardeningEngine(self)
+        # Set by TAF_HARDENING_DRY_RUN to only log the file changes the
+        # shell and login steps would make, without applying any step.
+        self.dry_run = is_dry_run()
 
     def tearDown(self):
         """
@@ -40,47 +51,6 @@ class ApplyNodeHardeningSteps(GenericTest):
             self.log("info", "Removing .xml files")
             self.run_command(self.all_nodes[0], cmd, su_root=True)
 
-    def append_line_to_file(self, node, line, file_name):
-        """
-        Description:
-        Appends a line at the end of a file
-        Args:
-            node (node): The node where the file to be ammended lives
-            line (str): The line to be appended
-            file_name (str): The name of the file to be changed
-        """
-        cmd = "echo '" + line + "' >> " + file_name
-        self.std_checks(self.run_command(node, cmd, su_root=True))
-
-    def change_str_in_file(self, node, old_string, new_string, file_name):
-        """
-        Description:
-        Appends a string in a file with a different string by building
-        and then running an sed command
-        Args:
-            node (node): The node where the file to be ammended lives
-            old_string (str): The line to be replaced
-            new_string (str): The new string
-            file_name (str): The name of the file to be changed
-        """
-        cmd = "/bin/sed -i 's," + old_string + "," + new_string
-        cmd += ",g' " + file_name
-        self.std_checks(self.run_command(node, cmd, su_root=True))
-
-    def insert_string_into_file(self, node, old_string, new_string, file_name):
-        """
-        Description:
-        Writes a string to a file underneath a specified string
-        Args:
-            node (node): The node where the file to be ammended lives
-            old_string (str): The line the new string will
-                              be inserted under
-            new_string (str): The line to be inserted
-            file_name (str): The name of the file to be changed
-        """
-        new_string = old_string + "\\n" + new_string
-        self.change_str_in_file(node, old_string, new_string, file_name)
-
     def std_checks(self, outs):
         """
         Description:
@@ -93,29 +63,22 @@ class ApplyNodeHardeningSteps(GenericTest):
         self.assertEquals([], outs[1], "std_err is not empty: " + str(outs[1]))
         self.assertEquals(0, outs[2], "non-zero return code: " + str(outs[2]))
 
-    def set_password_expiry(self, node):
+    def set_password_expiry(self):
         """
         Description:
         Sets passwords for root and litp-admin to expire in 60 days.
-        Args:
-            node (node): The node to set password expiry on
         Steps:
         1. Set litp-admin password.
-        2. Ensure command runs successfully.
-        3. Set root password.
-        4. Ensure command runs successfully.
+        2. Set root password.
         """
         exp_duration = '60'
         self.log("info", "Changing password expiry to {0} days."
                  .format(exp_duration))
-        # 1. Set litp-admin password.
-        self.std_checks(self.run_command(node, "chage -M {0} litp-admin"
-                                         .format(exp_duration),
-                                         su_root=True))
-
-        # 3. Set root password.
-        self.std_checks(self.run_command(node, "chage -M {0} root"
-                                         .format(exp_duration), su_root=True))
+        self.hardening.add_step("set_password_expiry", [
+            # 1. Set litp-admin password.
+            "chage -M {0} litp-admin".format(exp_duration),
+            # 2. Set root password.
+            "chage -M {0} root".format(exp_duration)])
 
     def add_firewall_rules(self):
         """
@@ -229,15 +192,10 @@ class ApplyNodeHardeningSteps(GenericTest):
         Disable bash login for RabbitMQ.
         Args:
             node (node) : The node to disable rabitmq login on
-        Steps:
-        1. Run usermod command.
-        2. Ensure user successfully disabled.
         """
-        # 1. Run usermod command.
-        cmd = '/usr/sbin/usermod -s /sbin/nologin rabbitmq'
-        _, _, rcode = self.run_command(node, cmd, su_root=True)
-        # 2. Ensure user successfully disabled.
-        self.assertEqual(0, rcode)
+        self.hardening.add_step("disable_rabbitmq_login",
+                                ["/usr/sbin/usermod -s /sbin/nologin "
+                                 "rabbitmq"], nodes=[node])
 
     def set_idle_timeout(self):
         """
@@ -248,13 +206,10 @@ class ApplyNodeHardeningSteps(GenericTest):
         lines = ['"readonly TMOUT=900"',
                  '"readonly HISTFILE"']
         f_name = "/etc/profile.d/os-security.sh"
-        cmd_strings = ['echo ' + lines[0] + ' >| ' + f_name,
-                       'echo ' + lines[1] + ' >> ' + f_name,
-                       'chmod +x /etc/profile.d/os-security.sh']
-        for node in self.all_nodes:
-            for cmd in cmd_strings:
-                self.log("info", "Running on node: " + node)
-                self.std_checks(self.run_command(node, cmd, su_root=True))
+        self.hardening.add_step("set_idle_timeout", [
+            'echo ' + lines[0] + ' >| ' + f_name,
+            'echo ' + lines[1] + ' >> ' + f_name,
+            'chmod +x /etc/profile.d/os-security.sh'])
 
     def prevent_password_reuse(self):
         """
@@ -267,8 +222,9 @@ class ApplyNodeHardeningSteps(GenericTest):
         new_line = old_line + " remember=5"
         f_name = "/etc/pam.d/system-auth"
         self.log("info", "Disabling password reuse.")
-        for node in self.all_nodes:
-            self.change_str_in_file(node, old_line, new_line, f_name)
+        self.hardening.add_edit_step("prevent_password_reuse", [
+            (f_name, ReplaceRegex(re.escape(old_line), new_line,
+                                  guard=new_line))])
 
     def enforce_strong_passwords(self):
         """
@@ -279,8 +235,8 @@ class ApplyNodeHardeningSteps(GenericTest):
         line = "password    requisite     pam_cracklib.so try_first_pass"
         line += " retry=3 minlen=7 minclass=3"
         self.log("info", "Setting up password strength rules.")
-        for node in self.all_nodes:
-            self.append_line_to_file(node, line, "/etc/pam.d/system-auth")
+        self.hardening.add_edit_step("enforce_strong_passwords", [
+            ("/etc/pam.d/system-auth", EnsureLine(line))])
 
     def apply_and_verify_mesg(self):
         """
@@ -288,11 +244,9 @@ class ApplyNodeHardeningSteps(GenericTest):
         Stops other users from displaying messages to the terminal
         """
         self.log("info", "Disabling users from showing messages in terminal.")
-        cmds = ["echo \"tty -s && mesg n\" >> /etc/profile",
-                "echo \"tty -s && mesg n\" >> /etc/bashrc"]
-        for node in self.all_nodes:
-            for cmd in cmds:
-                self.std_checks(self.run_command(node, cmd, su_root=True))
+        self.hardening.add_edit_step("apply_and_verify_mesg", [
+            ("/etc/profile", EnsureLine("tty -s && mesg n")),
+            ("/etc/bashrc", EnsureLine("tty -s && mesg n"))])
 
     def expire_accounts(self):
         """
@@ -300,24 +254,21 @@ class ApplyNodeHardeningSteps(GenericTest):
         Expires the accounts "halt", "shutdown" and "sync"
         """
         accounts_to_expire = ["halt", "shutdown", "sync"]
-        for node in self.all_nodes:
-            for account in accounts_to_expire:
-                self.log("info", "Expiring account: {0}".format(account))
-                cmd = "chage -E 1 " + account
-                self.std_checks(self.run_command(node, cmd, su_root=True))
+        self.log("info", "Expiring accounts: {0}".format(
+            ", ".join(accounts_to_expire)))
+        self.hardening.add_step("expire_accounts",
+                                ["chage -E 1 " + account
+                                 for account in accounts_to_expire])
 
     def disallow_chfn_chsh(self):
         """
         Description:
         Stops non-root users from executing chfn and chsh commands
         """
-        for node in self.all_nodes:
-            self.log("info", "Disabling chfn command on: {0}".format(node))
-            self.std_checks(self.run_command(node, "chmod 4700 /usr/bin/chfn",
-                                             su_root=True))
-            self.log("info", "Disabling chsh command on : {0}".format(node))
-            self.std_checks(self.run_command(node, "chmod 4700 /usr/bin/chsh",
-                                             su_root=True))
+        self.log("info", "Disabling chfn and chsh commands.")
+        self.hardening.add_step("disallow_chfn_chsh",
+                                ["chmod 4700 /usr/bin/chfn",
+                                 "chmod 4700 /usr/bin/chsh"])
 
     def expire_inactive_login(self):
         """
@@ -328,43 +279,36 @@ class ApplyNodeHardeningSteps(GenericTest):
         file_name = "/etc/pam.d/login"
         old_string = "auth       include      system-auth"
         self.log("info", "Disabling inactive accounts.")
-        for node in self.all_nodes:
-            self.insert_string_into_file(node, old_string,
-                                         new_string, file_name)
+        self.hardening.add_edit_step("expire_inactive_login", [
+            (file_name, InsertAfter(old_string, [new_string]))])
 
     def edit_umask_settings(self):
         """
         Description:
         Increases umask threshold
         """
-        for node in self.all_nodes:
-            self.log("info", "Increase umask threshold on : {0}".format(node))
-            self.change_str_in_file(node, "umask 002", "umask 027",
-                                    "/etc/bashrc")
-            self.change_str_in_file(node, "umask 002", "umask 027",
-                                    "/etc/profile")
+        self.log("info", "Increase umask threshold.")
+        self.hardening.add_edit_step("edit_umask_settings", [
+            ("/etc/bashrc", ReplaceRegex("umask 002", "umask 027")),
+            ("/etc/profile", ReplaceRegex("umask 002", "umask 027"))])
 
     def lock_account_after_failed_attempts(self):
         """
         Description:
         Locks accounts after repeated failed attempts
         """
-        new_lines = ("auth\\trequired\\tpam_faillock.so preauth silent "
-                     "audit deny=5 unlock_time=21600\\nauth\\tsufficient"
-                     "\\tpam_unix.so nullok try_first_pass\\nauth\\t"
-                     "[default=die]\\tpam_faillock.so authfail audit "
-                     "deny=5 unlock_time=21600")
+        new_lines = ["auth\trequired\tpam_faillock.so preauth silent "
+                     "audit deny=5 unlock_time=21600",
+                     "auth\tsufficient\tpam_unix.so nullok try_first_pass",
+                     "auth\t[default=die]\tpam_faillock.so authfail audit "
+                     "deny=5 unlock_time=21600"]
         line_to_insert_under = "auth        sufficient    pam_unix.so"
         line_to_insert_under += " try_first_pass nullok"
-        for node in self.all_nodes:
-            self.log("info",
-                     "Enabling account locking after failed attempts on :{0}"
-                     .format(node))
-            self.insert_string_into_file(node, line_to_insert_under,
-                                         new_lines, "/etc/pam.d/system-auth")
-            self.insert_string_into_file(node, line_to_insert_under,
-                                         new_lines,
-                                         "/etc/pam.d/password-auth")
+        edit = InsertAfter(line_to_insert_under, new_lines)
+        self.log("info", "Enabling account locking after failed attempts.")
+        self.hardening.add_edit_step("lock_account_after_failed_attempts", [
+            ("/etc/pam.d/system-auth", edit),
+            ("/etc/pam.d/password-auth", edit)])
 
     def restrict_number_of_shells(self):
         """
@@ -372,11 +316,9 @@ class ApplyNodeHardeningSteps(GenericTest):
         Prevents litp-admin user from having more than 3 shells
         open at a time
         """
-        insert_string = "litp-admin  -  maxlogins  3"
-        f_name = "/etc/security/limits.conf"
-        cmd = "echo '" + insert_string + "' >> " + f_name
-        for node in self.all_nodes:
-            self.std_checks(self.run_command(node, cmd, su_root=True))
+        self.hardening.add_edit_step("restrict_number_of_shells", [
+            ("/etc/security/limits.conf",
+             EnsureLine("litp-admin  -  maxlogins  3"))])
 
     def update_routing_configuration(self):
         """
@@ -416,6 +358,28 @@ class ApplyNodeHardeningSteps(GenericTest):
                                                  cmd_to_run))
                 i += 1
 
+    def apply_hardening_steps(self):
+        """
+        Description:
+        Runs all added hardening steps, one remote script per node on all
+        nodes in parallel, and checks every step passed. Only files whose
+        content changes are written. In dry run mode the file changes are
+        logged as diffs instead.
+        """
+        if self.dry_run:
+            diffs = self.hardening.dry_run(self.all_nodes)
+            for node in self.all_nodes:
+                for step, diff in diffs[node]:
+                    self.log("info", "Hardening step {0} on {1} would "
+                             "change:\n{2}".format(step, node,
+                                                    "\n".join(diff)))
+            return
+        results = self.hardening.run(self.all_nodes)
+        for node in self.all_nodes:
+            for result in results[node]:
+                self.log("info", "Hardening step {0}".format(result))
+        self.hardening.assert_passed(results)
+
     def create_and_run_plan(self):
         """
         Description:
@@ -431,7 +395,7 @@ class ApplyNodeHardeningSteps(GenericTest):
                                           timeout_mins=30)
         self.assertTrue(result, "Plan did not succeed within 30 minutes")
 
-    @attr("all", "hardening", "shell", "non-revert")
+    @attr("all", "hardening", "shell", "non-revert", "mutating")
     def test_01_p_update_login_and_shell_settings(self):
         """
             Description:
@@ -468,15 +432,18 @@ class ApplyNodeHardeningSteps(GenericTest):
         self.lock_account_after_failed_attempts()
         self.restrict_number_of_shells()
         self.disable_rabbitmq_login(self.all_nodes[0])
+        #this step breaks cloud installs, only
+        #run on physical environments
+        if self.get_running_env(self.all_nodes[0]) == 1:
+            self.set_password_expiry()
+        self.apply_hardening_steps()
+        if self.dry_run:
+            return
         for node in self.all_nodes:
             self.encrypt_grub_password(node)
             self.verify_single_user_mode_pw_protected(node)
-            #this step breaks cloud installs, only
-            #run on physical environments
-            if self.get_running_env(self.all_nodes[0]) == 1:
-                self.set_password_expiry(node)
 
-    @attr("all", "hardening", "network", "non-revert")
+    @attr("all", "hardening", "network", "non-revert", "mutating")
     def test_02_p_update_network_settings(self):
         """
             Description:
@@ -11,6 +11,8 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from bmc_utils import BmcUtils, get_ipmi_cmd
 
 
 class Bmc(GenericTest):
@@ -22,7 +24,7 @@ class Bmc(GenericTest):
         """ Setup Variables for every test """
         super(Bmc, self).setUp()
         # GET MODEL INFO
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.all_nodes = self.model["nodes"][:]
         self.ms_node = self.model["ms"][0]["name"]
         """ expected properties """
@@ -31,6 +33,11 @@ class Bmc(GenericTest):
                             'password_key',
                             'username'
                         ])
+        self.bmc_utils = BmcUtils()
+        # Command template (with {ip} and {username} fields) to also
+        # check IPMI responsiveness of each BMC, set by TAF_BMC_IPMI. No
+        # IPMI check if None.
+        self.ipmi_cmd = get_ipmi_cmd()
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -59,53 +66,70 @@ class Bmc(GenericTest):
             C. Check bmc property values
         Actions:
             A.
-                1. Find all blade items
+                1. Find all blade and bmc items in one query per type
                 2. Assert blade name is not empty
             B.
-                1. Find all bmc items
+                1. Group bmc items by blade
                 2. All the bmc item properties must be
                     set and present
             C.
-                1. Assert that IP address is reachable
+                1. Assert that all IP addresses are reachable, probed
+                    concurrently from the MS in one batch
         """
-        # A1. Find all blade items
-        for node in self.all_nodes:
-            blades = self.find(self.ms_node, node['url'], \
-                                "blade", assert_not_empty=False)
-            if not blades:
-                self.log('info', "There's no blade " +\
-                                "in: {0}".format(node['name']))
-            else:
-                for blade in blades:
-                    blade_values = self.get_props_from_url(self.ms_node, blade)
-                    # A2. Assert blade name is not empty
-                    self.assertNotEqual("", blade_values["system_name"])
-                    # B1. Find all bmc items
-                    bmcs = self.find(self.ms_node, node['url'], \
-                                        "bmc", assert_not_empty=False)
-                    if not bmcs:
-                        self.log('info', "There's no bmc item " +\
-                                        "in this blade: {0}".format(blade))
-                    else:
-                        for bmc in bmcs:
-                            # B2. All the bmc item properties must be
-                            #       set and present
-                            prop_values = \
-                                    self.get_props_from_url(self.ms_node, bmc)
-                            prop_names = prop_values.keys()
-                            same_lists = \
-                                    self.compare_bmc_props(self.bmc_props,\
-                                                            sorted(prop_names))
-                            self.assertTrue(same_lists)
-                            for key in prop_values:
-                                self.assertNotEqual("", prop_values[key])
-                            self.log('info', "All the required properties" +\
-                                            " for this bmc item are present" +\
-                                            " and set: {0}".format(bmc))
-                            # C1. Assert that IP address is reachable
-                            in_network = self.is_ip_pingable(self.ms_node, \
-                                        "{0}".format(prop_values['ipaddress']))
-                            self.assertTrue(in_network)
-                            self.log('info', "BMC ip address " +\
-                                    "{0} ".format(prop_values['ipaddress']) +\
-                                    "is in network")
+        # A1. Find all blade and bmc items in one query per type
+        blades = self.find(self.ms_node, "/deployments", "blade",
+                           assert_not_empty=False)
+        bmcs = self.find(self.ms_node, "/deployments", "bmc",
+                         assert_not_empty=False)
+        if not blades:
+            self.log('info', "There's no blade in: {0}".format(
+                ", ".join(node['name'] for node in self.all_nodes)))
+            return
+
+        # B1. Group bmc items by blade
+        blade_bmcs = self.bmc_utils.group_bmcs_by_blade(blades, bmcs)
+        bmc_addresses = {}
+        bmc_usernames = {}
+        for blade in blades:
+            blade_values = self.get_props_from_url(self.ms_node, blade)
+            # A2. Assert blade name is not empty
+            self.assertNotEqual("", blade_values["system_name"])
+            if not blade_bmcs[blade]:
+                self.log('info', "There's no bmc item " +\
+                                "in this blade: {0}".format(blade))
+                continue
+            for bmc in blade_bmcs[blade]:
+                # B2. All the bmc item properties must be
+                #       set and present
+                prop_values = self.get_props_from_url(self.ms_node, bmc)
+                prop_names = prop_values.keys()
+                same_lists = self.compare_bmc_props(self.bmc_props,
+                                                    sorted(prop_names))
+                self.assertTrue(same_lists)
+                for key in prop_values:
+                    self.assertNotEqual("", prop_values[key])
+                self.log('info', "All the required properties" +\
+                                " for this bmc item are present" +\
+                                " and set: {0}".format(bmc))
+                bmc_addresses[prop_values['ipaddress']] = bmc
+                bmc_usernames[prop_values['ipaddress']] = \
+                    prop_values['username']
+
+        # C1. Assert that all IP addresses are reachable, probed
+        #       concurrently from the MS in one batch
+        addresses = sorted(bmc_addresses)
+        cmd = self.bmc_utils.get_reachability_cmd(addresses,
+                                                  ipmi_cmd=self.ipmi_cmd,
+                                                  usernames=bmc_usernames)
+        stdout, _, _ = self.run_command(self.ms_node, cmd)
+        results = self.bmc_utils.parse_reachability_output(stdout)
+        for address in addresses:
+            self.assertTrue(results.get(('ping', address)),
+                            "BMC ip address {0} of {1} is not in network"
+                            .format(address, bmc_addresses[address]))
+            self.log('info', "BMC ip address " +\
+                    "{0} ".format(address) + "is in network")
+            if self.ipmi_cmd:
+                self.assertTrue(results.get(('ipmi', address)),
+                                "BMC {0} is not responding to IPMI"
+                                .format(address))
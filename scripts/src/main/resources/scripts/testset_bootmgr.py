@@ -11,6 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from cobbler_utils import CobblerUtils
+from service_utils import ServiceStateCollector
 
 
 class BootManager(GenericTest):
@@ -21,7 +24,7 @@ class BootManager(GenericTest):
     def setUp(self):
         """ Setup Variables for every test """
         super(BootManager, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.all_nodes = self.model["nodes"][:]
         self.ms_node = self.model["ms"][0]
         self.bootmgr_props = sorted([
@@ -38,6 +41,8 @@ class BootManager(GenericTest):
                             'rsync_disabled',
                             'sign_puppet_certs_automatically'
                         ])
+        self.cobbler = CobblerUtils()
+        self.service_states = ServiceStateCollector(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -70,61 +75,78 @@ class BootManager(GenericTest):
                     assert there's no more than one of it.
                 2. Check if all the properties are set
 
-            B   1. Run service status command on MS to
-                    check whether cobblerd service
-                    is running
+            B   1. Check whether cobblerd service is running on MS
             C
                 1. Check if the ksm path exists
-                2. Check if the ksm peer node files exist
-                3. Check selinux value in peer nodes ks files
-                4. Run selinuxenabled command to confirm
+                2. Fetch a snapshot of all cobbler systems, profiles,
+                    distros and kickstart selinux settings in one call
+                3. Check the peer node ks files exist and their selinux
+                    value
+                4. Check each peer node is a cobbler system using the
+                    node's ks file and a known profile and distro
+                5. Run selinuxenabled command to confirm
         """
         # A1. Retrieve the cobbler-service item and
         #       assert there's no more than one of it.
-        cobbler = self.find(self.ms_node['name'], \
+        ms_name = self.ms_node['name']
+        cobbler = self.find(ms_name, \
                     self.ms_node['url'], "cobbler-service")
         self.assertTrue(len(cobbler) <= 1)
         if not cobbler:
             self.log('info', "There's no cobbler service.")
         else:
             cobbler = cobbler[0]
-            prop_values = self.get_props_from_url(\
-                            self.ms_node['name'], cobbler)
+            prop_values = self.get_props_from_url(ms_name, cobbler)
             # A2. Check if all the properties are set
             prop_names = prop_values.keys()
             same_lists = self.compare_boot_props(sorted(prop_names))
             self.assertTrue(same_lists)
             self.log('info', "All the required properties are set.")
-            # B1. Run service status command on MS to
-            #       check whether cobblerd service
-            #       is running
-            _, std_err, r_code = \
-                self.get_service_status(self.ms_node['name'], 'cobblerd')
-            self.assertEqual([], std_err)
-            self.assertEqual(0, r_code)
+            # B1. Check whether cobblerd service is running on MS
+            self.service_states.assert_running(ms_name,
+                self.service_states.collect(ms_name, ['cobblerd']))
             # C1. Check if the ksm path exists
-            is_path = self.remote_path_exists(self.ms_node['name'], \
+            is_path = self.remote_path_exists(ms_name, \
                                                 prop_values['ksm_path'], \
                                                 expect_file=False)
             self.assertTrue(is_path)
             self.log('info', "Kickstart path exists!")
-            # C2. Check if the peer node ks files exist
+            # C2. Fetch a snapshot of all cobbler systems, profiles,
+            #       distros and kickstart selinux settings in one call
+            snapshot = self.cobbler.get_snapshot(self, ms_name,
+                                                 prop_values['ksm_path'])
+            selinux = 'selinux --{0}'.format(prop_values['ksm_selinux_mode'])
             for node in self.all_nodes:
-                ks_file = "{0}/{1}.ks"\
-                            .format(prop_values['ksm_path'], node['name'])
-                file_exists = self.remote_path_exists(\
-                                self.ms_node['name'], ks_file)
-                self.assertTrue(file_exists)
-                self.log('info', "Kickstart file '{0}.ks' \
-                                    exists!".format(node['name']))
-                # C3. Check selinux value in peer nodes ks files
-                file_contents = self.get_file_contents(self.ms_node['name'], \
-                                "{0}/{1}.ks".format(prop_values['ksm_path'], \
-                                                        node['name']))
-                self.assertTrue(self.is_text_in_list('selinux --{0}'\
-                    .format(prop_values['ksm_selinux_mode']), file_contents))
-            # C4. Run selinuxenabled command to confirm
+                # C3. Check the peer node ks files exist and their selinux
+                #       value
+                ks_name = "{0}.ks".format(node['name'])
+                self.assertTrue(ks_name in snapshot.kickstarts,
+                                "Kickstart file '{0}' does not exist"
+                                .format(ks_name))
+                self.log('info', "Kickstart file '{0}' exists!"
+                         .format(ks_name))
+                self.assertTrue(self.is_text_in_list(selinux,
+                                snapshot.kickstarts[ks_name]))
+                # C4. Check each peer node is a cobbler system using the
+                #       node's ks file and a known profile and distro
+                system = snapshot.get_system(node['name'])
+                self.assertNotEqual(None, system,
+                                    "No cobbler system for {0}"
+                                    .format(node['name']))
+                if 'Kickstart' in system:
+                    self.assertTrue(system['Kickstart'].endswith(
+                        "/" + ks_name), "System {0} uses kickstart {1}"
+                        .format(node['name'], system['Kickstart']))
+                profile = snapshot.profiles.get(system.get('Profile'))
+                self.assertNotEqual(None, profile,
+                                    "Unknown cobbler profile {0} for {1}"
+                                    .format(system.get('Profile'),
+                                            node['name']))
+                self.assertTrue(profile.get('Distribution') in
+                                snapshot.distros,
+                                "Unknown cobbler distro {0}".format(
+                                    profile.get('Distribution')))
+            # C5. Run selinuxenabled command to confirm
             cmd = "/usr/sbin/selinuxenabled"
-            _, _, r_code = self.run_command(self.ms_node['name'], cmd,
-                                                            su_root=True)
+            _, _, r_code = self.run_command(ms_name, cmd, su_root=True)
             self.assertEqual(0, r_code)
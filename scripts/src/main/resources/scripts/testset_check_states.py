@@ -12,6 +12,7 @@ program(s) have been supplied.
 
 from litp_generic_test import GenericTest, attr
 from litp_cli_utils import CLIUtils
+from model_state_utils import ModelStateUtils
 
 
 class AppliedState(GenericTest):
@@ -25,6 +26,7 @@ class AppliedState(GenericTest):
         # GET MODEL INFO
         self.ms_node = self.get_management_node_filename()
         self.cli = CLIUtils()
+        self.model_state = ModelStateUtils()
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -38,15 +40,15 @@ class AppliedState(GenericTest):
 
         Actions:
         A.
-            1. Find all urls from the litp model
-            2. Assert state = Applied
+            1. Read path, type and state of all items from the litp model
+            2. Assert state = Applied, ignoring upgrade subtrees and the
+               deployment items themselves
 
         """
         remove_plan_cmd = self.cli.get_remove_plan_cmd()
         self.run_command(self.ms_node, remove_plan_cmd)
-        ignore_paths = []
-        ignore_paths.extend(self.find(self.ms_node, "/", "upgrade",
-                                  assert_not_empty=False))
-        ignore_paths.extend(self.find(self.ms_node, "/", "deployment",
-                                  assert_not_empty=False))
-        self.assertTrue(self.is_all_applied(self.ms_node, ignore_paths))
+        items = self.model_state.get_model_items(self, self.ms_node)
+        unapplied = self.model_state.get_unapplied_items(
+            items, ignore_types=["upgrade"], skip_types=["deployment"])
+        self.assertEqual([], unapplied,
+                         "Items not in Applied state: {0}".format(unapplied))
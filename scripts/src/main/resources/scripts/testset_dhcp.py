@@ -11,6 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from dhcp_utils import DhcpUtils
+from service_utils import ServiceStateCollector
 
 
 class Dhcp(GenericTest):
@@ -25,7 +28,7 @@ class Dhcp(GenericTest):
 
         super(Dhcp, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
@@ -34,13 +37,16 @@ class Dhcp(GenericTest):
         self.service_primary = None
         # Used for checking dhcp6-service 'primary' property
         self.service6_primary = None
+        self.dhcp_utils = DhcpUtils()
+        self.service_states = ServiceStateCollector(self)
 
     def tearDown(self):
         """ Teardown run after every test """
 
         super(Dhcp, self).tearDown()
 
-    def _dhcp_service(self, service_path, dhcp_type, node_name):
+    def _dhcp_service(self, service_path, dhcp_type, node_name, facts,
+                      service_states):
         """
         Description:
             Tests that if dhcp-service or dhcp6-service 'primary' property is
@@ -54,6 +60,9 @@ class Dhcp(GenericTest):
             dhcp_type (str): 'dhcp' (for dhcp-service) or
                                                 'dhcp6' (for dhcp6-service).
             node_name (str): Name of the node being tested.
+            facts (DhcpFacts): Parsed dhcpd config and leases of the node.
+            service_states (dict): Service name to ServiceState of the
+                                                node's DHCP services.
 
         Actions:
             a. Get the properties of the path.
@@ -63,7 +72,8 @@ class Dhcp(GenericTest):
             d. If the 'primary' property is set to 'true', note this to ensure
                                 the peer server is set to 'false'.
             e. Ensure that dhcpd is running on the node.
-            f. Return dictionary containing service_name, primary,
+            f. Ensure the failover role in dhcpd.conf matches 'primary'.
+            g. Return dictionary containing service_name, primary,
                         domainsearch, nameservers and ntpservers properties.
 
         Returns:
@@ -111,11 +121,18 @@ class Dhcp(GenericTest):
             self.service6_primary = service_path
 
         # e. Ensure that dhcpd is active on the node
-        self.get_service_status(node_name,
-                                "dhcpd",
-                                assert_running=True)
+        self.service_states.assert_running(node_name, service_states,
+                                           ["dhcpd"])
 
-        # f. Return dictionary containing 'service_name', 'primary',
+        # f. Ensure the failover role in dhcpd.conf matches 'primary'
+        if dhcp_type == 'dhcp':
+            expected_role = 'primary' if primary == 'true' else 'secondary'
+            for peer_name, peer in facts.failover_peers.items():
+                self.assertEqual(expected_role, peer.get('role'),
+                    "Failover peer '{0}' on {1} is not {2}".format(
+                        peer_name, node_name, expected_role))
+
+        # g. Return dictionary containing 'service_name', 'primary',
         #       'domainsearch', 'nameservers' and 'ntpservers' property values
         service_dict = {'service_name': service_name, 'primary': primary,
             'domainsearch': domainsearch, 'nameservers': nameservers,
@@ -123,38 +140,57 @@ class Dhcp(GenericTest):
 
         return service_dict
 
-    def _dhcp_subnet(self, subnet_path):
+    def _dhcp_subnet(self, subnet_path, dhcp_type, facts, networks):
         """
         Description:
-            Return the 'network_name' property of the path passed in.
+            Return the 'network_name' property of the path passed in and
+            ensure the network's subnet is declared in dhcpd.conf.
 
         Args:
             subnet_path (str): Path to dhcp-subnet item type in the model.
+            dhcp_type (str): 'dhcp' (for dhcp-subnet) or
+                                                'dhcp6' (for dhcp6-subnet).
+            facts (DhcpFacts): Parsed dhcpd config and leases of the node.
+            networks (dict): Network name to 'subnet' property value.
 
         Actions:
             a. Get the properties of the path.
-            b. Return the 'network_name' property value.
+            b. For dhcp-subnet, ensure the subnet of the network is
+                                                declared in dhcpd.conf.
+            c. Return the 'network_name' property value.
 
         Returns:
             The 'network_name' property value of the path passed in.
         """
         # a. Get the properties of the path
         subnet_props = self.get_props_from_url(self.ms_node, subnet_path)
+        network_name = subnet_props['network_name']
 
-        # b. Return the 'network_name' property value
-        return subnet_props['network_name']
+        # b. For dhcp-subnet, ensure the subnet of the network is declared
+        #       in dhcpd.conf. IPv6 subnets are not modelled on networks.
+        if dhcp_type == 'dhcp' and networks.get(network_name):
+            self.assertNotEqual(None,
+                facts.get_subnet(networks[network_name]),
+                "Subnet {0} of network '{1}' not declared in "
+                "dhcpd.conf".format(networks[network_name], network_name))
 
-    def _dhcp_range(self, range_path):
+        # c. Return the 'network_name' property value
+        return network_name
+
+    def _dhcp_range(self, range_path, facts):
         """
         Description:
-            Return the 'start' and 'end' property values of the path passed in.
+            Return the 'start' and 'end' property values of the path passed in
+            and ensure the range is configured on the DHCP server.
 
         Args:
             range_path (str): Path to dhcp-range item type in the model.
+            facts (DhcpFacts): Parsed dhcpd config and leases of the node.
 
         Actions:
             a. Get the properties of the path.
-            b. Return the 'start' and 'end' property values.
+            b. Ensure the range is configured in dhcpd.conf/dhcpd6.conf.
+            c. Return the 'start' and 'end' property values.
 
         Returns:
             Dictionary containing 'start' and 'end' properties.
@@ -162,9 +198,30 @@ class Dhcp(GenericTest):
         # a. Get the properties of the path
         range_props = self.get_props_from_url(self.ms_node, range_path)
 
-        # b. Return the 'start' and 'end' property values
+        # b. Ensure the range is configured in dhcpd.conf/dhcpd6.conf
+        self.assertTrue(
+            facts.has_range(range_props['start'], range_props['end']),
+            "Range {0} - {1} not configured on DHCP server".format(
+                range_props['start'], range_props['end']))
+
+        # c. Return the 'start' and 'end' property values
         return {'start': range_props['start'], 'end': range_props['end']}
 
+    def _get_network_subnets(self):
+        """
+        Description:
+            Return the 'subnet' of every modelled network by name.
+
+        Returns:
+            dict. Network name to 'subnet' property value (None if unset).
+        """
+        networks = {}
+        for path in self.find(self.ms_node, "/infrastructure", "network",
+                              assert_not_empty=False):
+            props = self.get_props_from_url(self.ms_node, path)
+            networks[props['name']] = props.get('subnet')
+        return networks
+
     @attr('all', 'revert', 'system_check', 'dhcp', 'dhcp_tc01')
     def test_01_p_dhcp(self):
         """
@@ -177,6 +234,7 @@ class Dhcp(GenericTest):
 
         Actions:
             For each node:
+            Fetch and parse dhcpd config and lease files once.
             For each dhcp type:
             1. dhcp-service
                 a. Check for any modelled 'dhcp-service' or
@@ -188,51 +246,69 @@ class Dhcp(GenericTest):
                 a. Check for any modelled 'dhcp-subnet' or
                                     'dhcp6-subnet' items on node.
                 For each dhcp-subnet/dhcp6-subnet path:
-                b. Get the 'network_name' property.
+                b. Get the 'network_name' property and ensure the subnet
+                                    is declared.
             3. dhcp-range
                 a. Check for any modelled 'dhcp-range' or
                                     'dhcp6-range' items on node.
                 For each dhcp-range/dhcp6-range path:
-                b. Get the 'start' and 'end' properties.
+                b. Get the 'start' and 'end' properties and ensure the
+                                    range is configured.
         """
         dhcp_types = ['dhcp', 'dhcp6']
+        networks = None
 
         for node in self.all_nodes:
             node_name = node["name"]
 
+            service_paths = {}
             for dhcp_type in dhcp_types:
-                # 1. dhcp-service
                 # 1a. Check for any modelled 'dhcp-service' or
                 #                   'dhcp6-service' items on node
-                dhcp_service_paths = self.find(self.ms_node, node["url"],
-                    "{0}-service".format(dhcp_type), assert_not_empty=False)
+                service_paths[dhcp_type] = self.find(self.ms_node,
+                    node["url"], "{0}-service".format(dhcp_type),
+                    assert_not_empty=False)
+
+            if not any(service_paths.values()):
+                continue
 
+            # Fetch and parse dhcpd config and lease files once per node
+            facts = self.dhcp_utils.get_dhcp_facts(self, node_name)
+            service_states = self.service_states.collect(node_name,
+                                                         ["dhcpd"])
+            if networks is None:
+                networks = self._get_network_subnets()
+
+            for dhcp_type in dhcp_types:
+                # 1. dhcp-service
                 # For each dhcp-service/dhcp6-service path:
-                for service_path in dhcp_service_paths:
+                for service_path in service_paths[dhcp_type]:
                     # 1b. Get dictionary of 'service_name',
                     #       'primary', 'domainsearch',
                     #           'nameservers' & 'ntpservers' property values
-                    self._dhcp_service(
-                        service_path, dhcp_type, node_name)
+                    self._dhcp_service(service_path, dhcp_type, node_name,
+                                       facts, service_states)
 
-                # 2. dhcp-subnet
-                # 2a. Check for any modelled 'dhcp-subnet' or
-                #                   'dhcp6-subnet' items on node
-                dhcp_subnet_paths = self.find(self.ms_node, node["url"],
+                    # 2. dhcp-subnet
+                    # 2a. Check for any modelled 'dhcp-subnet' or
+                    #                   'dhcp6-subnet' items on service
+                    dhcp_subnet_paths = self.find(self.ms_node, service_path,
                         "{0}-subnet".format(dhcp_type), assert_not_empty=False)
 
-                # For each dhcp-subnet/dhcp6-subnet path:
-                for subnet_path in dhcp_subnet_paths:
-                    # 2b. Get the 'network_name' property
-                    self._dhcp_subnet(subnet_path)
-
-                # 3. dhcp-range
-                # 3a. Check for any modelled 'dhcp-range' or
-                #                   'dhcp6-range' items on node
-                dhcp_range_paths = self.find(self.ms_node, node["url"],
-                        "{0}-range".format(dhcp_type), assert_not_empty=False)
-
-                # For each dhcp-range/dhcp6-range path:
-                for range_path in dhcp_range_paths:
-                    # 3b. Get the 'start' and 'end' properties
-                    self._dhcp_range(range_path)
+                    # For each dhcp-subnet/dhcp6-subnet path:
+                    for subnet_path in dhcp_subnet_paths:
+                        # 2b. Get the 'network_name' property
+                        self._dhcp_subnet(subnet_path, dhcp_type, facts,
+                                          networks)
+
+                        # 3. dhcp-range
+                        # 3a. Check for any modelled 'dhcp-range' or
+                        #                   'dhcp6-range' items on subnet
+                        dhcp_range_paths = self.find(self.ms_node,
+                            subnet_path, "{0}-range".format(dhcp_type),
+                            assert_not_empty=False)
+
+                        # For each dhcp-range/dhcp6-range path:
+                        for range_path in dhcp_range_paths:
+                            # 3b. Get the 'start' and 'end' properties
+                            self._dhcp_range(range_path, facts)
@@ -15,8 +15,11 @@ program(s) have been supplied.
 '''
 
 from litp_cli_utils import CLIUtils
+from readiness_utils import ReadinessGate
 import test_constants
 from litp_generic_test import GenericTest, attr
+from fixture_utils import invalidate_if_mutating
+from watchdog_utils import use_watchdog
 
 
 class Story18326(GenericTest):
@@ -38,9 +41,12 @@ class Story18326(GenericTest):
         """
         # 1. Call super class setup
         super(Story18326, self).setUp()
+        use_watchdog(self)
+        invalidate_if_mutating(self)
         self.test_ms = self.get_management_node_filename()
         self.managed_nodes = self.get_managed_node_filenames()
         self.cli = CLIUtils()
+        self.readiness = ReadinessGate(self, self.test_ms)
 
     def tearDown(self):
         """
@@ -54,7 +60,18 @@ class Story18326(GenericTest):
         """
         super(Story18326, self).tearDown()
 
-    @attr('all', 'revert', 'vexpand_tc01',
+    def _wait_for_restored_nodes(self, expanded_nodes):
+        """
+        Description:
+            Wait for the nodes left after a snapshot restore to be ready.
+        Args:
+            expanded_nodes (list): Nodes added by the test, powered off by
+                                   the restore.
+        """
+        self.readiness.assert_ready([node for node in self.managed_nodes
+                                     if node not in expanded_nodes])
+
+    @attr('all', 'revert', 'mutating', 'vexpand_tc01',
           'expansion', 'expandc1n1toc1n1n2')
     def test_01_p_test_expansion(self):
         """
@@ -92,11 +109,12 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #6. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms, False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc02', 'expandc1n1toc1n1n2n3')
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc02',
+          'expandc1n1toc1n1n2n3')
     def test_02_p_test_expansion(self):
         """
         Description:
@@ -138,12 +156,13 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #6. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc03', 'expandc1n1toc1n1c2n1')
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc03',
+          'expandc1n1toc1n1c2n1')
     def test_03_p_test_expansion(self):
         """
         Description:
@@ -192,12 +211,12 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #7. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc04',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc04',
           'expandc1n1toc1n1c2n2n3')
     def test_04_p_test_expansion(self):
         """
@@ -252,7 +271,7 @@ class Story18326(GenericTest):
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc05',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc05',
           'expandc1n1toc1n1n2c2n1')
     def test_05_p_test_expansion(self):
         """
@@ -307,12 +326,12 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #7. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc06',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc06',
           'expandc1n1toc1n1c2n2c3n3')
     def test_06_p_test_expansion(self):
         """
@@ -375,12 +394,12 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #8. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc07',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc07',
           'expandc1n1toc1n1n2n3n4')
     def test_07_p_test_expansion(self):
         """
@@ -429,12 +448,13 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #7. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc08', 'expandc1n1c2n1c3n1')
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc08',
+          'expandc1n1c2n1c3n1')
     def test_08_p_test_expansion(self):
         """
         Description:
@@ -493,12 +513,13 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #8. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc09', 'expandc1n1c2n1c3n1')
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc09',
+          'expandc1n1c2n1c3n1')
     def test_09_p_test_expansion(self):
         """
         Description:
@@ -557,12 +578,12 @@ class Story18326(GenericTest):
         # as expanded nodes should be powered off before restoring back.
         self.execute_and_wait_restore_snapshot(self.test_ms,
                                                poweroff_nodes=nodes_to_expand)
-        self.run_command(self.test_ms, '/usr/bin/mco ping')
+        self._wait_for_restored_nodes(nodes_to_expand)
         #8. Create a new snapshot for the next test to have a restore_point
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc10',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc10',
           'expandc1n1toc1n1n2n3c2n4')
     def test_10_p_test_expansion(self):
         """
@@ -624,7 +645,7 @@ class Story18326(GenericTest):
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('all', 'revert', 'expansion', 'vexpand_tc11',
+    @attr('all', 'revert', 'mutating', 'expansion', 'vexpand_tc11',
           'expandc1n1toc1n1c2n2c3n3c4n4')
     def test_11_p_test_expansion(self):
         """
@@ -706,7 +727,7 @@ class Story18326(GenericTest):
         self.execute_and_wait_createsnapshot(self.test_ms,
                                              add_to_cleanup=False)
 
-    @attr('revert', 'expansion', 'vexpand_tc012', 'resume')
+    @attr('revert', 'mutating', 'expansion', 'vexpand_tc012', 'resume')
     def test_12_p_test_expansion_resume(self):
         """
         Description:
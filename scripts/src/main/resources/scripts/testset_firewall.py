@@ -11,6 +11,10 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from cassette_utils import use_cassette
+from deferred_log_utils import DeferredLogger
+from synthetic_deployment_utils import use_synthetic_deployment
 import re
 
 
@@ -43,7 +47,10 @@ class Firewall(GenericTest):
         """
         # 1. Call super class setup
         super(Firewall, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        use_synthetic_deployment(self)
+        use_cassette(self)
+        self.logger = DeferredLogger(self)
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.model["ms"][0]["fw_rules"] = []
 
@@ -158,7 +165,8 @@ class Firewall(GenericTest):
                 # c. Add MS firewall rules list to Model Data Structure.
                 self.model["ms"][0].update({"fw_rules": fw_rules_urls})
             else:
-                self.log('info', self.ms_node + ': No LITP firewall rules')
+                self.logger.log('info', '{0}: No LITP firewall rules',
+                                self.ms_node)
             return True
         else:
             return False
@@ -264,7 +272,8 @@ class Firewall(GenericTest):
                     # e. Store firewall rules in data structure.
                     node.update({"fw_rules": fw_rules_urls})
                 else:
-                    self.log('info', node["name"] + ': No LITP firewall rules')
+                    self.logger.log('info', '{0}: No LITP firewall rules',
+                                    node["name"])
 
     def _verify_iptables(self, node, rules_list, command='iptables',
                                                  table='filter'):
@@ -305,7 +314,8 @@ class Firewall(GenericTest):
         fw_rules_not_matched = rules_list[:]
 
         # c. Verify that iptables/ip6tables contained rules.
-        self.log('info', str(node) + ' ' + command + ' ' + table + ' Matching')
+        self.logger.log('info', '{0} {1} {2} Matching', node, command, table,
+                        node=node)
         # Loop through Firewall Rules list
         for fw_rule in rules_list:
             # Loop through the lines output by iptables/ip6tables
@@ -314,8 +324,8 @@ class Firewall(GenericTest):
                 # ['201 dnsudp', 'INPUT', 'udp', 'ACCEPT', 'NEW', '53']
                 # If line contains all of the rules from the firewall.
                 if all((rule in line) for rule in fw_rule):
-                    print "Line matched: {0} with {1}".format(line,
-                                                              fw_rule)
+                    self.logger.log('debug', 'Line matched: {0} with {1}',
+                                    line, fw_rule, node=node)
                     fw_rules_not_matched.remove(fw_rule)
 
         # d. Assert False if any rules were missing from tables.
@@ -649,11 +659,12 @@ class Firewall(GenericTest):
                 self.verify_fw_rules(node)
             # b4. Verify the iptables/ip6tables output also contains all
             #     default port information.
-            self.log('info', 'Verify Default LITP firewall rules on MS')
+            self.logger.log('info', 'Verify Default LITP firewall rules on MS')
             self._verify_iptables_default_ports(node)
         else:
-            self.log('info', 'Skip testing of MS as no firewall config exists')
-            self.log('info', 'Nothing to verify on MS')
+            self.logger.log('info', 'Skip testing of MS as no firewall config '
+                            'exists')
+            self.logger.log('info', 'Nothing to verify on MS')
 
         # d. Get all Firewall related data from LITP model and store in
         #    data structures.
@@ -675,13 +686,15 @@ class Firewall(GenericTest):
                 self.verify_fw_rules(node)
                 # f4. Verify the iptables/ip6tables output also contains all
                 #     default port information.
-                self.log('info', node + ': Verify Default LITP firewalls')
+                self.logger.log('info', '{0}: Verify Default LITP firewalls',
+                                node)
                 self._verify_iptables_default_ports(node)
             elif stored_node["fw_node_config"]:
                 # f5.
                 # If there are no fw rules, but there is 'firewall-node-config'
                 # item, then iptables/ip6tables should contain default rules.
-                self.log('info', node + ': Verify Default LITP firewalls')
+                self.logger.log('info', '{0}: Verify Default LITP firewalls',
+                                node)
                 self._verify_iptables_default_ports(node)
             else:
                 # f6.
@@ -693,9 +706,13 @@ class Firewall(GenericTest):
                     nodes = self.find(self.ms_node, cluster['url'], "node")
                     if node in nodes:
                         if cluster["fw_cluster_config"]:
-                            self.log('info', 'Cluster level fw-cluster-config')
-                            self.log('info', 'Verify Default LITP firewalls')
+                            self.logger.log('info', 'Cluster level '
+                                            'fw-cluster-config')
+                            self.logger.log('info', 'Verify Default LITP '
+                                            'firewalls')
                             self._verify_iptables_default_ports(node)
                         else:
-                            self.log('info', node + ' Empty iptables expected')
-                            self.log('info', 'Nothing to verify on ' + node)
+                            self.logger.log('info', '{0} Empty iptables '
+                                            'expected', node)
+                            self.logger.log('info', 'Nothing to verify on {0}',
+                                            node)
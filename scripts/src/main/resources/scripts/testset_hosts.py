@@ -11,6 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from async_utils import AsyncRunner
+from synthetic_deployment_utils import use_synthetic_deployment
 import test_constants
 
 
@@ -24,11 +27,13 @@ class Hosts(GenericTest):
         """ Setup Variables for every test """
 
         super(Hosts, self).setUp()
+        use_synthetic_deployment(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
+        self.remote = AsyncRunner(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -90,6 +95,16 @@ class Hosts(GenericTest):
                         d. Ensure that the (IP, Alias Names) pair
                                         exists in the /etc/hosts file.
         """
+        # Read /etc/hosts of every peer node at once, the checks below wait
+        # for each file when they need it. The MS file is read up front, as
+        # the model queries below also run over the MS connection.
+        ms_etc_hosts = self.get_file_contents(self.ms_node,
+                                              test_constants.ETC_HOSTS)
+        etc_hosts_futures = dict(
+            (node["name"], self.remote.get_file_contents_async(
+                node["name"], test_constants.ETC_HOSTS))
+            for node in self.all_nodes if node["name"] != self.ms_node)
+
         for node in self.all_nodes:
             node_name = node["name"]
 
@@ -97,8 +112,10 @@ class Hosts(GenericTest):
             alias = self.find(self.ms_node, node["url"], "alias",
                               assert_not_empty=False)
             # 2. Get the contents of /etc/hosts for this node
-            etc_hosts = \
-                self.get_file_contents(node_name, test_constants.ETC_HOSTS)
+            if node_name == self.ms_node:
+                etc_hosts = ms_etc_hosts
+            else:
+                etc_hosts = etc_hosts_futures[node_name].result()
 
             # For each 'alias' item type:
             for path in alias:
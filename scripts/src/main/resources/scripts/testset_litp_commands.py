@@ -11,8 +11,14 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from watchdog_utils import use_watchdog
 from redhat_cmd_utils import RHCmdUtils
 from litp_cli_utils import CLIUtils
+from artifact_utils import ArtifactStager
+from model_load_utils import ModelFragment
+from model_state_utils import ModelStateUtils
+from validation_utils import ValidationMatrix
 import test_constants
 import os
 
@@ -28,15 +34,21 @@ class LITPCommands(GenericTest):
         """ Setup Variables for every test """
 
         super(LITPCommands, self).setUp()
+        use_watchdog(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
         self.redhatutils = RHCmdUtils()
         self.cli = CLIUtils()
+        self.model_state = ModelStateUtils()
+        self.stager = ArtifactStager(self)
 
         # Define item types and URLs
+        self.items_url = "/software/items"
+        self.items_tag = "software-items-collection"
+        self.load_file = "/tmp/litp_commands_items.xml"
         self.config_class = "test-config"
         self.config_url = "/software/items/test_config"
         self.callback_class = "test-callback"
@@ -89,6 +101,72 @@ class LITPCommands(GenericTest):
         for value in props_dict.values():
             self.assertTrue(value in check_props.values())
 
+    def _create_items(self, items):
+        """
+        Description:
+            Create several items under /software/items with one litp load.
+            Ensure each item is in state "Initial".
+            Ensure the properties created are present in each item.
+
+        Args:
+            items (list): (url, class_type, props_dict) of each item.
+
+        Actions:
+            a. Build one model fragment holding all items.
+            b. Load the fragment into the model, merging it.
+            c. Show all items with a single recursive show.
+            d. Ensure each item is "Initial" with its properties present.
+        """
+        # a. Build one model fragment holding all items.
+        fragment = ModelFragment(self.items_url, self.items_tag)
+        for url, class_type, props_dict in items:
+            fragment.add_item(url, class_type, props_dict)
+
+        # b. Load the fragment into the model, merging it.
+        fragment.load(self, self.ms_node, self.load_file)
+
+        # c. Show all items with a single recursive show.
+        model_items = self.model_state.index_by_path(
+            self.model_state.get_model_items(self, self.ms_node,
+                                             self.items_url))
+
+        # d. Ensure each item is "Initial" with its properties present.
+        for url, class_type, props_dict in items:
+            self.assertTrue(url in model_items,
+                            "{0} was not created".format(url))
+            item = model_items[url]
+            self.assertEqual(class_type, item.item_type)
+            self.assertEqual("Initial", item.state)
+            for key, value in props_dict.iteritems():
+                self.assertEqual(value, item.properties.get(key))
+
+    def _remove_items(self, urls):
+        """
+        Description:
+            Remove several items under /software/items.
+            Check the model once to ensure all items have been removed.
+
+        Args:
+            urls (list): Paths of items to be removed.
+
+        Actions:
+            a. Remove each item.
+            b. Ensure no item is left in the model.
+        """
+        # a. Remove each item.
+        for url in urls:
+            _, stderr, rc = self.execute_cli_remove_cmd(self.ms_node, url)
+            self.assertEqual(stderr, [])
+            self.assertEqual(rc, 0)
+
+        # b. Ensure no item is left in the model.
+        model_items = self.model_state.index_by_path(
+            self.model_state.get_model_items(self, self.ms_node,
+                                             self.items_url))
+        for url in urls:
+            self.assertFalse(url in model_items,
+                             "{0} was not removed".format(url))
+
     def _remove_item(self, url):
         """
         Description:
@@ -163,47 +241,35 @@ class LITPCommands(GenericTest):
         check_props = self.get_props_from_url(self.ms_node, url, prop_name)
         self.assertEqual(check_props, prop_value)
 
-    def _create_invalid_item(self, url, class_type, invalid_props):
+    def _run_validation_matrix(self, matrix):
         """
         Description:
-            Attempt to create an item with invalid property values.
-            Check that each property gives an error.
-            Check that the item is not created in the model.
+            Run a matrix of invalid property values against litpd.
+            Log the coverage matrix.
+            Check that each case gives its expected error and that no
+                item is created in the model.
 
         Args:
-            url (str): Path to where item will be created.
-            class_type (str): Type of item to create.
-            invalid_props (dict): Property names and invalid values.
+            matrix (ValidationMatrix): Cases to run.
 
         Actions:
-            a. Arrange properties into correct format for create command.
-            b. Execute create command with invalid properties.
-            c. Check that each property gives an error.
-            d. Check that the item is not created in the model.
+            a. Run all cases with bounded concurrency.
+            b. Log the coverage matrix.
+            c. Check that each case failed with its expected error.
         """
-        # a. Arrange properties into correct format for create command.
-        props = ""
-        for key, value in invalid_props.iteritems():
-            props += "{0}={1} ".format(key, value)
+        # a. Run all cases with bounded concurrency.
+        results = matrix.run(self, self.ms_node)
 
-        # b. Execute create command with invalid properties.
-        _, stderr, rc = self.execute_cli_create_cmd(
-            self.ms_node, url, class_type, props, expect_positive=False)
-        self.assertNotEqual(stderr, [])
-        self.assertEqual(rc, 1)
-
-        # c. Check that each property gives an error.
-        for key in invalid_props:
-            check_error = 'ValidationError in property: \"{0}\"'.format(key)
-            self.assertTrue(any(check_error in s for s in stderr))
+        # b. Log the coverage matrix.
+        for line in matrix.get_coverage_report(results):
+            self.log("info", line)
 
-        # d. Check that the item is not created in the model.
-        _, stderr, rc = self.execute_cli_show_cmd(
-            self.ms_node, url, expect_positive=False)
-        self.assertEqual(rc, 1)
-        self.assertTrue(any("InvalidLocationError" in s for s in stderr))
+        # c. Check that each case failed with its expected error.
+        failed = [result for result in results if not result.passed]
+        self.assertEqual([], failed,
+                         "Validation cases failed: {0}".format(failed))
 
-    @attr('all', 'revert', 'system_functionality', 'LITPCommands',
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'LITPCommands',
           'LITPCommands_tc01')
     def test_p_litp_import_command(self):
         """
@@ -232,16 +298,12 @@ class LITPCommands(GenericTest):
                           + plugin_folder + pluginapi
 
         # 1. Copy the RPMs to the MS.
-        self.assertTrue(self.copy_file_to(
-            self.ms_node, plugin_path, "/tmp/"))
-        self.assertTrue(self.copy_file_to(
-            self.ms_node, plugin_api_path, "/tmp/"))
+        staged = self.stager.stage([plugin_path, plugin_api_path],
+                                   [self.ms_node], "/tmp/")
 
         # 2. Import the RPMs.
-        self.execute_cli_import_cmd(
-            self.ms_node, "/tmp/" + plugin, "litp")
-        self.execute_cli_import_cmd(
-            self.ms_node, "/tmp/" + pluginapi, "litp")
+        self.stager.import_rpms(self.ms_node, staged, "litp",
+                                skip_present=False)
 
         # 3. Install the RPMs
         self.assertTrue(
@@ -268,7 +330,7 @@ class LITPCommands(GenericTest):
         self.assertTrue(any(
             "ERIClitptest_pluginapi: 1.0.1" in s for s in stdout))
 
-    @attr('all', 'revert', 'system_functionality', 'LITPCommands',
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'LITPCommands',
           'LITPCommands_tc02')
     def test_p_litp_create_remove_items(self):
         """
@@ -302,33 +364,23 @@ class LITPCommands(GenericTest):
             8. Update an optional property of the item.
             9. Remove the item.
         """
-        # 1. Create a test-config item with mandatory properties ensuring
-        #        properties created are present in item.
-        config_props = {'mand_prop_1': 'test-config-1'}
-        self._create_item(self.config_url, self.config_class, config_props)
-
-        # 2. Create a test-callback item with mandatory properties ensuring
-        #        properties created are present in item.
-        callback_props = {'mand_prop_1': 'test-callback-1'}
-        self._create_item(self.callback_url,
-                          self.callback_class, callback_props)
-
-        # 3. Create a test-remote-execution item with mandatory properties
-        #       ensuring properties created are present in item.
-        remote_props = {'mand_prop_1': 'test-remote-1'}
-        self._create_item(self.remote_url, self.remote_class, remote_props)
-
-        # 4. Create a test-ordered-list item with mandatory properties ensuring
-        #        properties created are present in item.
-        ordered_props = {'mand_prop_1': 'test-ordered-1'}
-        self._create_item(self.ordered_url, self.ordered_class, ordered_props)
+        # 1-4. Create a test-config, test-callback, test-remote-execution
+        #        and test-ordered-list item with mandatory properties in
+        #        one load, ensuring properties created are present in items.
+        self._create_items([
+            (self.config_url, self.config_class,
+             {'mand_prop_1': 'test-config-1'}),
+            (self.callback_url, self.callback_class,
+             {'mand_prop_1': 'test-callback-1'}),
+            (self.remote_url, self.remote_class,
+             {'mand_prop_1': 'test-remote-1'}),
+            (self.ordered_url, self.ordered_class,
+             {'mand_prop_1': 'test-ordered-1'})])
 
         # 5. Remove all of the created items and
         #       ensure they have been removed from the model.
-        self._remove_item(self.config_url)
-        self._remove_item(self.callback_url)
-        self._remove_item(self.remote_url)
-        self._remove_item(self.ordered_url)
+        self._remove_items([self.config_url, self.callback_url,
+                            self.remote_url, self.ordered_url])
 
         # 6. Create a test-config item with a value for the default property.
         props_dict = {'mand_prop_1': 'test-plugin-1', 'def_prop_1': '0777',
@@ -365,37 +417,43 @@ class LITPCommands(GenericTest):
                 ensure each property gives an error and the item is not created
             4. Attempt to create a test-ordered-list item with invalid props,
                 ensure each property gives an error and the item is not created
+            5. Run all cases with bounded concurrency and log the coverage
+                matrix.
         """
+        error = 'ValidationError in property: "{prop}"'
+        matrix = ValidationMatrix(self.items_url)
+
         # 1. Attempt to create a test-config item with invalid properties,
         #       ensure each property gives an error and the item is not created
-        config_invalid_props = {'mand_prop_1': 'testInvalid',
-                                        'def_prop_1': 'invalidTest'}
-        self._create_invalid_item(self.config_url,
-                                  self.config_class, config_invalid_props)
+        matrix.add_invalid_props(self.config_class,
+                                 {'mand_prop_1': 'testInvalid',
+                                  'def_prop_1': 'invalidTest'},
+                                 error, {'mand_prop_1': 'test-config-1'})
 
         # 2. Attempt to create a test-callback item with invalid properties,
         #       ensure each property gives an error and the item is not created
-        callback_invalid_props = {'mand_prop_1': '123', 'def_prop_1': '04'}
-        self._create_invalid_item(self.callback_url,
-                                  self.callback_class, callback_invalid_props)
+        matrix.add_invalid_props(self.callback_class,
+                                 {'mand_prop_1': '123', 'def_prop_1': '04'},
+                                 error, {'mand_prop_1': 'test-callback-1'})
 
         # 3. Attempt to create a test-remote-execution item with invalid props,
         #       ensure each property gives an error and the item is not created
-        remote_invalid_props = {'mand_prop_1': 'test-config',
-                                                    'def_prop_1': '04444'}
-        self._create_invalid_item(self.remote_url,
-                                    self.remote_class, remote_invalid_props)
+        matrix.add_invalid_props(self.remote_class,
+                                 {'mand_prop_1': 'test-config',
+                                  'def_prop_1': '04444'},
+                                 error, {'mand_prop_1': 'test-remote-1'})
 
         # 4. Attempt to create test-ordered-list item with invalid properties,
         #       ensure each property gives an error and the item is not created
-        ordered_invalid_props = {'mand_prop_1': 'test_config_1'}
-        self._create_invalid_item(self.ordered_url, self.ordered_class,
-                                                        ordered_invalid_props)
+        matrix.add_invalid_props(self.ordered_class,
+                                 {'mand_prop_1': 'test_config_1'}, error)
+
+        self._run_validation_matrix(matrix)
 
         # Add an item type which has a read only property, try to create with
         #   that read only property, an error should be given
 
-    @attr('all', 'revert', 'system_functionality', 'LITPCommands',
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'LITPCommands',
           'LITPCommands_tc04')
     def test_p_item_type_config_callback_remote_execution(self):
         """
@@ -493,24 +551,19 @@ class LITPCommands(GenericTest):
                                                 is returned from the command.
             40. Check that all of the created files have been removed.
         """
-        # 1. Create a test-config item with mandatory and optional properties
-        #       ensuring the properties created are present in item.
-        config_props = {'mand_prop_1': 'test-config-1',
-                                            'opt_prop_1': 'OldValue'}
-        self._create_item(self.config_url, self.config_class, config_props)
-
-        # 2. Create a test-callback item with mandatory property ensuring
-        #       properties created are present in item.
-        callback_props = {'mand_prop_1': 'test-callback-1'}
-        self._create_item(self.callback_url,
-                          self.callback_class, callback_props)
-
-        # 3. Create a test-remote-execution item with mandatory property
-        #       ensuring properties created are present in item.
+        # 1-3. Create a test-config item with mandatory and optional
+        #       properties, a test-callback and a test-remote-execution
+        #       item with mandatory property in one load, ensuring the
+        #       properties created are present in the items.
         execution_url = "/software/items/test_exec"
         execution_class = "test-remote-execution"
-        execution_props = {'mand_prop_1': 'test-exec-1'}
-        self._create_item(execution_url, execution_class, execution_props)
+        self._create_items([
+            (self.config_url, self.config_class,
+             {'mand_prop_1': 'test-config-1', 'opt_prop_1': 'OldValue'}),
+            (self.callback_url, self.callback_class,
+             {'mand_prop_1': 'test-callback-1'}),
+            (execution_url, execution_class,
+             {'mand_prop_1': 'test-exec-1'})])
 
         file_names = ["test-config-1", "test-callback-1", "test-exec-1"]
         item_urls = [self.config_url, self.callback_url, execution_url]
@@ -790,7 +843,7 @@ class LITPCommands(GenericTest):
         for file_name in file_names:
             self.assertTrue(any(file_name not in s for s in dir_contents))
 
-    @attr('all', 'revert', 'system_functionality', 'LITPCommands',
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'LITPCommands',
           'LITPCommands_tc05')
     def test_n_fail_start_plan(self):
         """
@@ -869,7 +922,7 @@ class LITPCommands(GenericTest):
         self.assertTrue(self.wait_for_plan_state(
             self.ms_node, test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LITPCommands',
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'LITPCommands',
           'LITPCommands_tc06')
     def test_p_import_update_rpm(self):
         """
@@ -922,14 +975,12 @@ class LITPCommands(GenericTest):
                           + plugin_folder + pluginapi
 
         # 1. Copy the RPMs to the MS.
-        self.assertTrue(self.copy_file_to(
-            self.ms_node, plugin_path, "/tmp/"))
-        self.assertTrue(self.copy_file_to(
-            self.ms_node, plugin_api_path, "/tmp/"))
+        staged = self.stager.stage([plugin_path, plugin_api_path],
+                                   [self.ms_node], "/tmp/")
 
         # 2. Import the RPMs.
-        self.execute_cli_import_cmd(self.ms_node, "/tmp/" + plugin, "litp")
-        self.execute_cli_import_cmd(self.ms_node, "/tmp/" + pluginapi, "litp")
+        self.stager.import_rpms(self.ms_node, staged, "litp",
+                                skip_present=False)
 
         # 3. Upgrade the RPMs.
         cmd = self.redhatutils.get_yum_upgrade_cmd(
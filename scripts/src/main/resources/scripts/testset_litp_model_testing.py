@@ -11,6 +11,8 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from watchdog_utils import use_watchdog
 import test_constants
 
 
@@ -24,8 +26,9 @@ class LitpModelTests(GenericTest):
         """ Setup Variables for every test """
 
         super(LitpModelTests, self).setUp()
+        use_watchdog(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
 
     def tearDown(self):
@@ -62,8 +65,8 @@ class LitpModelTests(GenericTest):
             self.assertTrue(self.wait_for_plan_state(self.ms_node,
                 test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LitpModelTests',
-          'LitpModelTests_tc01')
+    @attr('all', 'revert', 'mutating', 'system_functionality',
+          'LitpModelTests', 'LitpModelTests_tc01')
     def test_create_litp_snapshot(self):
         """
         Description:
@@ -92,8 +95,8 @@ class LitpModelTests(GenericTest):
         self.assertTrue(self.wait_for_plan_state(self.ms_node,
                                                  test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LitpModelTests',
-          'LitpModelTests_tc02')
+    @attr('all', 'revert', 'mutating', 'system_functionality',
+          'LitpModelTests', 'LitpModelTests_tc02')
     def test_remove_litp_snapshot(self):
         """
         Description:
@@ -118,8 +121,8 @@ class LitpModelTests(GenericTest):
         self.assertTrue(self.wait_for_plan_state(self.ms_node,
                                      test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LitpModelTests',
-          'LitpModelTests_tc03')
+    @attr('all', 'revert', 'mutating', 'system_functionality',
+          'LitpModelTests', 'LitpModelTests_tc03')
     def test_create_litp_named_snapshot(self):
         """
         Description:
@@ -150,8 +153,8 @@ class LitpModelTests(GenericTest):
         self.assertTrue(self.wait_for_plan_state(self.ms_node,
                                      test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LitpModelTests',
-          'LitpModelTests_tc04')
+    @attr('all', 'revert', 'mutating', 'system_functionality',
+          'LitpModelTests', 'LitpModelTests_tc04')
     def test_remove_litp_named_snapshot(self):
         """
         Description:
@@ -179,8 +182,8 @@ class LitpModelTests(GenericTest):
         self.assertTrue(self.wait_for_plan_state(self.ms_node,
                                      test_constants.PLAN_COMPLETE))
 
-    @attr('all', 'revert', 'system_functionality', 'LitpModelTests',
-          'LitpModelTests_tc05', 'physical')
+    @attr('all', 'revert', 'mutating', 'system_functionality',
+          'LitpModelTests', 'LitpModelTests_tc05', 'physical')
     def test_litp_depl_and_named_snapshot(self):
         """
         Description:
@@ -11,8 +11,8 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
-from redhat_cmd_utils import RHCmdUtils
 from litp_cli_utils import CLIUtils
+from log_cursor_utils import LogCursor
 import test_constants
 
 
@@ -33,7 +33,6 @@ class LitpServiceBase(GenericTest):
         super(LitpServiceBase, self).setUp()
 
         self.ms_node = self.get_management_node_filename()
-        self.rhcmd = RHCmdUtils()
         self.cli = CLIUtils()
 
     def tearDown(self):
@@ -41,45 +40,22 @@ class LitpServiceBase(GenericTest):
 
         super(LitpServiceBase, self).tearDown()
 
-    def _check_msg_in_system_log(self, node, log_len, msg_str,
-                                       log_file='/var/log/messages'):
+    def _check_msg_in_system_log(self, log_cursor, msg_str):
         """
         Check that a message appears in the message log.
-        Will tail the log from the current point backwards to 'log_len'.
-        In other words, log_len is the start position in the log and
-        curr_log_pos is the end position.
+        Only the part of the log written since the cursor was marked is
+        read, so the check also works across a log rotation.
 
         Args:
-           node (str): The node whose log you wish to check.
-
-           log_len (str): Position in log to begin check.
+           log_cursor (LogCursor): Cursor marked before the action which
+                                   should log the message.
 
            msg_str (str): The message in question.
 
-       Kwargs:
-           log_file (str): Path to the log file in question,
-                           defaults to /var/log/messages.
-
         Returns:
         bool. True if found or False if not found.
         """
-        log_path = log_file
-        # Get current log length
-        curr_log_pos = self.get_file_len(node, log_path)
-        # Length of log to tail is current log length - old log length.
-        test_logs_len = curr_log_pos - log_len
-        cmd = self.rhcmd.get_grep_file_cmd(log_path, msg_str,
-                                   file_access_cmd="tail -n {0}"
-                                   .format(test_logs_len))
-        _, err, ret_code = self.run_command(node, cmd,
-                                              su_root=True)
-
-        self.assertTrue(ret_code < 2)
-        self.assertEqual([], err)
-        if ret_code == 0:
-            return True
-        else:
-            return False
+        return log_cursor.contains(msg_str)
 
     @attr('all', 'revert', 'system_check', 'litpservices', 'litpservices_tc01')
     def test_01_p_verify_litpservicebase(self):
@@ -122,8 +98,8 @@ class LitpServiceBase(GenericTest):
                                  "WARNING: LITP in Maintenance Mode!!!")
 
             if "logging" in url:
-                log_len = self.get_file_len(self.ms_node,
-                                            test_constants.GEN_SYSTEM_LOG_PATH)
+                log_cursor = LogCursor(self, self.ms_node,
+                                       test_constants.GEN_SYSTEM_LOG_PATH)
                 expected_msg = 'DEBUG:'
 
                 # Execute a command which will trigger DEBUG tracing if enabled
@@ -133,8 +109,8 @@ class LitpServiceBase(GenericTest):
                 self.assertEqual([], std_err)
 
                 # check /var/log/messages for DEBUG:
-                result = self._check_msg_in_system_log(self.ms_node,
-                                                       log_len, expected_msg)
+                result = self._check_msg_in_system_log(log_cursor,
+                                                       expected_msg)
 
                 if props['force_debug'] == 'true':
                     # Verify that DEBUG tracing is visible in log.
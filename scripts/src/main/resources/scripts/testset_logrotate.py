@@ -11,6 +11,8 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from logrotate_utils import LogrotateUtils, SCRIPT_KEYWORDS
 import test_constants
 
 
@@ -24,8 +26,9 @@ class Logrotate(GenericTest):
 
         super(Logrotate, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
+        self.logrotate = LogrotateUtils()
 
     def teardown(self):
         """ Teardown run after every test """
@@ -42,7 +45,7 @@ class Logrotate(GenericTest):
         new_string = new_string.replace(" ", "")
         return new_string
 
-    def check_logrotate_script_properties(self, prop, value, rule_config):
+    def check_logrotate_script_properties(self, prop, value, rule):
         """"
         Function to handle checking of scripts in logrotate config:
             postrotate
@@ -50,29 +53,21 @@ class Logrotate(GenericTest):
             firstaction
             lastaction
         """
-        idx = rule_config.index(prop)
-        config = rule_config[(idx + 1):]
-        endscript_idx = config.index("endscript")
+        self.assertTrue(prop in rule.scripts,
+                        "{0} script not configured".format(prop))
+        script = rule.scripts[prop]
 
-        if endscript_idx == 1:
+        if len(script) == 1:
             # there is only 1 line between the script initiator and the
             # endscript identifier so the LITP string can easily be compared
-            self.assertEqual(value, rule_config[idx + 1])
+            self.assertEqual(value, script[0])
 
         else:
             # in this case the script is over multiple lines. Lines need to be
             # concatenated. Remove spaces from LITP and logrotate config. As
             # the config is on multiple lines there is more than likely '\n'
             # values in the LITP config so removal of '\n' is also required
-
-            # take a slice of the logrotate config that holds only the lines
-            # betwwen the script initiator and endscript.
-            config = config[: endscript_idx]
-
-            # concatenate lines.
-            script_string = "".join(config)
-
-            script_string = self.string_format(script_string)
+            script_string = self.string_format("".join(script))
             value = self.string_format(value)
 
             self.assertEqual(value, script_string)
@@ -88,95 +83,96 @@ class Logrotate(GenericTest):
             1. Create a list of all nodes and MS to iterate over.
             2. For each node:
                 a. Get logrotate rules
-                b. For each rule:
-                    b1. Get rule properties
-                    b2. Check rule exists on node
-                    b3. Get rule config from node
-                    b4. Verify config from node matches model properties
+                b. Fetch and parse all rule configs from node in one call
+                c. For each rule:
+                    c1. Get rule properties
+                    c2. Check rule exists on node
+                    c3. Look up rule block in parsed config
+                    c4. Verify config from node matches model properties
         """
         # 1. Create a list of node items to iterate over. This list includes
         #    the MS as we need to check logrotate rules on it too.
         all_nodes = self.model["nodes"][:]
         all_nodes.extend(self.model["ms"][:])
 
+        # dict of intervals to convert from LITP to logrotate values.
+        # needed only for the rotate_every property.
+        interval = {"day": "daily", "week": "weekly",
+                    "month": "monthly", "year": "yearly"}
+
         for node in all_nodes:
             # a. Get logrotate rules
             rules = self.find(self.ms_node, node["url"], "logrotate-rule",
                               assert_not_empty=False)
+            if not rules:
+                continue
+
+            # b. Fetch and parse all rule configs from node in one call.
+            self.log("info", "Getting logrotate configs from {0}"
+                     .format(node["name"]))
+            cmd = self.logrotate.get_fetch_config_dir_cmd(
+                test_constants.LOGROTATE_PATH)
+            stdout, stderr, rc = self.run_command(node["name"], cmd,
+                                                  su_root=True)
+            self.assertEqual(0, rc)
+            self.assertEqual([], stderr)
+            configs = self.logrotate.parse_config_dir_output(stdout)
 
             for rule in rules:
-                # b1. Get rule properties.
+                # c1. Get rule properties.
                 props = self.get_props_from_url(self.ms_node, rule)
 
-                rule_path = "{0}{1}".format(test_constants.LOGROTATE_PATH,
-                                            props["name"])
-                # if the rule applys to multiple paths remove comma and replace
-                # with space
-                rule_path = rule_path.replace(",", " ")
-
-                # b2. Check rule exists on node.
-                self.assertTrue(self.remote_path_exists(node["name"],
-                                                        rule_path,
-                                                        su_root=True))
-
-                # b3. Get rule config from node.
-                self.log("info", "Getting config for rule {0} from {1}"
-                         .format(props["name"], node["name"]))
-                rule_config = self.get_file_contents(node["name"], rule_path,
-                                                     su_root=True)
-
-                # b4. Verify config from node matches model properties.
-
-                # remove useless lines from config
-                # if the rule applies to multiple logs then the comma separated
-                # line needs to be changed to whitespace separated
-                index = rule_config.index("{0} {{"
-                                          .format(props["path"]
-                                                  .replace(",", " ")))
-                rule_config = rule_config[(index + 1): -1]
+                # c2. Check rule exists on node.
+                self.assertTrue(props["name"] in configs,
+                                "{0}{1} does not exist on {2}".format(
+                                    test_constants.LOGROTATE_PATH,
+                                    props["name"], node["name"]))
+
+                # c3. Look up rule block in parsed config. If the rule
+                # applies to multiple logs the paths are comma separated in
+                # the model and whitespace separated in the config.
+                rule_config = configs[props["name"]].get_rule(props["path"])
+                self.assertNotEqual(None, rule_config,
+                                    "No block for {0} in rule {1}".format(
+                                        props["path"], props["name"]))
 
                 # remove name and path properties from model properties as they
                 # will not be in the config from the node.
                 del props["name"]
                 del props["path"]
 
-                # dict of intervals to convert from LITP to logrotate values.
-                # needed only for the rotate_every property.
-                interval = {"day": "daily", "week": "weekly",
-                            "month": "monthly", "year": "yearly"}
-                scripts = ["prerotate", "postrotate",
-                           "firstaction", "lastaction"]
-
+                # c4. Verify config from node matches model properties.
                 for prop in props:
                     # If the property is a boolean then in the rule config we
                     # need to match e.g. create or nocreate for true or false
                     # respectively.
 
                     if props[prop].lower() == "true":
-                        self.assertTrue(prop in rule_config)
+                        self.assertTrue(rule_config.has(prop))
                         continue
 
                     if props[prop].lower() == "false":
                         if prop == "ifempty":
-                            self.assertTrue(("not" + prop) in rule_config)
+                            self.assertTrue(rule_config.has("not" + prop))
                             continue
 
                         if prop == "mailfirst" or prop == "maillast":
                             if props[prop] == "false":
-                                self.assertTrue(prop not in rule_config)
+                                self.assertFalse(rule_config.has(prop))
                                 continue
 
-                            self.assertTrue(prop in rule_config)
+                            self.assertTrue(rule_config.has(prop))
                             continue
 
-                        self.assertTrue(("no" + prop) in rule_config)
+                        self.assertTrue(rule_config.has("no" + prop))
                         continue
 
                     if prop == "rotate_every":
-                        self.assertTrue(interval[props[prop]] in rule_config)
+                        self.assertTrue(
+                            rule_config.has(interval[props[prop]]))
                         continue
 
-                    if prop in scripts:
+                    if prop in SCRIPT_KEYWORDS:
                         # this option is a script and will appear on multiple
                         # lines. Use function to handle.
                         self.check_logrotate_script_properties(prop,
@@ -186,5 +182,6 @@ class Logrotate(GenericTest):
 
                     # property is not a bool, a script or rotate_every so
                     # must have a value.
-                    self.assertTrue("{0} {1}".format(prop, props[prop])
-                                    in rule_config)
+                    self.assertEqual(props[prop], rule_config.get(prop),
+                                     "{0} {1} not in rule config".format(
+                                         prop, props[prop]))
@@ -15,6 +15,10 @@ from redhat_cmd_utils import RHCmdUtils
 from networking_utils import NetworkingUtils
 from vcs_utils import VCSUtils
 from storage_utils import StorageUtils
+from repo_probe_utils import RepoProbe, PROBE_URL
+from service_utils import ServiceStateCollector
+from deferred_log_utils import DeferredLogger
+from facts_utils import FactsCollector
 import test_constants
 import simplejson
 
@@ -34,6 +38,11 @@ class MSVM(GenericTest):
         self.vcs = VCSUtils()
         self.net = NetworkingUtils()
         self.stor = StorageUtils()
+        self.repo_probe = RepoProbe(self)
+        self.service_states = ServiceStateCollector(self)
+        self.logger = DeferredLogger(self)
+        self.facts = FactsCollector(self)
+        self.facts.sweep()
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -91,7 +100,7 @@ class MSVM(GenericTest):
 
             vm_service_list.append(vm_service_dict)
 
-        self._print_list(0, vm_service_list)
+        self.logger.log_structure("debug", "MS VM services", vm_service_list)
         return vm_service_list
 
     def _check_vm_service(self, service, host):
@@ -155,13 +164,16 @@ class MSVM(GenericTest):
         self.log('info',
                  'Check "tuned" is running for VM Service: "{0}" on '
                  'node: "{1}"'.format(service['service_name'], self.ms_node))
-        self.get_service_status(self.ms_node, 'tuned')
+        self.service_states.assert_running(
+            self.ms_node,
+            self.service_states.collect(self.ms_node, ['tuned']))
 
     def _check_vm_network_interface(self, service, host, vm_node):
         """
         Check the vm-network-interface type for a VM service
         """
-        node_rh_ver = self.get_rhelver_used_on_node(vm_node, host)
+        node_rh_ver = self.facts.get_node_facts(vm_node,
+                                                via_node=host).rhel_version
         cmd = self.net.get_ifconfig_cmd()
         out, err, rc = self.run_command_via_node(host, vm_node, cmd)
         self.assertEqual(0, rc)
@@ -537,8 +549,10 @@ class MSVM(GenericTest):
             self.log('info', 'Checking vm-image source_uri for VM Service:'
                      ' "{0}" on node: "{1}"'
                      .format(service['service_name'], self.ms_node))
-            self.assertTrue(self.check_repo_url_exists(self.ms_node,
-                                                       image['source_uri']))
+            self.assertTrue(self.repo_probe.is_reachable(
+                self.ms_node, PROBE_URL, image['source_uri']),
+                "URL {0} not reachable from {1}.".format(
+                    image['source_uri'], self.ms_node))
 
             # c. Check the 'vm-network-interface' type
             self._check_vm_network_interface(msvm, self.ms_node, vm_node)
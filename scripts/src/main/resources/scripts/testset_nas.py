@@ -11,7 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 from storage_utils import StorageUtils
+from model_index_utils import get_model_index
 import test_constants
 import re
 
@@ -29,7 +31,7 @@ class Nas(GenericTest):
 
         super(Nas, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
@@ -322,12 +324,13 @@ class Nas(GenericTest):
                                     18. Match SFS file path, IPs and user
                                             options on model with SFS.
         """
+        # Every find below is answered by an index of one model export.
+        index = get_model_index(self, self.ms_node)
         for node in self.all_nodes:
             node_name = node["name"]
 
             # 1. Check for any modelled 'nfs-mount' items on node
-            nfs_mount_paths = self.find(self.ms_node, node["url"],
-                                "nfs-mount", assert_not_empty=False)
+            nfs_mount_paths = index.find(node["url"], "nfs-mount")
 
             # For each path of type 'nfs-mount':
             for mount_path in nfs_mount_paths:
@@ -340,16 +343,14 @@ class Nas(GenericTest):
                 provider = prop_nfs['provider']
 
                 # 3. Check for any modelled 'nfs-service' items
-                nfs_serv = self.find(self.ms_node, "/infrastructure",
-                            "nfs-service", assert_not_empty=False)
+                nfs_serv = index.find("/infrastructure", "nfs-service")
 
                 # 4. Check for any modelled 'sfs-service' items
-                sfs_services = self.find(self.ms_node, "/infrastructure",
-                                     "sfs-service", assert_not_empty=False)
+                sfs_services = index.find("/infrastructure", "sfs-service")
 
                 # 5. Check for any modelled 'sfs-virtual-server' items
-                sfs_virt = self.find(self.ms_node, "/infrastructure",
-                            "sfs-virtual-server", assert_not_empty=False)
+                sfs_virt = index.find("/infrastructure",
+                                      "sfs-virtual-server")
 
                 # 6. Run 'mount' command on node to compare 'nfs-mount'
                 # properties and 'ipv4address' property from any nfs-service,
@@ -385,8 +386,7 @@ class Nas(GenericTest):
 
                             # 10. Check for any modelled 'sfs-pool'
                             #       items under the sfs-service path
-                            sfs_pool = self.find(self.ms_node, sfs_serv_path,
-                                            "sfs-pool", assert_not_empty=False)
+                            sfs_pool = index.find(sfs_serv_path, "sfs-pool")
 
                             # For each path of type 'sfs-pool':
                             for pool_path in sfs_pool:
@@ -396,8 +396,7 @@ class Nas(GenericTest):
 
                                 # 12. Check for any modelled 'sfs-cache' items
                                 #           under the sfs-pool path
-                                sfs_cache = self.find(self.ms_node, pool_path,
-                                        "sfs-cache", assert_not_empty=False)
+                                sfs_cache = index.find(pool_path, "sfs-cache")
 
                                 # For each path of type 'sfs-cache':
                                 for cache_path in sfs_cache:
@@ -407,9 +406,8 @@ class Nas(GenericTest):
 
                                     # 14. Check for any modelled sfs-filesystem
                                     #       items under the sfs-pool path
-                                    sfs_fs = self.find(self.ms_node,
-                                        pool_path, "sfs-filesystem",
-                                            assert_not_empty=False)
+                                    sfs_fs = index.find(pool_path,
+                                                        "sfs-filesystem")
 
                                     # For each path of type 'sfs-filesystem':
                                     for file_path in sfs_fs:
@@ -431,9 +429,8 @@ class Nas(GenericTest):
                                         # 17. Check for any modelled
                                         #   'sfs-export' items under
                                         #       the sfs-pool path
-                                        sfs_exports = self.find(self.ms_node,
-                                            file_path, "sfs-export",
-                                                assert_not_empty=False)
+                                        sfs_exports = index.find(file_path,
+                                                                 "sfs-export")
 
                                         # For each path of type 'sfs-export':
                                         for sfs_export in sfs_exports:
@@ -11,7 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 from networking_utils import NetworkingUtils
+from cassette_utils import use_cassette
 import test_constants
 import re
 
@@ -25,8 +27,9 @@ class Network(GenericTest):
         """ Setup Variables for every test """
 
         super(Network, self).setUp()
+        use_cassette(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
@@ -11,6 +11,7 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 
 
 class Node(GenericTest):
@@ -21,7 +22,7 @@ class Node(GenericTest):
     def setUp(self):
         """ Setup Variables for every test """
         super(Node, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.all_nodes = self.model["nodes"][:]
         self.ms_node = self.model["ms"][0]
 
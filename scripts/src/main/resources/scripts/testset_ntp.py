@@ -11,6 +11,7 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 import test_constants
 import socket
 
@@ -26,7 +27,7 @@ class NetworkTimeProtocol(GenericTest):
 
         super(NetworkTimeProtocol, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
@@ -11,7 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
-import test_constants
+from fixture_utils import get_model
+from facts_utils import FactsCollector
+from repo_probe_utils import RepoProbe, PROBE_DIR
 import re
 
 
@@ -25,7 +27,7 @@ class OSProfile(GenericTest):
 
         super(OSProfile, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
@@ -35,6 +37,10 @@ class OSProfile(GenericTest):
                                "version",
                                "path",
                                "arch"]
+        self.facts = FactsCollector(self)
+        # OS facts of the MS, nodes and SFS nodes, swept once per run.
+        self.facts.sweep()
+        self.repo_probe = RepoProbe(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -50,17 +56,24 @@ class OSProfile(GenericTest):
             configured appropriately on all nodes.
 
         Actions:
-            1. For each node:
+            1. Get the OS facts of all nodes, swept in setUp.
+            2. For each node:
                 a. Find all modelled 'os-profile' items.
                 b. Get all 'os-profile' properties.
-                c. Use command to get breed, architecture and version.
+                c. Use release fact to get breed, architecture and version.
                 d. Verify breed, architecture and version are as expected.
                 e. Verify OS post-kernel options in '/proc/cmdline'
-                f. Verify path exists on the Management Server
+            3. Verify all profile paths exist on the Management Server
         """
-        # 1. For each node check all modelled 'os-profile' items  are correct.
+        # 1. Get the OS facts of all nodes, swept in setUp.
+        all_facts = self.facts.collect([node["name"]
+                                        for node in self.all_nodes])
+        profile_paths = []
+
+        # 2. For each node check all modelled 'os-profile' items are correct.
         for node in self.all_nodes:
             name = node["name"]
+            node_facts = all_facts[name]
             # a. find modelled os-profiles for node/ms
             osprofiles = self.find(self.ms_node, node["url"], "os-profile",
                                  assert_not_empty=False)
@@ -69,16 +82,13 @@ class OSProfile(GenericTest):
                 # b. get all 'os-profile' properties
                 props = self.get_props_from_url(self.ms_node, osprofile)
 
-                # c. Use check redhat rpm installed command to get info.
-                cmd = "/bin/rpm -qa '*release-server*'"
-                stdout, stderr, rc = self.run_command(node["name"], cmd)
-                self.assertNotEqual([], stdout)
-                self.assertEqual([], stderr)
-                self.assertEqual(0, rc)
+                # c. Use the release fact, the output of
+                # /bin/rpm -qa '*release-server*', to get info.
+                self.assertNotEqual("", node_facts.release)
 
                 # Output of command is in following format
                 # redhat-release-server-7.9-3.el7.x86_64
-                output = re.split('[-|.]', stdout[0])
+                output = re.split('[-|.]', node_facts.release)
 
                 # d. Verify breed, architecture and version are as expected.
                 breed = output[0]
@@ -100,19 +110,20 @@ class OSProfile(GenericTest):
                 self.assertEqual(props["version"], version)
 
                 # e. Verify OS post-kernel options
-                file_to_check = test_constants.KERNEL_CMDLINE_CONFIG_FILE
                 expected = props["kopts_post"]
                 self.log("info", name + " Verifying 'kopts_post' is {0}"\
                                                 .format(props["kopts_post"]))
-                stdout = self.get_file_contents(node["name"], file_to_check)
-                self.assertTrue(self.is_text_in_list(expected, stdout), \
-                       "{0} not in {1}".format(expected, file_to_check))
-
-                # f. Verify path exists on the Management Server
-                self.log("info", name + " Verifying 'path' {0} exists on MS"\
-                                                 .format(props["path"]))
-                self.assertTrue(self.remote_path_exists(self.ms_node,
-                                                        props["path"],
-                                                        expect_file=False,
-                                                        su_root=False),
-                               "path {0} does not exist".format(props["path"]))
+                self.assertTrue(expected in node_facts.cmdline, \
+                       "{0} not in /proc/cmdline".format(expected))
+
+                if props["path"] not in profile_paths:
+                    profile_paths.append(props["path"])
+
+        # 3. Verify all profile paths exist on the Management Server
+        self.log("info", "Verifying 'path' {0} exist on MS"\
+                                         .format(", ".join(profile_paths)))
+        probes = [(self.ms_node, PROBE_DIR, path) for path in profile_paths]
+        results = self.repo_probe.probe(probes)
+        for probe in probes:
+            self.assertTrue(results[probe],
+                            "path {0} does not exist".format(probe[2]))
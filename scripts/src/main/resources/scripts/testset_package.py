@@ -11,6 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from stream_utils import RemoteStream
+from synthetic_deployment_utils import use_synthetic_deployment
 
 
 class Package(GenericTest):
@@ -22,8 +25,9 @@ class Package(GenericTest):
         """ Setup Variables for every test """
 
         super(Package, self).setUp()
+        use_synthetic_deployment(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
 
     def teardown(self):
@@ -62,16 +66,19 @@ class Package(GenericTest):
             packages = self.find(self.ms_node, node["url"], "package",
                                  assert_not_empty=False)
 
-            for package in packages:
-                # b. get all package properties
-                props = self.get_props_from_url(self.ms_node, package)
+            # b. get all package properties
+            package_props = [self.get_props_from_url(self.ms_node, package)
+                             for package in packages]
 
-                # c. Check package is installed.
-                cmd = "/bin/rpm -qa | grep {0}".format(props["name"])
-                stdout, stderr, rc = self.run_command(node["name"], cmd)
-                self.assertTrue(props["name"] in stdout[0])
-                self.assertEqual(stderr, [])
-                self.assertEqual(rc, 0)
+            # c. Check packages are installed, reading 'rpm -qa' only until
+            #    every modelled package has been seen.
+            installed = RemoteStream(self, node["name"], "/bin/rpm -qa")\
+                .find_each([props["name"] for props in package_props])
+
+            for props in package_props:
+                self.assertNotEqual(None, installed[props["name"]],
+                                    "{0} not installed on {1}".format(
+                                        props["name"], node["name"]))
 
                 # d. Check package epoch if not 0(default)
                 if not props["epoch"] == "0":
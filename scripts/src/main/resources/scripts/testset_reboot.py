@@ -11,6 +11,11 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import invalidate_if_mutating
+from watchdog_utils import use_watchdog
+from facts_utils import FactsCollector
+from artifact_utils import ArtifactStager
+from readiness_utils import ReadinessGate
 import test_constants
 import os
 
@@ -24,16 +29,24 @@ class TestReboot(GenericTest):
         """ Setup Variables for every test """
 
         super(TestReboot, self).setUp()
+        use_watchdog(self)
+        invalidate_if_mutating(self)
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
         self.all_nodes = self.mn_nodes + [self.ms_node]
+        self.facts = FactsCollector(self)
+        # Baseline facts, refreshed after the reboot.
+        self.facts.sweep()
+        self.stager = ArtifactStager(self)
+        self.readiness = ReadinessGate(self, self.ms_node)
 
     def teardown(self):
         """ Teardown run after every test """
 
         super(TestReboot, self).tearDown()
 
-    @attr('all', 'revert', 'system_functionality', 'reboot', 'reboot_tc01')
+    @attr('all', 'revert', 'mutating', 'system_functionality', 'reboot',
+          'reboot_tc01')
     def test_reboot_01(self):
         """
         Description:
@@ -46,6 +59,8 @@ class TestReboot(GenericTest):
             # 5: Mark deployment for upgrade
             # 6: Execute create plan
             # 7: Run Plan
+            # 8: Wait for the managed nodes to be ready and refresh the
+            #    facts changed by the reboot
         """
         rpm_dir = os.path.join(os.path.dirname(__file__), 'reboot_rpms')
         base_rpm = os.path.join(rpm_dir, 'popcorn-kernel-1.0-1.el6.x86_64.rpm')
@@ -63,18 +78,16 @@ class TestReboot(GenericTest):
         #     self.remove_rpm_on_node(node, 'popcorn-kernel')
 
         # 1: Install the initial version of the rpm
-        for node in self.all_nodes:
-            self.assertTrue(
-                self.copy_and_install_rpms(node, [base_rpm], '/tmp'))
+        staged_base = self.stager.stage([base_rpm], self.all_nodes, '/tmp')
+        self.stager.install_rpms(self.all_nodes, staged_base)
 
         # 2: Copy the upgrade rpm to the MS
-        self.assertTrue(
-            self.copy_file_to(self.ms_node, upgrade_rpm, '/tmp'))
+        staged_upgrade = self.stager.stage([upgrade_rpm], [self.ms_node],
+                                           '/tmp')
 
         # 3: Import the updated rpm
-        self.execute_cli_import_cmd(
-            self.ms_node, '/tmp/popcorn-kernel-1.1-1.el6.x86_64.rpm',
-            test_constants.OS_UPDATES_PATH_RHEL7)
+        self.stager.import_rpms(self.ms_node, staged_upgrade,
+                                test_constants.OS_UPDATES_PATH_RHEL7)
 
         # 4: Upgrade using yum
         stdout, stderr, rc = self.run_command(
@@ -98,3 +111,10 @@ class TestReboot(GenericTest):
                                           test_constants.PLAN_COMPLETE,
                                           timeout_mins=30)
         self.assertTrue(result)
+
+        # 8: Wait for the managed nodes to be ready and refresh the facts
+        #    changed by the reboot
+        self.readiness.assert_ready(self.mn_nodes)
+        for node, facts in self.facts.refresh(self.mn_nodes).items():
+            self.log('info', "{0} running kernel {1}, up {2}s".format(
+                node, facts.kernel, facts.uptime))
@@ -11,6 +11,8 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
+from service_utils import ServiceStateCollector
 
 
 class Service(GenericTest):
@@ -21,10 +23,11 @@ class Service(GenericTest):
     def setUp(self):
         """ Setup Variables for every test """
         super(Service, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
         self.ms_node = self.model["ms"][0]["name"]
+        self.service_states = ServiceStateCollector(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -41,7 +44,8 @@ class Service(GenericTest):
                 1. Retrieve the service items in each node
             B
                 1. Check whether the required property values are set
-                2. Assert that the service is running
+                2. Collect the state of all services of the node in one
+                    call and assert that each service is running
         """
         for node in self.all_nodes:
             # A1. Retrieve the service items in each node
@@ -51,14 +55,15 @@ class Service(GenericTest):
                 self.log('info', "There's no service item " +\
                                 "in: {0}".format(node['name']))
             else:
+                service_names = []
                 for service in services:
                     service_values = \
                                 self.get_props_from_url(self.ms_node, service)
                     # B1. Check whether the required property values are set
                     self.assertNotEqual("", service_values["cleanup_command"])
-                    # B2. Assert that the service is running
-                    _, std_err, r_code = \
-                                self.get_service_status(node['name'], \
-                                            service_values["service_name"])
-                    self.assertEqual([], std_err)
-                    self.assertEqual(0, r_code)
+                    service_names.append(service_values["service_name"])
+                # B2. Assert that the services are running
+                states = self.service_states.collect(node['name'],
+                                                     service_names)
+                self.service_states.assert_running(node['name'], states,
+                                                   service_names)
@@ -11,6 +11,7 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr, StorageUtils
+from fixture_utils import get_model
 import test_constants
 import sys
 
@@ -29,7 +30,7 @@ class Snapshot(GenericTest):
 
         super(Snapshot, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
 
     def tearDown(self):
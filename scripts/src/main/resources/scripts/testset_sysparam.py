@@ -11,6 +11,7 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 import test_constants
 
 
@@ -28,7 +29,7 @@ class Sysparam(GenericTest):
 
         super(Sysparam, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
 
     def tearDown(self):
@@ -11,8 +11,13 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 from redhat_cmd_utils import RHCmdUtils
 from vcs_utils import VCSUtils
+from service_utils import ServiceStateCollector
+from cassette_utils import use_cassette
+from deferred_log_utils import DeferredLogger
+from model_index_utils import get_model_index
 
 
 class VCS(GenericTest):
@@ -26,12 +31,15 @@ class VCS(GenericTest):
         """ Setup Variables for every test """
 
         super(VCS, self).setUp()
+        use_cassette(self)
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.rhc = RHCmdUtils()
         self.vcs = VCSUtils()
+        self.service_states = ServiceStateCollector(self)
+        self.logger = DeferredLogger(self)
 
         # list of configuration files paths
         self.files_paths = ['/etc/sysconfig/llt', '/etc/sysconfig/gab',
@@ -94,16 +102,14 @@ class VCS(GenericTest):
                            'file-system', 'service', 'lsb-runtime']
         prop_dict = {}
         service_group = {}
+        index = get_model_index(self, self.ms_node)
 
         for cluster in self.model['clusters']:
 
-            clus_servs = self.find(self.ms_node, cluster['url'],
-                                   'vcs-clustered-service',
-                                   assert_not_empty=False)
+            clus_servs = index.find(cluster['url'], 'vcs-clustered-service')
             for serv in clus_servs:
                 # Check if this clustered service is a vm service
-                vm_service = self.find(self.ms_node, serv, 'vm-service',
-                                  assert_not_empty=False)
+                vm_service = index.find(serv, 'vm-service')
                 # Ignore if VM service as it's tested in testset_vcs_vm.py
                 if vm_service:
                     continue
@@ -120,8 +126,7 @@ class VCS(GenericTest):
                 prop_dict = {}
 
                 for itype in multi_type_list:
-                    urls = self.find(self.ms_node, serv, itype,
-                                     assert_not_empty=False)
+                    urls = index.find(serv, itype)
                     for url in urls:
                         props = self.get_props_from_url(self.ms_node, url)
                         prop_dict['url'] = url
@@ -138,9 +143,8 @@ class VCS(GenericTest):
                 service_groups.append(service_group)
                 service_group = {}
 
-        self.log("info", "Printing dict from get_vcs_model_info()")
-        self._print_list(0, service_groups)
-        self.log("info", "Finished printing dict")
+        self.logger.log_structure("debug", "Dict from get_vcs_model_info()",
+                                  service_groups)
 
         return service_groups
 
@@ -200,8 +204,8 @@ class VCS(GenericTest):
 
             if self.disk_props[key] != props_list[key]:
 
-                self.log('info', "The property '{0}' is missing!"
-                         .format(self.disk_props[key]))
+                self.logger.log('info', "The property '{0}' is missing!",
+                                self.disk_props[key])
 
                 return False
 
@@ -231,14 +235,14 @@ class VCS(GenericTest):
 
             self.assertEqual(0, num_disks)
 
-        self.log("info", "Cluster Type: " + cluster_type +
-                 ", Number of Fencing disks: " + str(num_disks))
+        self.logger.log("info", "Cluster Type: {0}, Number of Fencing disks: "
+                        "{1}", cluster_type, num_disks)
 
         # Get the UUIDs of the fencing disks specified
         uuid_specified_list = []
 
         if num_disks == 0:
-            self.log("info", "No fencing disks in model.")
+            self.logger.log("info", "No fencing disks in model.")
 
         else:
 
@@ -246,8 +250,8 @@ class VCS(GenericTest):
 
                 props = self.get_props_from_url(self.ms_node, fen_disk_url)
 
-                self.log("info", "Cluster id: " + cluster_id +
-                         ", Properties: " + str(props))
+                self.logger.log("info", "Cluster id: {0}, Properties: {1}",
+                                cluster_id, props)
 
                 # Check if all the properties are set
                 prop_names = props.keys()
@@ -270,24 +274,24 @@ class VCS(GenericTest):
                 cluster are set correctly
         """
 
-        self.log("info", "Checking that the property 'cluster_type' is "
-                         "present")
+        self.logger.log("info", "Checking that the property 'cluster_type' is "
+                        "present")
         self.assertTrue("cluster_type" in props)
 
-        self.log("info", "Checking that the property 'cluster_id' is "
-                         "present")
+        self.logger.log("info", "Checking that the property 'cluster_id' is "
+                        "present")
         self.assertTrue("cluster_id" in props)
 
-        self.log("info", "Checking that the property 'default_nic_monitor' is "
-                         "present")
+        self.logger.log("info", "Checking that the property "
+                        "'default_nic_monitor' is present")
         self.assertTrue("default_nic_monitor" in props)
 
-        self.log("info", "Checking that the property 'llt_nets' is "
-                         "present")
+        self.logger.log("info", "Checking that the property 'llt_nets' is "
+                        "present")
         self.assertTrue("llt_nets" in props)
 
-        self.log("info", "Checking that the property 'low_prio_net' is "
-                         "present")
+        self.logger.log("info", "Checking that the property 'low_prio_net' is "
+                        "present")
         self.assertTrue("low_prio_net" in props)
 
     def _verify_cluster_packages_installed(self, node_name, cluster):
@@ -331,12 +335,12 @@ class VCS(GenericTest):
             # For each filesystem in the model
             for filesys in fss:
 
-                self.log("info", "VXVM Volume URL: {0}".format(filesys))
+                self.logger.log("info", "VXVM Volume URL: {0}", filesys)
 
                 # Get the url of the inherited path in the model
                 vxvm = self.deref_inherited_path(self.ms_node, filesys["url"])
 
-                self.log("info", "Inherited from {0}".format(vxvm))
+                self.logger.log("info", "Inherited from {0}", vxvm)
 
                 # Get the URL and the properties of the volume group
                 volume_grp_url = "/".join(vxvm.split("/")[:-2])
@@ -358,21 +362,20 @@ class VCS(GenericTest):
                 # If the service name is in the service group name
                 if service in service_group:
 
-                    self.log("info", "Service '{0}' is in Service group '{1}'"
-                             .format(service,
-                                     service_group))
+                    self.logger.log("info", "Service '{0}' is in Service "
+                                    "group '{1}'", service, service_group)
 
                     for state in gp_states["State"]:
 
                         # If the service group is online
                         if state["VALUE"] == "|ONLINE|":
 
-                            self.log("info", "Service group '{0}' is ONLINE"
-                                     .format(service_group))
+                            self.logger.log("info", "Service group '{0}' is "
+                                            "ONLINE", service_group)
 
-                            self.log("info", "Checking if volume '{0}' is on "
-                                             "{1}".format(volume,
-                                                          state["SYSTEM"]))
+                            self.logger.log("info", "Checking if volume '{0}' "
+                                            "is on {1}", volume,
+                                            state["SYSTEM"])
 
                             # This command checks if the vxvm volume is
                             # available on the node
@@ -386,8 +389,8 @@ class VCS(GenericTest):
                             self.assertEqual([], stderr)
                             self.assertEqual(0, rc)
 
-                            self.log("info", "VXVM volume is on {0}".format(
-                                state["SYSTEM"]))
+                            self.logger.log("info", "VXVM volume is on {0}",
+                                            state["SYSTEM"])
 
     def _verify_haconfig_props(self, cluster, resource, node_name):
         """
@@ -399,8 +402,8 @@ class VCS(GenericTest):
             # Get dictionary of ha-service-config properties
             props = cluster["ha-service-config"]
 
-            self.log("info", "Ha-Service-Config properties : {0}"
-                     .format(props))
+            self.logger.log("info", "Ha-Service-Config properties : {0}",
+                            props)
 
             for res in resource:
                 # Check that this resource is an Application.
@@ -409,8 +412,8 @@ class VCS(GenericTest):
                 stdout, stderr, rc = self.run_command(node_name, cmd,
                                                       su_root=True)
                 if [] != stdout and [] == stderr and rc == 1:
-                    self.log("info", "This resource {0} is not of type "
-                                     "Application, skipping.".format(res))
+                    self.logger.log("info", "This resource {0} is not of type "
+                                    "Application, skipping.", res)
                     continue
 
                 self.assertEquals([], stderr)
@@ -438,23 +441,23 @@ class VCS(GenericTest):
                         depend_list = config["dependency_list"].split(",")
 
                         for depend in depend_list:
-                            self.log("info", "Checking that dependency '{0}' "
-                                             "is available in the VCS cluster"
-                                     .format(depend))
+                            self.logger.log("info", "Checking that dependency "
+                                            "'{0}' is available in the VCS "
+                                            "cluster", depend)
 
                             self.assertTrue(depend in item
                                             for item in resource)
 
-                    self.log("info", "Checking that clean timeout is "
-                                     "correct")
+                    self.logger.log("info", "Checking that clean timeout is "
+                                    "correct")
 
                     self.assertTrue("CleanTimeout" in hares_display)
                     self.assertEqual(
                         config["clean_timeout"],
                         hares_display["CleanTimeout"][0]["VALUE"])
 
-                    self.log("info", "Checking that fault on monitor "
-                                     "timeouts is correct")
+                    self.logger.log("info", "Checking that fault on monitor "
+                                    "timeouts is correct")
 
                     self.assertTrue("FaultOnMonitorTimeouts" in hares_display)
                     self.assertEqual(
@@ -462,8 +465,8 @@ class VCS(GenericTest):
                         hares_display["FaultOnMonitor"
                                       "Timeouts"][0]["VALUE"])
 
-                    self.log("info", "Checking that tolerance_limit is "
-                                     "correct")
+                    self.logger.log("info", "Checking that tolerance_limit is "
+                                    "correct")
 
                     self.assertTrue("ToleranceLimit" in hares_display)
                     self.assertEqual(
@@ -472,7 +475,7 @@ class VCS(GenericTest):
 
                     if "status_timeout" in config:
 
-                        self.log("info", "Checking correct timeout set")
+                        self.logger.log("info", "Checking correct timeout set")
 
                         self.assertTrue("MonitorTimeout" in hares_display)
                         self.assertEqual(
@@ -481,8 +484,8 @@ class VCS(GenericTest):
 
                     if "restart_limit" in config:
 
-                        self.log("info", "Checking that restart limit is "
-                                         "correct")
+                        self.logger.log("info", "Checking that restart limit "
+                                        "is correct")
 
                         self.assertTrue("RestartLimit" in hares_display)
                         self.assertEqual(
@@ -491,8 +494,8 @@ class VCS(GenericTest):
 
                     if "status_interval" in config:
 
-                        self.log("info", "Checking that status interval "
-                                         "is correct")
+                        self.logger.log("info", "Checking that status "
+                                        "interval is correct")
 
                         self.assertTrue("MonitorInterval" in hares_display)
                         self.assertEqual(
@@ -501,19 +504,20 @@ class VCS(GenericTest):
 
                     if "startup_retry_limit" in config:
 
-                        self.log("info", "Checking that "
-                                         "startup_retry_limit is correct")
+                        self.logger.log("info", "Checking that "
+                                        "startup_retry_limit is correct")
 
                         self.assertTrue("OnlineRetryLimit" in hares_display)
                         self.assertEqual(
                             config["startup_retry_limit"],
                             hares_display["OnlineRetryLimit"][0]["VALUE"])
 
-                    self.log("info", "'ha-service-config check complete")
+                    self.logger.log("info", "'ha-service-config check "
+                                    "complete")
 
-                    self.log("info", "Checking Online Timeout and Offline "
-                                     "Timeout properties from "
-                                     "vcs-cluster-service")
+                    self.logger.log("info", "Checking Online Timeout and "
+                                    "Offline Timeout properties from "
+                                    "vcs-cluster-service")
                     self.assertEqual(
                         cluster["vcs-clustered-service"]["online_timeout"],
                         hares_display["OnlineTimeout"][0]["VALUE"])
@@ -545,10 +549,10 @@ class VCS(GenericTest):
         for line in std_out:
             new_std_out = line.split()
 
-            self.log("info", "Checking the the number of vcs nodes in "
-                             "gabconfig '{0}' is equal to the number of "
-                             "vcs nodes in the model '{1}'"
-                     .format(len(new_std_out[-1]), len(vcs_nodes)))
+            self.logger.log("info", "Checking the the number of vcs nodes in "
+                            "gabconfig '{0}' is equal to the number of vcs "
+                            "nodes in the model '{1}'", len(new_std_out[-1]),
+                            len(vcs_nodes))
 
             self.assertEqual(len(vcs_nodes), len(new_std_out[-1]))
 
@@ -565,7 +569,7 @@ class VCS(GenericTest):
         self.assertNotEqual([], std_out)
 
         for node in vcs_nodes:
-            self.log("info", "Checking that {0} is running".format(node))
+            self.logger.log("info", "Checking that {0} is running", node)
             self.assertTrue(node in line for line in std_out)
 
     def _verify_vcs_network_host(self, interfaces, llt_nets, node,
@@ -608,9 +612,8 @@ class VCS(GenericTest):
 
                     dev_name = dev_name.replace(".", "_")
 
-                self.log("info", "Node: " + node +
-                                 ", network_name: " + network_name +
-                                 ", dev_name: " + dev_name)
+                self.logger.log("info", "Node: {0}, network_name: {1}, "
+                                "dev_name: {2}", node, network_name, dev_name)
 
                 sys = node_hostname
 
@@ -649,8 +652,8 @@ class VCS(GenericTest):
                 out_hosts = params[3].upper().split() \
                     if len(params) > 3 else "No value"
 
-                self.log("info", ", Node: " + node + ", out_hosts: " +
-                         str(out_hosts))
+                self.logger.log("info", ", Node: {0}, out_hosts: {1}", node,
+                                out_hosts)
 
                 if network_name in hosts_per_network:
 
@@ -673,8 +676,9 @@ class VCS(GenericTest):
             networks = []
 
             # Get list of networks under the cluster in the LITP model
-            network_ints = self.find_children_of_collect(self.ms_node, \
-                                        cluster_url, "network-interface")
+            network_ints = get_model_index(
+                self, self.ms_node).find_children_of_collect(
+                    cluster_url, "network-interface")
             for network_int in network_ints:
                 networks.append(self.get_props_from_url(
                     self.ms_node, network_int, filter_prop="network_name"))
@@ -697,8 +701,8 @@ class VCS(GenericTest):
                 # Finds corresponding network name
                 if vip_network in networks:
 
-                    self.log("info", "Vip {0} network found".format(
-                        vip["network_name"]))
+                    self.logger.log("info", "Vip {0} network found",
+                                    vip["network_name"])
                     vip_network_set = True
                     break
                 else:
@@ -740,7 +744,7 @@ class VCS(GenericTest):
         # After vcs services loop, check all dependencies found
         for dependency in test_dependencies_list:
 
-            self.log("info", "Checking all dependencies found")
+            self.logger.log("info", "Checking all dependencies found")
             node_name = dependency['node_name']
 
             # Find parent service group
@@ -774,15 +778,7 @@ class VCS(GenericTest):
         if 'lsb-runtime' not in cluster:
             return True
 
-        for runtime in cluster['lsb-runtime']:
-            for node in nodes:
-                self.log("info", "Checking is service '{0}' running on node: "
-                                 "'{1}'".format(runtime['service_name'], node))
-                cmd = self.rhc.get_service_running_cmd(runtime['service_name'])
-                out, err, rc = self.run_command(node, cmd, su_root=True)
-                self.assertEqual(0, rc)
-                self.assertEqual([], err)
-                self.assertNotEqual([], out)
+        self._verify_items_running(cluster['lsb-runtime'], nodes)
 
     def _verify_services_running(self, cluster, nodes):
         """
@@ -792,15 +788,21 @@ class VCS(GenericTest):
         if 'service' not in cluster:
             return True
 
-        for service in cluster['service']:
-            for node in nodes:
-                self.log("info", "Checking is service '{0}' running on node: "
-                                 "'{1}'".format(service['service_name'], node))
-                cmd = self.rhc.get_service_running_cmd(service['service_name'])
-                out, err, rc = self.run_command(node, cmd, su_root=True)
-                self.assertEqual(0, rc)
-                self.assertEqual([], err)
-                self.assertNotEqual([], out)
+        self._verify_items_running(cluster['service'], nodes)
+
+    def _verify_items_running(self, items, nodes):
+        """
+            Description:
+                Verify that the services of the given service or
+                lsb-runtime items are running on each node, collecting
+                the state of all of them with one call per node.
+        """
+        service_names = [item['service_name'] for item in items]
+        for node in nodes:
+            self.logger.log("info", "Checking are services '{0}' running on "
+                            "node: '{1}'", "', '".join(service_names), node)
+            states = self.service_states.collect(node, service_names)
+            self.service_states.assert_running(node, states, service_names)
 
     def _verify_default_nic_monitor(self, interfaces, llt_nets, node,
                                cluster_name, node_hostname, hosts_per_network,
@@ -817,11 +819,11 @@ class VCS(GenericTest):
             if "network_name" in props:
                 iterf[device_name] = props["network_name"]
 
-        self.log("info", "default_nic_monitor set to {0}!"\
-                    .format(cluster_props["default_nic_monitor"]))
+        self.logger.log("info", "default_nic_monitor set to {0}!",
+                        cluster_props["default_nic_monitor"])
         for dev in iterf:
             if iterf[dev] in llt_nets:
-                self.log("info", "Skipping llt net {0}".format(dev))
+                self.logger.log("info", "Skipping llt net {0}", dev)
                 continue
 
             res_name = self.vcs.generate_nic_resource_name(
@@ -834,7 +836,7 @@ class VCS(GenericTest):
                                       default_asserts=True, su_root=True)
 
             result = stdout[1].split(' ')[-1]
-            self.log("info", "Nic Mii Value {0}".format(result))
+            self.logger.log("info", "Nic Mii Value {0}", result)
 
             if "netstat" == cluster_props["default_nic_monitor"]:
                 # Mii value should always be 0 if netstat used.
@@ -845,11 +847,11 @@ class VCS(GenericTest):
                 # Mii value should be 1 if no NetworkHosts.
                 network = iterf[dev]
                 if network in hosts_per_network:
-                    self.log("info", "VCS NetworkHosts on Nic")
+                    self.logger.log("info", "VCS NetworkHosts on Nic")
                     expected = '0'
                     self.assertEqual(expected, result)
                 else:
-                    self.log("info", "No VCS NetworkHosts on Nic")
+                    self.logger.log("info", "No VCS NetworkHosts on Nic")
                     expected = '1'
                     self.assertEqual(expected, result)
 
@@ -888,8 +890,8 @@ class VCS(GenericTest):
                 self.get_props_from_url(self.ms_node, vcs_cluster_url)
 
             cluster_id = cluster_props["cluster_id"]
-            self.log("info", "Cluster id: " + cluster_id + ", Properties: " +
-                     str(cluster_props))
+            self.logger.log("info", "Cluster id: {0}, Properties: {1}",
+                            cluster_id, cluster_props)
 
             # b. Verify that cluster properties are set correct in the model
             self._check_cluster_properties(cluster_props)
@@ -909,15 +911,15 @@ class VCS(GenericTest):
                 vcs_nodes.append(filename)
 
             if vcs_nodes == []:
-                self.log("info", "No VCS nodes found")
+                self.logger.log("info", "No VCS nodes found")
 
             # e. Verify all VCS related files exist on all nodes in cluster
             for node in vcs_nodes:
 
                 for conf_f in self.files_paths:
 
-                    self.log("info", node + " Verifying " + conf_f +
-                             " on node")
+                    self.logger.log("info", "{0} Verifying {1} on node", node,
+                                    conf_f)
 
                     self.assertTrue(self.remote_path_exists(node,
                                                             conf_f),
@@ -925,20 +927,11 @@ class VCS(GenericTest):
                                     .format(conf_f, node))
 
                 # f. Verify the llt, gab, vcs services are running
-                cmds = []
-
-                for serv in ["llt", "gab", "vcs"]:
-
-                    cmds.append(self.rhc.get_service_running_cmd(serv))
-
-                    for cmd in cmds:
-
-                        self.log("info", node + " Verifying " + cmd)
-                        _, std_err, r_code = self.run_command(node,
-                                                              cmd,
-                                                              su_root=True)
-                        self.assertEqual(0, r_code)
-                        self.assertEqual([], std_err)
+                self.logger.log("info", "{0} Verifying llt, gab, vcs running",
+                                node)
+                states = self.service_states.collect(node,
+                                                     ["llt", "gab", "vcs"])
+                self.service_states.assert_running(node, states)
 
             # g. Verify cluster_id by reading /etc/llttab file.
             grep_cmd = self.rhc.get_grep_file_cmd("/etc/llttab",
@@ -946,8 +939,8 @@ class VCS(GenericTest):
 
             for node in vcs_nodes:
 
-                self.log("info", node + " Verifying cluster_id in {0}"
-                         .format("/etc/llttab"))
+                self.logger.log("info", "{0} Verifying cluster_id in "
+                                "/etc/llttab", node)
 
                 _, std_err, r_code = self.run_command(node,
                                                       grep_cmd, su_root=False)
@@ -962,8 +955,8 @@ class VCS(GenericTest):
 
             for node in vcs_nodes:
 
-                self.log("info", node + " Verify ClusterName {0}"
-                         .format(cluster_name))
+                self.logger.log("info", "{0} Verify ClusterName {1}", node,
+                                cluster_name)
 
                 std_out, std_err, r_code = self.run_command(node, haclus_cmd,
                                                             su_root=True)
@@ -975,7 +968,7 @@ class VCS(GenericTest):
             # i. Validate MAIN CF
             cmd = self.vcs.validate_main_cf_cmd()
 
-            self.log("info", vcs_nodes[0] + " validate_main_cf_cmd()")
+            self.logger.log("info", "{0} validate_main_cf_cmd()", vcs_nodes[0])
 
             std_out, std_err, r_code = self.run_command(vcs_nodes[0], cmd,
                                                         su_root=True)
@@ -993,8 +986,8 @@ class VCS(GenericTest):
                                                    vcs_cluster_url,
                                                    'llt_nets')).split(",")
 
-            self.log("info", "Cluster id: " + cluster_id + ", llt_nets: " +
-                     str(llt_nets))
+            self.logger.log("info", "Cluster id: {0}, llt_nets: {1}",
+                            cluster_id, llt_nets)
 
             # Find network hosts for each of the networks
             hosts_per_network = {}
@@ -1082,7 +1075,7 @@ class VCS(GenericTest):
             # 2. Get the url of the cluster that the clustered service is under
             vcs_cluster_url = "/".join(url_parts[:-2])
 
-            self.log("info", "Cluster URL : {0}".format(vcs_cluster_url))
+            self.logger.log("info", "Cluster URL : {0}", vcs_cluster_url)
 
             # 3. Take cluster name from vcs-cluster path
             cluster_id = url_parts[-3]
@@ -1102,8 +1095,8 @@ class VCS(GenericTest):
             service_group = self.vcs.generate_clustered_service_name(
                 service_id, cluster_id)
 
-            self.log("info", "Checking {0} Service Group State".format(
-                service_id))
+            self.logger.log("info", "Checking {0} Service Group State",
+                            service_id)
 
             # 6. Find all clust.service State value for all the cluster nodes
             gp_states = self.run_vcs_hagrp_display_command(node_name,
@@ -1123,8 +1116,8 @@ class VCS(GenericTest):
             self.assertTrue(standbys == int(service_props['standby']))
 
             # 8. Check that node_list values match service group output result
-            self.log("info", "Checking {0} Service Group Node list"
-                     .format(service_id))
+            self.logger.log("info", "Checking {0} Service Group Node list",
+                            service_id)
 
             gp_node_list = self.run_vcs_hagrp_display_command(
                 node_name, service_group, "AutoStartList")
@@ -1168,8 +1161,7 @@ class VCS(GenericTest):
                                                             cluster)
 
             # 13. Find service resource State values for all the cluster nodes
-            self.log("info", "Checking {0} Resource State"
-                     .format(service_id))
+            self.logger.log("info", "Checking {0} Resource State", service_id)
 
             resource = self.run_vcs_hagrp_resource_command(node_name,
                                                            service_group)
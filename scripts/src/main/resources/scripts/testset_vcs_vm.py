@@ -11,13 +11,19 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 from redhat_cmd_utils import RHCmdUtils
 from networking_utils import NetworkingUtils
 from vcs_utils import VCSUtils
 from storage_utils import StorageUtils
+from repo_probe_utils import RepoProbe, PROBE_URL
+from dhcp_utils import DhcpRangeIndex, DhcpUtils
+from facts_utils import FactsCollector
+from service_utils import ServiceStateCollector
+from deferred_log_utils import DeferredLogger
+from synthetic_deployment_utils import use_synthetic_deployment
 import test_constants
 import simplejson
-import re
 
 
 def populate_ip_map(ip_map, node_hst, ipversion, ip_addr_ver):
@@ -86,7 +92,8 @@ class VCSVM(GenericTest):
         """ Setup Variables for every test """
 
         super(VCSVM, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        use_synthetic_deployment(self)
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.clusters = self.model['clusters']
@@ -95,6 +102,13 @@ class VCSVM(GenericTest):
         self.net = NetworkingUtils()
         self.stor = StorageUtils()
         self.dhcp_ranges = None
+        self.dhcp_servers = None
+        self.dhcp_utils = DhcpUtils()
+        self.repo_probe = RepoProbe(self)
+        self.facts = FactsCollector(self)
+        self.facts.sweep()
+        self.service_states = ServiceStateCollector(self)
+        self.logger = DeferredLogger(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -185,9 +199,9 @@ class VCSVM(GenericTest):
                 service_groups.append(service_group)
                 service_group = {}
 
-        self.log("info", "Printing dict from get_vcs_vm_model_info()")
-        self._print_list(0, service_groups)
-        self.log("info", "Finished printing dict")
+        self.logger.log_structure("debug",
+                                  "Dict from get_vcs_vm_model_info()",
+                                  service_groups)
         return service_groups
 
     @staticmethod
@@ -257,8 +271,8 @@ class VCSVM(GenericTest):
         """
         Check the 'vcs-clustered-service' type for a service group.
         """
-        self.log('info', 'Check Service Group: "{0}" is listed for all '
-                 'nodes in node_list, on node: "{1}"'.format(lp_cs_nm, lp_nd))
+        self.logger.log('info', 'Check Service Group: "{0}" is listed for all '
+                        'nodes in node_list, on node: "{1}"', lp_cs_nm, lp_nd)
         nodes_listed = []
         for svg in hastat['SERVICE_GROUPS']:
             if svg['GROUP'] == v_cs_nm:
@@ -267,21 +281,20 @@ class VCSVM(GenericTest):
             self.assertTrue(sv_gp['nodes'][node] in nodes_listed)
 
         # Check online timeout
-        self.log('info', 'Check online_timeout for Service Group: "{0}" on'
-                 ' node: "{1}"'.format(lp_cs_nm, lp_nd))
+        self.logger.log('info', 'Check online_timeout for Service Group: '
+                        '"{0}" on node: "{1}"', lp_cs_nm, lp_nd)
         self.assertTrue(hares['OnlineTimeout'][0]['VALUE'] ==
                         lp_cs['online_timeout'])
 
         # Check offline timeout
-        self.log('info', 'Check offline_timeout for Service Group: "{0}" '
-                 'on node: "{1}"'.format(lp_cs_nm, lp_nd))
+        self.logger.log('info', 'Check offline_timeout for Service Group: '
+                        '"{0}" on node: "{1}"', lp_cs_nm, lp_nd)
         self.assertTrue(hares['OfflineTimeout'][0]['VALUE'] ==
                         lp_cs['offline_timeout'])
 
         # Check active standby
-        self.log('info',
-                 'Check active/standby for Service Group: "{0}" on '
-                 'node: "{1}"'.format(lp_cs_nm, lp_nd))
+        self.logger.log('info', 'Check active/standby for Service Group: '
+                        '"{0}" on node: "{1}"', lp_cs_nm, lp_nd)
         active = standby = 0
         sv_gp['node-state'] = {}
         for state in hagrp['State']:
@@ -300,12 +313,18 @@ class VCSVM(GenericTest):
         Check the 'vm-service' type for a service group.
         """
         # Check cleanup command
-        self.log('info',
-            'Check cleanup_command for Service: "{0}"'.\
-                format(sv_gp['vm-service']['service_name']))
+        self.logger.log('info', 'Check cleanup_command for Service: "{0}"',
+                        sv_gp['vm-service']['service_name'])
         self.assertEqual(hares['CleanProgram'][0]['VALUE'],
                          sv_gp['vm-service']['cleanup_command'])
 
+        # Collect the state of the service and tuned on every host node
+        # in one call per node
+        states = self.service_states.collect_many(dict(
+            (sv_gp['nodes'][node],
+             [sv_gp['vm-service']['service_name'], 'tuned'])
+            for node in sv_gp['nodes']))
+
         for node in sv_gp['nodes']:
 
             if not sv_gp['node-state'][sv_gp['nodes'][node]]:
@@ -316,10 +335,8 @@ class VCSVM(GenericTest):
                         sv_gp['vm-service']['status_command'], su_root=True)
                     self.assertNotEqual(0, rc)
                 else:
-                    _, _, rc = self.get_service_status(sv_gp['nodes'][node],
-                                sv_gp['vm-service']['service_name'],
-                                assert_running=False)
-                    self.assertNotEqual(0, rc)
+                    self.assertFalse(states[sv_gp['nodes'][node]][
+                        sv_gp['vm-service']['service_name']].running)
                 continue
 
             # Check Service is running
@@ -328,8 +345,9 @@ class VCSVM(GenericTest):
                     sv_gp['vm-service']['status_command'], su_root=True)
                 self.assertEqual(0, rc)
             else:
-                self.get_service_status(sv_gp['nodes'][node],
-                        sv_gp['vm-service']['service_name'])
+                self.service_states.assert_running(sv_gp['nodes'][node],
+                    states[sv_gp['nodes'][node]],
+                    [sv_gp['vm-service']['service_name']])
 
             # Get dominfo for service, from this check cpus, memory
             cmd = '/usr/bin/virsh dominfo {0}'.\
@@ -345,11 +363,10 @@ class VCSVM(GenericTest):
                 dominfo[line[0]] = line[1].strip(' ')
 
             # Check adaptor version
-            self.log('info',
-                     'Check adaptor version for Service Group: "{0}" on '
-                     'node: "{1}"'.\
-                     format(sv_gp['vcs-clustered-service']['name'],
-                     sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check adaptor version for Service Group: '
+                            '"{0}" on node: "{1}"',
+                            sv_gp['vcs-clustered-service']['name'],
+                            sv_gp['nodes'][node])
             cmd = self.rhc.check_pkg_installed(
                 ['ERIClitpmnlibvirt_CXP9031529-{0}'
                  .format(sv_gp['vm-service']['adaptor_version'])])
@@ -359,29 +376,26 @@ class VCSVM(GenericTest):
             self.assertNotEqual([], out)
 
             # Check cpus
-            self.log('info',
-                'Check number of cpus for Service: "{0}" on '
-                'node: "{1}"'.format(sv_gp['vcs-clustered-service']['name'],
-                 sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check number of cpus for Service: "{0}" '
+                            'on node: "{1}"',
+                            sv_gp['vcs-clustered-service']['name'],
+                            sv_gp['nodes'][node])
             self.assertEqual(sv_gp['vm-service']['cpus'], dominfo['CPU(s)'])
 
             # Check memory
-            self.log('info',
-                'Check memory for Service: "{0}" on '
-                'node: "{1}"'.format(sv_gp['vcs-clustered-service']['name'],
-                       sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check memory for Service: "{0}" on node: '
+                            '"{1}"', sv_gp['vcs-clustered-service']['name'],
+                            sv_gp['nodes'][node])
             dominfo['Max memory'] = dominfo['Max memory'].split(' ')[0]
             sv_gp['vm-service']['ram'] = sv_gp['vm-service']['ram'].strip('M')
             v_ram = str(int(dominfo['Max memory']) / 1024)
             self.assertEqual(sv_gp['vm-service']['ram'], v_ram)
 
             # Check the internal-status-check.
-            self.log('info',
-                     'Check internal_status_check for Service: "{0}" on '
-                     'VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                             vm_nodes[node],
-                             sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check internal_status_check for Service: '
+                            '"{0}" on VM node: "{1}", on Peer node: "{2}"',
+                            sv_gp['vm-service']['service_name'],
+                            vm_nodes[node], sv_gp['nodes'][node])
 
             cmd = self.rhc.get_cat_cmd('{0}/{1}/config.json'.format(
                 test_constants.LIBVIRT_INSTANCES_DIR,
@@ -399,12 +413,10 @@ class VCSVM(GenericTest):
                 self.assertEqual('off', status)
 
             # Check if vmmonitord is running.
-            self.log('info',
-                     'Check "vmmonitord" is running for Service: "{0}" on '
-                     'VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                             vm_nodes[node],
-                             sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check "vmmonitord" is running for '
+                            'Service: "{0}" on VM node: "{1}", on Peer node: '
+                            '"{2}"', sv_gp['vm-service']['service_name'],
+                            vm_nodes[node], sv_gp['nodes'][node])
             cmd = self.rhc.get_service_running_cmd('vmmonitord')
             out, err, rc = self.run_command_via_node(sv_gp['nodes'][node],
                                                      vm_nodes[node], cmd)
@@ -413,11 +425,10 @@ class VCSVM(GenericTest):
             self.assertEqual(0, rc)
 
             # Check if tuned is installed on host node
-            self.log('info',
-                     'Check "tuned" is installed for Service: "{0}" on '
-                     'Peer node: "{1}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                     sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check "tuned" is installed for Service: '
+                            '"{0}" on Peer node: "{1}"',
+                            sv_gp['vm-service']['service_name'],
+                            sv_gp['nodes'][node])
             cmd = self.rhc.check_pkg_installed(['tuned'])
             out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
             self.assertEqual([], err)
@@ -425,24 +436,18 @@ class VCSVM(GenericTest):
             self.assertEqual(0, rc)
 
             # Check if tuned is running
-            self.log('info',
-                     'Check "tuned" is running for Service: "{0}" on '
-                     ' on Peer node: "{1}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                             sv_gp['nodes'][node]))
-            cmd = self.rhc.get_service_running_cmd('tuned')
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
-            self.assertEqual([], err)
-            self.assertNotEqual([], out)
-            self.assertEqual(0, rc)
+            self.logger.log('info', 'Check "tuned" is running for Service: '
+                            '"{0}" on Peer node: "{1}"',
+                            sv_gp['vm-service']['service_name'],
+                            sv_gp['nodes'][node])
+            self.service_states.assert_running(sv_gp['nodes'][node],
+                states[sv_gp['nodes'][node]], ['tuned'])
 
             # Check if tuned package is active
-            self.log('info',
-                     'Check "tuned" package is active for Service: "{0}"'
-                     ' on VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                             vm_nodes[node],
-                             sv_gp['nodes'][node]))
+            self.logger.log('info', 'Check "tuned" package is active for '
+                            'Service: "{0}" on VM node: "{1}", on Peer node: '
+                            '"{2}"', sv_gp['vm-service']['service_name'],
+                            vm_nodes[node], sv_gp['nodes'][node])
             cmd = "/sbin/chkconfig --list tuned"
             out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
             active_out = 'tuned         0:off\t1:off\t2:off' \
@@ -459,8 +464,8 @@ class VCSVM(GenericTest):
             if not sv_gp['node-state'][sv_gp['nodes'][node]]:
                 continue
 
-            node_rh_ver = self.get_rhelver_used_on_node(vm_nodes[node],
-                                                        sv_gp['nodes'][node])
+            node_rh_ver = self.facts.get_node_facts(
+                vm_nodes[node], via_node=sv_gp['nodes'][node]).rhel_version
 
             cmd = self.net.get_ifconfig_cmd()
             out, err, rc = self.run_command_via_node(sv_gp['nodes'][node],
@@ -489,15 +494,11 @@ class VCSVM(GenericTest):
                     vm_nodes[node],
                     cmd)
 
-                self.log('info',
-                         'Checking eth: "{0}" UP for Service Group: '
-                         '"{1}" on VM node: "{2}", on Peer node: "{3}"'
-                         .format(vm_net["device_name"],
-                                 lp_cs['name'],
-                                 vm_nodes[node],
-                                 sv_gp['nodes'][node]
-                                 )
-                         )
+                self.logger.log('info', 'Checking eth: "{0}" UP for Service '
+                                'Group: "{1}" on VM node: "{2}", on Peer '
+                                'node: "{3}"', vm_net["device_name"],
+                                lp_cs['name'], vm_nodes[node],
+                                sv_gp['nodes'][node])
                 self.assertEqual(0, rc)
                 self.assertEqual([], err)
                 self.assertNotEqual([], out)
@@ -526,16 +527,12 @@ class VCSVM(GenericTest):
                         continue
 
                 if 'ipv4' in ip_map[node]:
-                    self.log('info', 'Checking ip address "{0}" on eth: '
-                             '"{1}" for Service Group: "{2}" on VM node: '
-                             '"{3}", on Peer node: "{4}"'
-                             .format(ip_map[node]['ipv4'],
-                                     vm_net["device_name"],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+                    self.logger.log('info', 'Checking ip address "{0}" on '
+                                    'eth: "{1}" for Service Group: "{2}" on '
+                                    'VM node: "{3}", on Peer node: "{4}"',
+                                    ip_map[node]['ipv4'],
+                                    vm_net["device_name"], lp_cs['name'],
+                                    vm_nodes[node], sv_gp['nodes'][node])
                     self.assertEqual(ip_map[node]['ipv4'],
                                      self.net.get_ipv4_from_dict(ifcfg_dict))
                     # PING IP AND MAKE SURE REACHABLE
@@ -544,16 +541,12 @@ class VCSVM(GenericTest):
                 if 'ipv6' in ip_map[node]:
                     if '/' not in ip_map[node]['ipv6']:
                         ip_map[node]['ipv6'] += '/64'
-                    self.log('info', 'Checking ipv6 address "{0}" on eth: '
-                             '"{1}" for Service Group: "{2}" on VM node: '
-                             '"{3}", on Peer node: "{4}"'
-                             .format(ip_map[node]['ipv6'],
-                                     vm_net["device_name"],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+                    self.logger.log('info', 'Checking ipv6 address "{0}" on '
+                                    'eth: "{1}" for Service Group: "{2}" on '
+                                    'VM node: "{3}", on Peer node: "{4}"',
+                                    ip_map[node]['ipv6'],
+                                    vm_net["device_name"], lp_cs['name'],
+                                    vm_nodes[node], sv_gp['nodes'][node])
                     cmd = "/sbin/ip -6 addr show {0} |"\
                                 " awk 'NR == 2 {{print}}'"\
                                 .format(vm_net["device_name"])
@@ -583,16 +576,11 @@ class VCSVM(GenericTest):
                                 out[0].split("=")[-1])
 
                 if 'gateway' in vm_net:
-                    self.log('info',
-                             'Checking eth: "{0}" gateway for Service '
-                             'Group: "{1}" on VM node: "{2}", on Peer '
-                             'node: "{3}"'
-                             .format(vm_net["device_name"],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+                    self.logger.log('info', 'Checking eth: "{0}" gateway for '
+                                    'Service Group: "{1}" on VM node: "{2}", '
+                                    'on Peer node: "{3}"',
+                                    vm_net["device_name"], lp_cs['name'],
+                                    vm_nodes[node], sv_gp['nodes'][node])
                     file_path = "{0}/ifcfg-{1}".format(
                         test_constants.NETWORK_SCRIPTS_DIR,
                         vm_net["device_name"])
@@ -613,16 +601,11 @@ class VCSVM(GenericTest):
                     self.assertTrue(vm_net['gateway'] in out[0])
 
                 if 'gateway6' in vm_net:
-                    self.log('info',
-                             'Checking eth: "{0}" gateway6 for Service '
-                             'Group: "{1}" on VM node: "{2}", on Peer '
-                             'node: "{3}"'
-                             .format(vm_net["device_name"],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+                    self.logger.log('info', 'Checking eth: "{0}" gateway6 for '
+                                    'Service Group: "{1}" on VM node: "{2}", '
+                                    'on Peer node: "{3}"',
+                                    vm_net["device_name"], lp_cs['name'],
+                                    vm_nodes[node], sv_gp['nodes'][node])
                     file_path = "{0}/ifcfg-{1}".format(
                         test_constants.NETWORK_SCRIPTS_DIR,
                         vm_net["device_name"])
@@ -682,15 +665,10 @@ class VCSVM(GenericTest):
             if sv_gp['node-state'][sv_gp['nodes'][node]]:
 
                 for repo in sv_gp['vm-yum-repo']:
-                    self.log('info',
-                             'Checking repo "{0}" for Service Group: '
-                             '"{1}" on VM node: "{2}", on Peer node: "{3}"'
-                             .format(repo['name'],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+                    self.logger.log('info', 'Checking repo "{0}" for Service '
+                                    'Group: "{1}" on VM node: "{2}", on Peer '
+                                    'node: "{3}"', repo['name'], lp_cs['name'],
+                                    vm_nodes[node], sv_gp['nodes'][node])
 
                     path = test_constants.YUM_CONFIG_FILES_DIR + '/' +\
                         repo['name'].lower() + '.repo'
@@ -723,14 +701,10 @@ class VCSVM(GenericTest):
                 self.assertEqual(0, rc)
                 self.assertEqual([], err)
 
-                self.log('info',
-                         'Checking alias names for Service Group: '
-                         '"{0}" on VM node: "{1}", on Peer node: "{2}"'
-                         .format(lp_cs['name'],
-                                 vm_nodes[node],
-                                 sv_gp['nodes'][node]
-                                 )
-                         )
+                self.logger.log('info', 'Checking alias names for Service '
+                                'Group: "{0}" on VM node: "{1}", on Peer '
+                                'node: "{2}"', lp_cs['name'], vm_nodes[node],
+                                sv_gp['nodes'][node])
                 for alias in sv_gp['vm-alias']:
                     # First check if the ip addres is in the list.
                     self.assertTrue(
@@ -754,9 +728,9 @@ class VCSVM(GenericTest):
             if 'vm-nfs-mount' not in sv_gp:
                 break
             if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking vm-nfs-mount for '
-                         'Service Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
+                self.logger.log('info', 'Checking vm-nfs-mount for Service '
+                                'Group: "{0}" on node: "{1}"', lp_cs['name'],
+                                sv_gp['nodes'][node])
                 fstab, stderr, return_code = \
                                 self.run_command_via_node(sv_gp['nodes'][node],
                                                             vm_nodes[node],
@@ -787,9 +761,9 @@ class VCSVM(GenericTest):
         grep_cmd = "/bin/hostname"
         for node in sv_gp['nodes']:
             if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking hostname for '
-                             'Service Group: "{0}" on node: "{1}"'
-                             .format(lp_cs['name'], sv_gp['nodes'][node]))
+                self.logger.log('info', 'Checking hostname for Service Group: '
+                                '"{0}" on node: "{1}"', lp_cs['name'],
+                                sv_gp['nodes'][node])
                 stdout, stderr, rcode =\
                             self.run_command_via_node(sv_gp['nodes'][node],
                                                     vm_nodes[node],
@@ -802,23 +776,12 @@ class VCSVM(GenericTest):
 
     def _get_abv_tz_on_node(self, node, via_node=None):
         """
-        Get the abbreviated timezone of a given node from the "date" command
+        Get the abbreviated timezone of a given node, e.g. "IST", from the
+        node's collected OS facts.
         """
-        cmd = "/bin/date"
-        if via_node != None:
-            out, err, r_code = self.run_command_via_node(via_node, node, cmd)
-        else:
-            out, err, r_code = self.run_command(node, cmd, su_root=True)
-        self.assertNotEqual([], out)
-        self.assertEqual([], err)
-        self.assertEqual(0, r_code)
-        # Example: "Thu Apr  9 15:48:53 IST 2015"
-        date_cmd_regex = \
-            r"^(?P<dow>\w+)\s(?P<month>\w+)\s+(?P<date>\d+)\s(?P<hour>\d+):"\
-            r"(?P<minute>\d+):(?P<second>\d+)\s(?P<abv_tz>\w+)\s(?P<year>\d+)$"
-        re_match = re.match(date_cmd_regex, out[0])
-        re_dict = re_match.groupdict()
-        return re_dict["abv_tz"]
+        node_facts = self.facts.get_node_facts(node, via_node=via_node)
+        self.assertNotEqual("", node_facts.abv_timezone)
+        return node_facts.abv_timezone
 
     def _check_vm_timezone(self, sv_gp, lp_cs, vm_nodes):
         """
@@ -829,9 +792,9 @@ class VCSVM(GenericTest):
         ms_avg_tz = self._get_abv_tz_on_node(self.ms_node)
         for node in sv_gp['nodes']:
             if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking timezone for '
-                         'Service Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
+                self.logger.log('info', 'Checking timezone for Service Group: '
+                                '"{0}" on node: "{1}"', lp_cs['name'],
+                                sv_gp['nodes'][node])
                 vm_tz = self.get_timezone_on_node(vm_nodes[node],
                                         via_node=sv_gp['nodes'][node])
                 vm_avg_tz = self._get_abv_tz_on_node(vm_nodes[node],
@@ -846,7 +809,7 @@ class VCSVM(GenericTest):
             dhcp network configuration
         """
         if dhcp_nic == None:
-            self.log("info", "No Device supplied, searching VM for it")
+            self.logger.log("info", "No Device supplied, searching VM for it")
             search_str = test_constants.NETWORK_SCRIPTS_DIR +\
                                 " -type f -name *ifcfg-eth* "
             find_cmd = self.rhc.get_find_files_in_dir_cmd(search_str,
@@ -858,8 +821,8 @@ class VCSVM(GenericTest):
             self.assertEqual([], stderr)
             self.assertEqual(0, returnc)
             dhcp_nic = stdout[0].rsplit('-', 1)[-1]
-        self.log("info", "Checking IP from NIC {0} is in DHCP Range"\
-                    .format(dhcp_nic))
+        self.logger.log("info", "Checking IP from NIC {0} is in DHCP Range",
+                        dhcp_nic)
         cmd = self.net.get_ifconfig_cmd(dhcp_nic, "-a")
         stdout, stderr, returnc = self.run_command_via_node(via_node,
                                                             node, cmd)
@@ -867,7 +830,8 @@ class VCSVM(GenericTest):
         self.assertEqual([], stderr)
         self.assertEqual(0, returnc)
         dhcp_int = self.net.get_ifcfg_dict(stdout, dhcp_nic,
-            os_ver=self.get_rhelver_used_on_node(node, via_node))
+            os_ver=self.facts.get_node_facts(
+                node, via_node=via_node).rhel_version)
         return dhcp_int
 
     def _check_vm_dhcp(self, vm_node, node, lp_cs_name, device_name):
@@ -875,24 +839,74 @@ class VCSVM(GenericTest):
         Description:
             For each vm dhcp network interface found in
             _check_vm_network_interface function, ensure its IP address
-            is in dhcp service IPs range.
+            is in dhcp service IPs range and leased by a DHCP server.
+        """
+        self.logger.log('info', 'Checking DHCP for Service Group: "{0}" on '
+                        'node: "{1}"', lp_cs_name, node)
+        vm_dhcp_props = self._get_vm_dhcp_details(vm_node,
+                node, device_name)
+        range_found = [service for service, ranges in
+                       self.dhcp_ranges.items()
+                       if ranges.find(vm_dhcp_props['IPV4']) is not None]
+        self.assertNotEqual([], range_found,
+                            "Assigned IP is not in the range")
+        self.assertTrue(self._is_leased(vm_dhcp_props['IPV4']),
+                        "Assigned IP {0} is not leased by any of the DHCP "
+                        "servers {1}".format(vm_dhcp_props['IPV4'],
+                                             self.dhcp_servers))
+
+    def _get_dhcp_servers(self):
+        """
+        Description:
+            Find the nodes running a modelled dhcp-service.
+        Returns:
+            list. Filenames of the DHCP server nodes.
+        """
+        return [node["name"] for node in self.all_nodes
+                if self.find(self.ms_node, node["url"], "dhcp-service",
+                             assert_not_empty=False)]
+
+    def _is_leased(self, address):
+        """
+        Description:
+            Check an address holds an active lease on a DHCP server. The
+            config and lease files of each server are read once per run,
+            and read again only if the address is not found, e.g. for a
+            VM started or moved since.
+        Args:
+            address (str): Address assigned to a VM.
+        Returns:
+            bool. True if a server leases the address.
+        """
+        for refresh in (False, True):
+            for server in self.dhcp_servers:
+                lease = self.dhcp_utils.get_dhcp_facts(
+                    self, server, refresh=refresh).get_lease(address)
+                if lease is not None and \
+                        lease.get('state', 'active') == 'active':
+                    return True
+        return False
+
+    def _get_dhcp_range_index(self):
+        """
+        Description:
+            Build an interval index of the modelled dhcp-range items of
+            each DHCP service, so VM addresses are checked with a single
+            lookup per service. Ranges of different services may overlap.
+        Returns:
+            dict. DHCP service path -> DhcpRangeIndex of its ranges.
         """
-        self.log('info', 'Checking DHCP for '
-                     'Service Group: "{0}" on node: "{1}"'
-                     .format(lp_cs_name, node))
-        range_found = False
-        for dhcp_range in self.dhcp_ranges:
+        dhcp_ranges = {}
+        for dhcp_range in self.find(self.ms_node, '/software/services',
+                                    'dhcp-range', assert_not_empty=False):
             dhcp_range_props = self.get_props_from_url(self.ms_node,
                                                        dhcp_range)
-            range_start = dhcp_range_props['start']
-            range_end = dhcp_range_props['end']
-            vm_dhcp_props = self._get_vm_dhcp_details(vm_node,
-                    node, device_name)
-            if self.net.is_ip_in_range(vm_dhcp_props['IPV4'],
-                                        range_start, range_end):
-                range_found = True
-                break
-        self.assertTrue(range_found, "Assigned IP is not in the range")
+            # e.g. /software/services/dhcp1/subnets/s1/ranges/r1
+            service = "/".join(dhcp_range.split("/")[:4])
+            dhcp_ranges.setdefault(service, DhcpRangeIndex()).add(
+                dhcp_range_props['start'], dhcp_range_props['end'],
+                dhcp_range)
+        return dhcp_ranges
 
     @staticmethod
     def _get_vm_ip_map(service_groups, ip_map, act_hst,
@@ -994,9 +1008,9 @@ class VCSVM(GenericTest):
             ##
             #service_groups[sv_gp["nodes_hostnames"]]
             for node in ip_map:
-                self.log("info", "VMHOSTCONNSET: {0} IPV4: {1} IPV6: {2}"\
-                        .format(ip_map[node]['hostname'],
-                        ip_map[node]['ipv4'], ip_map[node]['ipv6'], node))
+                self.logger.log("info", "VMHOSTCONNSET: {0} IPV4: {1} IPV6: "
+                                "{2}", ip_map[node]['hostname'],
+                                ip_map[node]['ipv4'], ip_map[node]['ipv6'])
                 self.add_vm_to_nodelist(
                     ip_map[node]['hostname'],
                     ip_map[node]['ipv4'],
@@ -1004,7 +1018,8 @@ class VCSVM(GenericTest):
                     test_constants.LIBVIRT_VM_PASSWORD,
                     ipv6=ip_map[node]['ipv6']
                 )
-        self._print_list(0, service_groups)
+        self.logger.log_structure("debug", "Service groups with IP map",
+                                  service_groups)
 
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc01')
     def test_01_p_verify_vm_vcs_clustered_service(self):
@@ -1043,8 +1058,8 @@ class VCSVM(GenericTest):
 
         # 2: Gather connection details for vm_nodes.
         self._add_vm_nodes_connection_details(service_groups)
-        self.dhcp_ranges = self.find(self.ms_node, '/software/services',
-                                    'dhcp-range', assert_not_empty=False)
+        self.dhcp_ranges = self._get_dhcp_range_index()
+        self.dhcp_servers = self._get_dhcp_servers()
 
         # 3. For each vm service group:
         for sv_gp in service_groups:
@@ -1110,13 +1125,20 @@ class VCSVM(GenericTest):
             # get locations on nodes for image
             vm_image_nd = test_constants.LIBVIRT_IMAGE_DIR + "/" \
                     + image['source_uri'].split("/")[-1]
+            # probe source_uri from all nodes of the group in one batch
+            image_probes = [(sv_gp['nodes'][node], PROBE_URL,
+                             image['source_uri'])
+                            for node in sv_gp['nodes']]
+            reachable = self.repo_probe.probe(image_probes)
             for node in sv_gp['nodes']:
-                self.log('info', 'Checking vm-image source_uri for Service '
-                         'Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
+                self.logger.log('info', 'Checking vm-image source_uri for '
+                                'Service Group: "{0}" on node: "{1}"',
+                                lp_cs['name'], sv_gp['nodes'][node])
                 self.assertTrue(
-                            self.check_repo_url_exists(sv_gp['nodes'][node],
-                            image['source_uri']))
+                    reachable[(sv_gp['nodes'][node], PROBE_URL,
+                               image['source_uri'])],
+                    "URL {0} not reachable from {1}.".format(
+                        image['source_uri'], sv_gp['nodes'][node]))
                 # get md5sum on node for image
                 outp, err, rc = self.run_command(sv_gp['nodes'][node],
                     "/usr/bin/md5sum {0}".format(vm_image_nd))
@@ -11,6 +11,7 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 import test_constants
 
 
@@ -28,7 +29,7 @@ class Volmgr(GenericTest):
 
         super(Volmgr, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
 
         self.all_clusters = self.model["clusters"]
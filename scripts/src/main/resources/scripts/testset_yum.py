@@ -11,7 +11,9 @@ program(s) have been supplied.
 """
 
 from litp_generic_test import GenericTest, attr
+from fixture_utils import get_model
 from redhat_cmd_utils import RHCmdUtils
+from repo_probe_utils import RepoProbe, PROBE_DIR, PROBE_REPO
 
 
 class Yum(GenericTest):
@@ -26,11 +28,12 @@ class Yum(GenericTest):
 
         super(Yum, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
+        self.model = get_model(self)
         self.ms_node = self.model["ms"][0]["name"]
         self.all_nodes = self.model["nodes"][:]
         self.all_nodes.extend(self.model["ms"][:])
         self.redhatutils = RHCmdUtils()
+        self.repo_probe = RepoProbe(self)
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -40,7 +43,9 @@ class Yum(GenericTest):
     def _yum_base_url(self, node_name, yum_base_url):
         """
         Description:
-            Ensure path specified by base_url exists and is reachable from node
+            Return the probe which ensures the path specified by base_url
+            exists and is reachable from node. Probes are collected and run
+            in one batch by _verify_repo_probes.
 
         Args:
             node_name (str): The node being tested.
@@ -49,23 +54,37 @@ class Yum(GenericTest):
         Actions:
             a. If base_url is a local path, ensure path exists on node.
             b. If url is a path on MS or other external path, ensure
-                path exists and is reachable from node.
+                repository metadata exists and is reachable from node.
+
+        Returns:
+            tuple. The (node, kind, target) probe and its failure message.
         """
         # a. If url is a local path, ensure path exists on node
         if "file://" in yum_base_url:
             path_on_node = yum_base_url.split("file://")[1]
-            self.assertTrue(self.remote_path_exists(node_name,
-                path_on_node, expect_file=False),
+            return ((node_name, PROBE_DIR, path_on_node),
                     "{0} does not exist on {1}.".format(
                         path_on_node, node_name))
 
         # b. If url is a path on MS or other external path, ensure
         #       path exists and is reachable from node
-        else:
-            self.assertTrue(self.check_repo_url_exists(node_name,
-                yum_base_url + "/"), "URL {0} not reachable from {1}.".format(
+        return ((node_name, PROBE_REPO, yum_base_url),
+                "URL {0} not reachable from {1}.".format(
                     yum_base_url, node_name))
 
+    def _verify_repo_probes(self, probes):
+        """
+        Description:
+            Run all collected repository probes in one batch and assert
+            that every target is reachable.
+
+        Args:
+            probes (list): (probe, message) tuples.
+        """
+        results = self.repo_probe.probe([probe for probe, _ in probes])
+        for probe, msg in probes:
+            self.assertTrue(results[probe], msg)
+
     @attr('all', 'revert', 'system_check', 'yum', 'yum_tc01')
     def test_01_p_yum(self):
         """
@@ -110,7 +129,11 @@ class Yum(GenericTest):
                 If ms_url_path is defined:
                 i. Ensure path exists on MS
 
+            4. Probe all collected base_url and ms_url_path locations
+                    concurrently, one remote call per node
+
         """
+        repo_probes = []
 
         for node in self.all_nodes:
             node_name = node["name"]
@@ -221,18 +244,20 @@ class Yum(GenericTest):
                     # If base_url is defined:
                     if 'base_url' in entry:
                         # 3h. Ensure path specified by base_url exists
-                        self._yum_base_url(node_name,
-                                           entry['base_url'])
+                        repo_probes.append(self._yum_base_url(
+                            node_name, entry['base_url']))
 
                     # If ms_url_path is defined:
                     elif 'ms_url_path' in entry:
                         # 3i. Ensure path exists on MS
                         yum_ms_url = entry['ms_url_path']
                         pkg_path_on_ms = "/var/www/html" + yum_ms_url
-                        self.assertTrue(self.remote_path_exists(
-                            self.ms_node,
-                            pkg_path_on_ms, expect_file=False),
-                                "'ms_url_path' {0} modelled in {1} on {2} "
-                                "does not exist on MS.".format(
-                                    pkg_path_on_ms, entry['name'],
-                                    node_name))
+                        repo_probes.append((
+                            (self.ms_node, PROBE_DIR, pkg_path_on_ms),
+                            "'ms_url_path' {0} modelled in {1} on {2} "
+                            "does not exist on MS.".format(
+                                pkg_path_on_ms, entry['name'], node_name)))
+
+        # 4. Probe all collected base_url and ms_url_path locations
+        #       concurrently, one remote call per node
+        self._verify_repo_probes(repo_probes)
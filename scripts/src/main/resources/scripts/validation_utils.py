@@ -0,0 +1,269 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+from shell_utils import quote, split_sections
+
+LITP_CMD = "/usr/bin/litp"
+CASE_MARKER = "==>CASE:"
+CASE_RESULT = "CASE_RESULT"
+XARGS_CMD = "/usr/bin/xargs"
+
+
+class ValidationCase(object):
+    """
+    One row of a validation matrix: creating an item with an invalid
+    property value must fail with the expected error.
+    """
+
+    def __init__(self, item_type, prop, value, expected_error,
+                 base_props=None):
+        """
+        Args:
+            item_type (str): Item type to create, e.g. 'test-config'.
+
+            prop (str): Property given the invalid value.
+
+            value (str): The invalid value.
+
+            expected_error (str): Text the CLI error output must contain,
+                                  e.g. 'PropertyNotAllowedError'.
+
+        Kwargs:
+            base_props (dict): Valid values of the other properties, e.g.
+                               the mandatory ones.
+        """
+        self.item_type = item_type
+        self.prop = prop
+        self.value = value
+        self.expected_error = expected_error
+        self.base_props = base_props or {}
+
+    def get_props(self):
+        """ Return all properties the item is created with. """
+        props = dict(self.base_props)
+        props[self.prop] = self.value
+        return props
+
+    def __repr__(self):
+        return "{0} {1}={2!r} -> {3}".format(self.item_type, self.prop,
+                                              self.value, self.expected_error)
+
+
+class ValidationResult(object):
+    """
+    Outcome of a ValidationCase.
+    """
+
+    def __init__(self, case, rc, output, created):
+        """
+        Args:
+            case (ValidationCase): The case run.
+
+            rc (int): Return code of 'litp create'.
+
+            output (list): Output lines of 'litp create'.
+
+            created (bool): Whether the item was found in the model after.
+        """
+        self.case = case
+        self.rc = rc
+        self.output = output
+        self.created = created
+
+    @property
+    def passed(self):
+        """ True if the create failed with the expected error only. """
+        return self.rc != 0 and not self.created and \
+            any(self.case.expected_error in line for line in self.output)
+
+    def __repr__(self):
+        return "{0}: {1} (rc {2}, created {3}, output {4})".format(
+            self.case, "PASS" if self.passed else "FAIL", self.rc,
+            self.created, self.output)
+
+
+class ValidationMatrix(object):
+    """
+    Runs a table of ValidationCases against litpd on the MS. Cases are
+    split into chunks run as one remote script each, the script running
+    a bounded number of the chunk's cases at a time.
+    """
+
+    def __init__(self, collection_url="/software/items",
+                 id_prefix="validation"):
+        """
+        Kwargs:
+            collection_url (str): Collection the items are created in.
+
+            id_prefix (str): Prefix of the item ids, each case using its
+                             own item.
+        """
+        self.collection_url = collection_url.rstrip("/")
+        self.id_prefix = id_prefix
+        self.cases = []
+
+    def add(self, item_type, prop, value, expected_error, base_props=None):
+        """ Add a case to the matrix, see ValidationCase. """
+        self.cases.append(ValidationCase(item_type, prop, value,
+                                         expected_error, base_props))
+
+    def add_invalid_props(self, item_type, invalid_props, expected_error,
+                          base_props=None):
+        """
+        Add one case per property of invalid_props.
+
+        Args:
+            item_type (str): Item type to create.
+
+            invalid_props (dict): Property -> invalid value.
+
+            expected_error (str): Error text expected, formatted with the
+                                  property name as {prop}.
+
+        Kwargs:
+            base_props (dict): Valid values of the other properties.
+        """
+        for prop in sorted(invalid_props):
+            base = dict((key, value) for key, value in
+                        (base_props or {}).items() if key != prop)
+            self.add(item_type, prop, invalid_props[prop],
+                     expected_error.format(prop=prop), base)
+
+    def get_item_url(self, index):
+        """ Return the path of the item used by case index. """
+        return "{0}/{1}_{2}".format(self.collection_url, self.id_prefix,
+                                    index)
+
+    def get_case_cmd(self, index):
+        """
+        Return the commands of case index. The case prints a marker line,
+        the create output, then a line
+        "CASE_RESULT <index> <create rc> <show rc>". An item created by
+        mistake is removed again.
+        """
+        case = self.cases[index]
+        url = self.get_item_url(index)
+        props = " ".join("{0}={1}".format(key, quote(value))
+                         for key, value in sorted(case.get_props().items()))
+        return ("echo \"{marker}{index}\"; "
+                "{litp} create -t {type} -p {url} -o {props} 2>&1; "
+                "rc=$?; {litp} show -p {url} >/dev/null 2>&1; show=$?; "
+                "[ $show -eq 0 ] && {litp} remove -p {url} >/dev/null 2>&1; "
+                "echo \"{result} {index} $rc $show\"".format(
+                    marker=CASE_MARKER, index=index, litp=LITP_CMD,
+                    type=case.item_type, url=url, props=props,
+                    result=CASE_RESULT))
+
+    def get_chunk_cmd(self, indexes, parallel=1):
+        """
+        Return one script running the cases of the given indexes, at most
+        parallel of them at a time through xargs -P. Each case writes its
+        output to its own file, the files being printed once all cases
+        are done so the output of the cases is not interleaved.
+
+        Args:
+            indexes (list): Indexes of the cases to run.
+
+        Kwargs:
+            parallel (int): Most cases running at a time.
+        """
+        cases = " ".join(
+            quote("{{ {0}; }} >\"$CASE_DIR/{1}\" 2>&1".format(
+                self.get_case_cmd(index), index))
+            for index in indexes)
+        return ("CASE_DIR=$(/bin/mktemp -d) && export CASE_DIR && "
+                "printf '%s\\0' {cases} | "
+                "{xargs} -0 -n 1 -P {parallel} /bin/sh -c; "
+                "/bin/cat \"$CASE_DIR\"/*; /bin/rm -rf \"$CASE_DIR\"".format(
+                    cases=cases, xargs=XARGS_CMD, parallel=max(1, parallel)))
+
+    def parse_chunk_output(self, stdout):
+        """
+        Parse the output of get_chunk_cmd.
+
+        Returns:
+            dict. Case index -> ValidationResult.
+        """
+        results = {}
+        for lines in split_sections(stdout, CASE_MARKER).values():
+            output = []
+            for line in lines:
+                if line.startswith(CASE_RESULT + " "):
+                    _, index, rc, show_rc = line.split()
+                    index = int(index)
+                    results[index] = ValidationResult(
+                        self.cases[index], int(rc), output, show_rc == "0")
+                else:
+                    output.append(line)
+        return results
+
+    def _run_chunk(self, test, ms_node, indexes, parallel):
+        """ Run a chunk of cases on the MS. """
+        stdout, _, _ = test.run_command(
+            ms_node, self.get_chunk_cmd(indexes, parallel=parallel))
+        return self.parse_chunk_output(stdout)
+
+    def run(self, test, ms_node, chunk_size=100, parallel=4):
+        """
+        Run every case of the matrix. The chunks are run one after the
+        other, as they all go through the one connection to the MS, and
+        the cases of a chunk run concurrently on the MS.
+
+        Args:
+            test (GenericTest): Test used to run the remote commands.
+
+            ms_node (str): The MS.
+
+        Kwargs:
+            chunk_size (int): Most cases run by one remote script.
+
+            parallel (int): Most cases of a chunk running at a time.
+
+        Returns:
+            list. ValidationResult of each case, in case order.
+        """
+        indexes = list(range(len(self.cases)))
+        chunks = [indexes[start:start + chunk_size]
+                  for start in range(0, len(indexes), chunk_size)]
+        results = {}
+        for chunk in chunks:
+            results.update(self._run_chunk(test, ms_node, chunk, parallel))
+        # A case with no result line did not run, e.g. a lost connection.
+        return [results.get(index, ValidationResult(case, None, [], False))
+                for index, case in enumerate(self.cases)]
+
+    @staticmethod
+    def get_coverage(results):
+        """
+        Summarise results per item type and property.
+
+        Returns:
+            dict. (item type, property) -> [passed count, case count].
+        """
+        coverage = {}
+        for result in results:
+            key = (result.case.item_type, result.case.prop)
+            counts = coverage.setdefault(key, [0, 0])
+            counts[1] += 1
+            if result.passed:
+                counts[0] += 1
+        return coverage
+
+    def get_coverage_report(self, results):
+        """ Return the coverage matrix as lines of a text table. """
+        lines = ["{0:<30} {1:<20} {2:>6} {3:>6}".format(
+            "item type", "property", "passed", "cases")]
+        coverage = self.get_coverage(results)
+        for item_type, prop in sorted(coverage):
+            passed, total = coverage[(item_type, prop)]
+            lines.append("{0:<30} {1:<20} {2:>6} {3:>6}".format(
+                item_type, prop, passed, total))
+        return lines
@@ -0,0 +1,270 @@
+"""
+COPYRIGHT Ericsson 2019
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+"""
+
+import ctypes
+import os
+import sys
+import threading
+import time
+import traceback
+
+# Environment variable enabling the watchdog for every test using one,
+# with budgets in seconds, e.g. "test=14400,run_command=1800".
+WATCHDOG_ENV = "TAF_WATCHDOG"
+
+# Seconds a whole test may run.
+TEST_BUDGET = "test"
+# GenericTest method -> seconds a single call may run.
+DEFAULT_BUDGETS = {
+    TEST_BUDGET: 6 * 3600,
+    "run_command": 3600,
+    "run_command_via_node": 3600,
+    "copy_file_to": 1800,
+    "wait_for_plan_state": 3 * 3600,
+    "run_and_check_plan": 3 * 3600,
+}
+# Plan waits taking a timeout_mins argument, with its position, whose
+# budget is that timeout plus PLAN_WAIT_GRACE_SECS when given.
+PLAN_WAIT_METHODS = {"wait_for_plan_state": 2, "run_and_check_plan": 2}
+PLAN_WAIT_GRACE_SECS = 600
+
+# Seconds between checks, and between repeated aborts of a call still
+# running over its budget.
+POLL_SECS = 1.0
+REPEAT_ABORT_SECS = 60
+
+
+class WatchdogTimeout(BaseException):
+    """
+    Raised in a test whose call or whole run went over its budget. It is
+    not an Exception, so the 'except Exception' retry loops of the
+    testsets do not swallow it.
+    """
+    pass
+
+
+def format_stacks():
+    """ Return the current Python stack of every thread as text. """
+    names = dict((thread.ident, thread.name)
+                 for thread in threading.enumerate())
+    lines = []
+    for ident, frame in sorted(sys._current_frames().items()):
+        lines.append("Thread {0} ({1}):".format(names.get(ident, "?"),
+                                                ident))
+        lines.extend(line.rstrip("\n")
+                     for line in traceback.format_stack(frame))
+    return "\n".join(lines)
+
+
+def _raise_in_thread(ident, exc_class):
+    """
+    Raise exc_class in the thread ident the next time it runs Python code.
+    """
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_long(ident), ctypes.py_object(exc_class))
+
+
+class _Call(object):
+    """ A watched call in flight. """
+
+    def __init__(self, name, args, budget):
+        self.name = name
+        self.args = args
+        self.budget = budget
+        self.ident = threading.current_thread().ident
+        self.started = time.time()
+        self.aborted = None
+        self.done = False
+
+    def describe(self):
+        """ Return the call and how long it has run. """
+        return "{0}({1}) running for {2:.0f}s of a {3}s budget".format(
+            self.name, ", ".join(repr(arg) for arg in self.args),
+            time.time() - self.started, self.budget)
+
+
+class Watchdog(object):
+    """
+    Enforces time budgets on the calls of a test which reach the
+    deployment and on the whole test. A call or test over its budget has
+    the stacks of all threads and the calls in flight logged, and
+    WatchdogTimeout raised in it, so only that test fails and the run
+    goes on with the next one. The exception is raised as soon as the
+    thread runs Python code again, which a plan wait does between polls;
+    it is raised again every REPEAT_ABORT_SECS while a call is still over
+    its budget.
+    """
+
+    def __init__(self, test, budgets=None):
+        """
+        Args:
+            test (GenericTest): Test whose calls are watched.
+
+        Kwargs:
+            budgets (dict): Budgets overriding DEFAULT_BUDGETS.
+        """
+        self.test = test
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.test_ident = threading.current_thread().ident
+        self.started = time.time()
+        self.test_aborted = None
+        self._lock = threading.Lock()
+        self._calls = []
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    @staticmethod
+    def parse_budgets(spec):
+        """
+        Parse a budget string, e.g. "test=14400,run_command=1800".
+
+        Returns:
+            dict. Name -> seconds.
+        """
+        budgets = {}
+        for entry in spec.split(","):
+            if "=" in entry:
+                name, seconds = entry.split("=", 1)
+                budgets[name.strip()] = float(seconds)
+        return budgets
+
+    def get_call_budget(self, name, args, kwargs):
+        """ Return the budget of a call in seconds. """
+        if name in PLAN_WAIT_METHODS:
+            position = PLAN_WAIT_METHODS[name]
+            timeout_mins = kwargs.get("timeout_mins",
+                                      args[position]
+                                      if len(args) > position else None)
+            if timeout_mins:
+                return timeout_mins * 60 + PLAN_WAIT_GRACE_SECS
+        return self.budgets[name]
+
+    def wrap(self, name, method):
+        """ Return method timed against its budget. """
+        def watched(*args, **kwargs):
+            call = _Call(name, args, self.get_call_budget(name, args,
+                                                          kwargs))
+            with self._lock:
+                self._calls.append(call)
+            try:
+                return method(*args, **kwargs)
+            except WatchdogTimeout as error:
+                if error.args:
+                    # Already described by a nested watched call.
+                    raise
+                raise WatchdogTimeout("{0} exceeded its budget: {1}".format(
+                    self.test.id(),
+                    call.aborted[0] if call.aborted else self.test_aborted))
+            finally:
+                self._finish(call)
+        return watched
+
+    def _finish(self, call):
+        """
+        Stop watching a call. An abort landing meanwhile is raised again
+        once the call is removed, so the call is never left watched.
+        """
+        aborted = None
+        while True:
+            try:
+                with self._lock:
+                    call.done = True
+                    if call in self._calls:
+                        self._calls.remove(call)
+                break
+            except WatchdogTimeout as error:
+                aborted = error
+        if aborted is not None:
+            raise aborted
+
+    def start(self):
+        """ Start checking budgets. """
+        self._thread.start()
+
+    def stop(self):
+        """ Stop checking budgets. """
+        self._stopped.set()
+        self._thread.join()
+
+    def _abort(self, ident, reason, call=None, now=None):
+        """
+        Abort a thread and log the stacks and calls in flight. A call is
+        only aborted while it is still in progress.
+        """
+        with self._lock:
+            if call is not None:
+                if call.done:
+                    return
+                call.aborted = (reason, now)
+            in_flight = [running.describe() for running in self._calls]
+            stacks = format_stacks()
+            _raise_in_thread(ident, WatchdogTimeout)
+        self.test.log("error", "Watchdog: {0}: {1}\nCalls in flight:\n"
+                      "{2}\n{3}".format(self.test.id(), reason,
+                                        "\n".join(in_flight) or "none",
+                                        stacks))
+
+    def _check(self, now):
+        """ Abort the calls and test over their budgets. """
+        with self._lock:
+            expired = [call for call in self._calls
+                       if not call.done and
+                       now - call.started > call.budget and
+                       (call.aborted is None or
+                        now - call.aborted[1] > REPEAT_ABORT_SECS)]
+        for call in expired:
+            self._abort(call.ident, call.describe(), call, now)
+        # The test itself is aborted once, so its cleanups still run.
+        if self.test_aborted is None and \
+                now - self.started > self.budgets[TEST_BUDGET]:
+            self.test_aborted = "test ran for more than {0}s".format(
+                self.budgets[TEST_BUDGET])
+            self._abort(self.test_ident, self.test_aborted)
+
+    def _run(self):
+        """ Check budgets until stopped. """
+        while not self._stopped.wait(POLL_SECS):
+            try:
+                self._check(time.time())
+            except Exception as error:  # pylint: disable=broad-except
+                sys.stderr.write("Watchdog check failed: {0}\n".format(
+                    error))
+
+
+def use_watchdog(test, spec=None):
+    """
+    Enforce time budgets on the deployment calls and the run of a test.
+    Does nothing unless a spec is given or set in the TAF_WATCHDOG
+    environment variable. Call it in setUp right after the super class
+    setUp.
+
+    Args:
+        test (GenericTest): Test to watch.
+
+    Kwargs:
+        spec (str): Budgets overriding the defaults, e.g. "test=14400",
+                    or "on" for the defaults.
+
+    Returns:
+        Watchdog. The watchdog in use, None if not enabled.
+    """
+    spec = spec or os.environ.get(WATCHDOG_ENV)
+    if not spec:
+        return None
+    watchdog = Watchdog(test, Watchdog.parse_budgets(spec))
+    for name in watchdog.budgets:
+        if name != TEST_BUDGET and hasattr(test, name):
+            setattr(test, name, watchdog.wrap(name, getattr(test, name)))
+    watchdog.start()
+    test.addCleanup(watchdog.stop)
+    return watchdog